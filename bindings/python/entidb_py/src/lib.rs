@@ -3,19 +3,45 @@
 //! This crate provides Python bindings using PyO3.
 
 #[cfg(feature = "encryption")]
-use entidb_core::crypto::{CryptoManager as CoreCryptoManager, EncryptionKey};
+use entidb_core::crypto::{
+    decrypted_len, encrypted_len, CryptoManager as CoreCryptoManager, EncryptionKey, ALGORITHM,
+};
 use entidb_core::{CollectionId, Config, Database as CoreDatabase, EntityId as CoreEntityId};
-use pyo3::exceptions::{PyIOError, PyRuntimeError, PyStopIteration, PyValueError};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyIOError, PyRuntimeError, PyStopIteration, PyValueError};
+use pyo3::ffi;
+#[cfg(feature = "encryption")]
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::pyclass::CompareOp;
+use pyo3::types::{PyBool, PyBytes, PyDict, PyString};
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::os::raw::{c_int, c_void};
 use std::path::Path;
-use std::sync::Arc;
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
 
 /// Library version.
 const VERSION: &str = env!("CARGO_PKG_VERSION");
 
+/// Two lowercase hex digits for every byte value, so `to_hex` does one
+/// table lookup per byte instead of two nibble lookups.
+static HEX_PAIRS: [[u8; 2]; 256] = {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+    let mut table = [[0u8; 2]; 256];
+    let mut i = 0;
+    while i < 256 {
+        table[i] = [HEX[i >> 4], HEX[i & 0x0f]];
+        i += 1;
+    }
+    table
+};
+
 /// Entity ID - a 16-byte unique identifier.
-#[pyclass]
+///
+/// Supports the buffer protocol, so `bytes(entity_id)` and
+/// `memoryview(entity_id)` read the 16 bytes in place.
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct EntityId {
     inner: CoreEntityId,
@@ -34,14 +60,9 @@ impl EntityId {
     /// Creates an entity ID from bytes.
     #[staticmethod]
     fn from_bytes(bytes: &[u8]) -> PyResult<Self> {
-        if bytes.len() != 16 {
-            return Err(PyValueError::new_err("EntityId must be exactly 16 bytes"));
-        }
-        let mut arr = [0u8; 16];
-        arr.copy_from_slice(bytes);
-        Ok(Self {
-            inner: CoreEntityId::from_bytes(arr),
-        })
+        CoreEntityId::from_slice(bytes)
+            .map(|inner| Self { inner })
+            .ok_or_else(|| PyValueError::new_err("EntityId must be exactly 16 bytes"))
     }
 
     /// Returns the bytes of this entity ID.
@@ -51,33 +72,105 @@ impl EntityId {
 
     /// Returns a hex string representation.
     fn to_hex(&self) -> String {
-        self.inner
-            .as_bytes()
-            .iter()
-            .map(|b| format!("{b:02x}"))
-            .collect()
+        let mut hex = String::with_capacity(32);
+        for &b in self.inner.as_bytes() {
+            let [hi, lo] = HEX_PAIRS[usize::from(b)];
+            hex.push(char::from(hi));
+            hex.push(char::from(lo));
+        }
+        hex
     }
 
     fn __repr__(&self) -> String {
         format!("EntityId({})", self.to_hex())
     }
 
-    fn __eq__(&self, other: &Self) -> bool {
-        self.inner == other.inner
+    /// Equality on the 16 raw bytes; ordering comparisons and foreign
+    /// types yield `NotImplemented`.
+    ///
+    /// A downcast rather than an extract: comparing against another type
+    /// does not build and discard a conversion error.
+    fn __richcmp__(&self, other: &Bound<'_, PyAny>, op: CompareOp) -> PyObject {
+        let py = other.py();
+        let Ok(other) = other.downcast::<Self>() else {
+            return py.NotImplemented();
+        };
+        // Compared as one u128 so it lowers to a single 16-byte compare.
+        let lhs = u128::from_ne_bytes(*self.inner.as_bytes());
+        let rhs = u128::from_ne_bytes(*other.get().inner.as_bytes());
+        match op {
+            CompareOp::Eq => PyBool::new(py, lhs == rhs).to_owned().into_any().unbind(),
+            CompareOp::Ne => PyBool::new(py, lhs != rhs).to_owned().into_any().unbind(),
+            _ => py.NotImplemented(),
+        }
     }
 
     fn __hash__(&self) -> u64 {
-        let bytes = self.inner.as_bytes();
-        let mut hash = 0u64;
-        for &b in bytes {
-            hash = hash.wrapping_mul(31).wrapping_add(u64::from(b));
+        // Fold the two 64-bit halves, then mix so structured IDs (e.g. from
+        // from_bytes) still spread across the hash range.
+        let value = u128::from_le_bytes(*self.inner.as_bytes());
+        let folded = (value as u64) ^ ((value >> 64) as u64);
+        let mixed = folded.wrapping_mul(0x9e37_79b9_7f4a_7c15);
+        mixed ^ (mixed >> 32)
+    }
+
+    /// Exposes the 16 bytes as a read-only, one-dimensional `B` buffer.
+    ///
+    /// # Safety
+    ///
+    /// Python calls this with `view` pointing to a `Py_buffer` it owns.
+    /// The pointers written into it stay valid for the life of the view:
+    ///
+    /// - `buf` points into this object, which is `frozen`, so the bytes
+    ///   never change and writable requests are refused.
+    /// - `obj` holds a strong reference to this object, so the bytes live
+    ///   until Python releases the view.
+    /// - `shape` and `strides` point at the `len` and `itemsize` fields of
+    ///   the view itself, and `format` at a static C string.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("buffer view is null"));
         }
-        hash
+        if flags & ffi::PyBUF_WRITABLE == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("EntityId is read-only"));
+        }
+
+        // SAFETY: `view` is non-null and owned by the caller for this call;
+        // every pointer stored in it follows the invariants documented above.
+        let bytes = slf.get().inner.as_bytes();
+        (*view).buf = bytes.as_ptr() as *mut c_void;
+        (*view).len = bytes.len() as ffi::Py_ssize_t;
+        (*view).readonly = 1;
+        (*view).itemsize = 1;
+        (*view).format = if flags & ffi::PyBUF_FORMAT == ffi::PyBUF_FORMAT {
+            c"B".as_ptr() as *mut _
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).ndim = 1;
+        (*view).shape = if flags & ffi::PyBUF_ND == ffi::PyBUF_ND {
+            &mut (*view).len
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).strides = if flags & ffi::PyBUF_STRIDES == ffi::PyBUF_STRIDES {
+            &mut (*view).itemsize
+        } else {
+            std::ptr::null_mut()
+        };
+        (*view).suboffsets = std::ptr::null_mut();
+        (*view).internal = std::ptr::null_mut();
+        (*view).obj = slf.into_any().into_ptr();
+        Ok(())
     }
 }
 
 /// A collection of entities.
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct Collection {
     id: u32,
@@ -112,16 +205,23 @@ pub struct Transaction {
     aborted: bool,
 }
 
-#[pymethods]
 impl Transaction {
-    /// Puts an entity in a collection.
-    fn put(&mut self, collection: &Collection, entity_id: &EntityId, data: &[u8]) -> PyResult<()> {
+    fn ensure_active(&self) -> PyResult<()> {
         if self.committed {
             return Err(PyRuntimeError::new_err("Transaction already committed"));
         }
         if self.aborted {
             return Err(PyRuntimeError::new_err("Transaction already aborted"));
         }
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl Transaction {
+    /// Puts an entity in a collection.
+    fn put(&mut self, collection: &Collection, entity_id: &EntityId, data: &[u8]) -> PyResult<()> {
+        self.ensure_active()?;
         self.writes.push((
             collection.id,
             *entity_id.inner.as_bytes(),
@@ -132,12 +232,7 @@ impl Transaction {
 
     /// Deletes an entity from a collection.
     fn delete(&mut self, collection: &Collection, entity_id: &EntityId) -> PyResult<()> {
-        if self.committed {
-            return Err(PyRuntimeError::new_err("Transaction already committed"));
-        }
-        if self.aborted {
-            return Err(PyRuntimeError::new_err("Transaction already aborted"));
-        }
+        self.ensure_active()?;
         self.writes
             .push((collection.id, *entity_id.inner.as_bytes(), None));
         Ok(())
@@ -163,7 +258,7 @@ impl Transaction {
 
         // Not in transaction, check database
         let coll = CollectionId::new(collection.id);
-        let ent = CoreEntityId::from_bytes(*entity_id.inner.as_bytes());
+        let ent = entity_id.inner;
 
         self.db
             .get(coll, ent)
@@ -173,12 +268,7 @@ impl Transaction {
 
     /// Commits the transaction.
     fn commit(&mut self) -> PyResult<()> {
-        if self.committed {
-            return Err(PyRuntimeError::new_err("Transaction already committed"));
-        }
-        if self.aborted {
-            return Err(PyRuntimeError::new_err("Transaction already aborted"));
-        }
+        self.ensure_active()?;
 
         let writes = std::mem::take(&mut self.writes);
         self.committed = true;
@@ -231,8 +321,10 @@ impl Transaction {
 
 /// Iterator over entities in a collection.
 ///
-/// Memory-efficient iteration that doesn't load all entities at once.
-/// Use `Database.iter()` to create an iterator.
+/// Entities are read from a single snapshot when the iterator is created,
+/// but Python `bytes` objects are only built as items are consumed, and
+/// each payload is released once yielded. Use `Database.iter()` to create
+/// an iterator.
 #[pyclass]
 pub struct EntityIterator {
     entities: Vec<(CoreEntityId, Vec<u8>)>,
@@ -258,8 +350,11 @@ impl EntityIterator {
         let index = slf.index;
         slf.index += 1;
 
-        let (id, data) = &slf.entities[index];
-        Ok((EntityId { inner: *id }, PyBytes::new(py, data)))
+        // Release each payload once it has been handed to Python, so the
+        // iterator's memory shrinks as it is consumed.
+        let (id, data) = &mut slf.entities[index];
+        let data = std::mem::take(data);
+        Ok((EntityId { inner: *id }, PyBytes::new(py, &data)))
     }
 
     /// Returns the number of remaining entities.
@@ -267,6 +362,11 @@ impl EntityIterator {
         self.entities.len().saturating_sub(self.index)
     }
 
+    /// Lets `list(iterator)` and similar size their result up front.
+    fn __length_hint__(&self) -> usize {
+        self.remaining()
+    }
+
     /// Returns the total number of entities.
     fn count(&self) -> usize {
         self.entities.len()
@@ -277,6 +377,24 @@ impl EntityIterator {
 #[pyclass]
 pub struct Database {
     inner: Arc<CoreDatabase>,
+    /// Collection handles by name, handed out again on repeat lookups.
+    collections: Mutex<HashMap<String, Py<Collection>>>,
+}
+
+impl Database {
+    fn from_core(db: CoreDatabase) -> Self {
+        Self {
+            inner: Arc::new(db),
+            collections: Mutex::new(HashMap::new()),
+        }
+    }
+
+    fn cached_collections(&self) -> MutexGuard<'_, HashMap<String, Py<Collection>>> {
+        // The map is only ever inserted into, so it is usable after a panic.
+        self.collections
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+    }
 }
 
 #[pymethods]
@@ -315,9 +433,7 @@ impl Database {
 
         // Open database using directory-based path (ensures LOCK, MANIFEST, SEGMENTS/ layout)
         CoreDatabase::open_with_config(db_path, config)
-            .map(|db| Self {
-                inner: Arc::new(db),
-            })
+            .map(Self::from_core)
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
 
@@ -325,19 +441,32 @@ impl Database {
     #[staticmethod]
     fn open_memory() -> PyResult<Self> {
         CoreDatabase::open_in_memory()
-            .map(|db| Self {
-                inner: Arc::new(db),
-            })
+            .map(Self::from_core)
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
 
     /// Gets or creates a collection by name.
-    fn collection(&self, name: &str) -> Collection {
-        let id = self.inner.collection_unchecked(name);
-        Collection {
-            id: id.as_u32(),
-            name: name.to_string(),
+    ///
+    /// Handles are cached, so asking for the same name again returns the
+    /// same `Collection` object without another engine lookup.
+    fn collection(&self, py: Python<'_>, name: &str) -> PyResult<Py<Collection>> {
+        if let Some(collection) = self.cached_collections().get(name) {
+            return Ok(collection.clone_ref(py));
         }
+
+        let id = self.inner.collection_unchecked(name);
+        let collection = Py::new(
+            py,
+            Collection {
+                id: id.as_u32(),
+                name: name.to_string(),
+            },
+        )?;
+        Ok(self
+            .cached_collections()
+            .entry(name.to_string())
+            .or_insert(collection)
+            .clone_ref(py))
     }
 
     /// Puts an entity in a collection.
@@ -362,9 +491,10 @@ impl Database {
     ) -> PyResult<Option<Bound<'py, PyBytes>>> {
         let coll = CollectionId::new(collection.id);
         let ent = entity_id.inner;
+        let db = &*self.inner;
 
-        self.inner
-            .get(coll, ent)
+        // Reads only take shared locks, so let other Python threads run
+        py.allow_threads(|| db.get(coll, ent))
             .map(|opt| opt.map(|data| PyBytes::new(py, &data)))
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -389,9 +519,9 @@ impl Database {
         collection: &Collection,
     ) -> PyResult<Vec<(EntityId, Bound<'py, PyBytes>)>> {
         let coll = CollectionId::new(collection.id);
+        let db = &*self.inner;
 
-        self.inner
-            .list(coll)
+        py.allow_threads(|| db.list(coll))
             .map(|entities| {
                 entities
                     .into_iter()
@@ -402,24 +532,24 @@ impl Database {
     }
 
     /// Gets the count of entities in a collection.
-    fn count(&self, collection: &Collection) -> PyResult<usize> {
+    fn count(&self, py: Python<'_>, collection: &Collection) -> PyResult<usize> {
         let coll = CollectionId::new(collection.id);
+        let db = &*self.inner;
 
-        self.inner
-            .list(coll)
-            .map(|entities| entities.len())
+        py.allow_threads(|| db.count(coll))
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
 
     /// Returns an iterator over entities in a collection.
     ///
-    /// This is more memory-efficient than `list()` for large collections
-    /// as it supports lazy iteration.
-    fn iter(&self, collection: &Collection) -> PyResult<EntityIterator> {
+    /// This is more memory-efficient than `list()` for large collections:
+    /// `bytes` objects are created lazily and each stored payload is freed
+    /// once it has been yielded.
+    fn iter(&self, py: Python<'_>, collection: &Collection) -> PyResult<EntityIterator> {
         let coll = CollectionId::new(collection.id);
+        let db = &*self.inner;
 
-        self.inner
-            .list(coll)
+        py.allow_threads(|| db.list(coll))
             .map(|entities| EntityIterator { entities, index: 0 })
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -471,9 +601,9 @@ impl Database {
     /// - All committed transactions are durable in segments
     /// - The WAL is cleared
     /// - The manifest is updated with the checkpoint sequence
-    fn checkpoint(&self) -> PyResult<()> {
-        self.inner
-            .checkpoint()
+    fn checkpoint(&self, py: Python<'_>) -> PyResult<()> {
+        let db = &*self.inner;
+        py.allow_threads(|| db.checkpoint())
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
 
@@ -527,9 +657,9 @@ impl Database {
     /// print(f"Saved {stats.bytes_saved} bytes")
     /// ```
     #[pyo3(signature = (remove_tombstones=false))]
-    fn compact(&self, remove_tombstones: bool) -> PyResult<CompactionStats> {
-        self.inner
-            .compact(remove_tombstones)
+    fn compact(&self, py: Python<'_>, remove_tombstones: bool) -> PyResult<CompactionStats> {
+        let db = &*self.inner;
+        py.allow_threads(|| db.compact(remove_tombstones))
             .map(|s| CompactionStats {
                 input_records: s.input_records,
                 output_records: s.output_records,
@@ -551,8 +681,8 @@ impl Database {
     ///     f.write(backup_data)
     /// ```
     fn backup<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
-        self.inner
-            .backup()
+        let db = &*self.inner;
+        py.allow_threads(|| db.backup())
             .map(|data| PyBytes::new(py, &data))
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -567,8 +697,8 @@ impl Database {
         py: Python<'py>,
         include_tombstones: bool,
     ) -> PyResult<Bound<'py, PyBytes>> {
-        self.inner
-            .backup_with_options(include_tombstones)
+        let db = &*self.inner;
+        py.allow_threads(|| db.backup_with_options(include_tombstones))
             .map(|data| PyBytes::new(py, &data))
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -579,7 +709,8 @@ impl Database {
     /// Existing entities with the same ID will be overwritten.
     ///
     /// Args:
-    ///     backup_data: The backup data bytes.
+    ///     backup_data: The backup data as a bytes-like object (`bytes`,
+    ///         `bytearray`, `memoryview`, `mmap`, ...).
     ///
     /// Returns:
     ///     RestoreStats with information about the restore operation.
@@ -591,9 +722,10 @@ impl Database {
     /// stats = db.restore(backup_data)
     /// print(f"Restored {stats.entities_restored} entities")
     /// ```
-    fn restore(&self, backup_data: &[u8]) -> PyResult<RestoreStats> {
-        self.inner
-            .restore(backup_data)
+    fn restore(&self, py: Python<'_>, backup_data: &Bound<'_, PyAny>) -> PyResult<RestoreStats> {
+        let backup_data = bytes_like(backup_data)?;
+        let db = &*self.inner;
+        py.allow_threads(|| db.restore(&backup_data))
             .map(|stats| RestoreStats {
                 entities_restored: stats.entities_restored,
                 tombstones_applied: stats.tombstones_applied,
@@ -608,13 +740,18 @@ impl Database {
     /// Returns the backup metadata if valid.
     ///
     /// Args:
-    ///     backup_data: The backup data bytes.
+    ///     backup_data: The backup data as a bytes-like object.
     ///
     /// Returns:
     ///     BackupInfo with metadata about the backup.
-    fn validate_backup(&self, backup_data: &[u8]) -> PyResult<BackupInfo> {
-        self.inner
-            .validate_backup(backup_data)
+    fn validate_backup(
+        &self,
+        py: Python<'_>,
+        backup_data: &Bound<'_, PyAny>,
+    ) -> PyResult<BackupInfo> {
+        let backup_data = bytes_like(backup_data)?;
+        let db = &*self.inner;
+        py.allow_threads(|| db.validate_backup(&backup_data))
             .map(|info| BackupInfo {
                 valid: info.valid,
                 timestamp: info.timestamp,
@@ -801,14 +938,15 @@ impl Database {
     #[pyo3(signature = (collection, field, min_key=None, max_key=None))]
     fn btree_index_range(
         &self,
+        py: Python<'_>,
         collection: &Collection,
         field: &str,
         min_key: Option<&[u8]>,
         max_key: Option<&[u8]>,
     ) -> PyResult<Vec<EntityId>> {
         let coll = CollectionId::new(collection.id);
-        self.inner
-            .btree_index_range(coll, field, min_key, max_key)
+        let db = &*self.inner;
+        py.allow_threads(|| db.btree_index_range(coll, field, min_key, max_key))
             .map(|ids| ids.into_iter().map(|id| EntityId { inner: id }).collect())
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -974,13 +1112,14 @@ impl Database {
     /// ```
     fn fts_search(
         &self,
+        py: Python<'_>,
         collection: &Collection,
         field: &str,
         query: &str,
     ) -> PyResult<Vec<EntityId>> {
         let coll = CollectionId::new(collection.id);
-        self.inner
-            .fts_search(coll, field, query)
+        let db = &*self.inner;
+        py.allow_threads(|| db.fts_search(coll, field, query))
             .map(|ids| ids.into_iter().map(|inner| EntityId { inner }).collect())
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -1004,13 +1143,14 @@ impl Database {
     /// ```
     fn fts_search_any(
         &self,
+        py: Python<'_>,
         collection: &Collection,
         field: &str,
         query: &str,
     ) -> PyResult<Vec<EntityId>> {
         let coll = CollectionId::new(collection.id);
-        self.inner
-            .fts_search_any(coll, field, query)
+        let db = &*self.inner;
+        py.allow_threads(|| db.fts_search_any(coll, field, query))
             .map(|ids| ids.into_iter().map(|inner| EntityId { inner }).collect())
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -1034,13 +1174,14 @@ impl Database {
     /// ```
     fn fts_search_prefix(
         &self,
+        py: Python<'_>,
         collection: &Collection,
         field: &str,
         prefix: &str,
     ) -> PyResult<Vec<EntityId>> {
         let coll = CollectionId::new(collection.id);
-        self.inner
-            .fts_search_prefix(coll, field, prefix)
+        let db = &*self.inner;
+        py.allow_threads(|| db.fts_search_prefix(coll, field, prefix))
             .map(|ids| ids.into_iter().map(|inner| EntityId { inner }).collect())
             .map_err(|e| PyIOError::new_err(e.to_string()))
     }
@@ -1208,7 +1349,7 @@ impl Database {
 }
 
 /// Statistics from a restore operation.
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct RestoreStats {
     /// Number of entities restored.
@@ -1236,10 +1377,20 @@ impl RestoreStats {
             self.backup_sequence
         )
     }
+
+    /// Returns all fields as a dict, in a single call.
+    fn as_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        dict.set_item("entities_restored", self.entities_restored)?;
+        dict.set_item("tombstones_applied", self.tombstones_applied)?;
+        dict.set_item("backup_timestamp", self.backup_timestamp)?;
+        dict.set_item("backup_sequence", self.backup_sequence)?;
+        Ok(dict)
+    }
 }
 
 /// Information about a backup.
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct BackupInfo {
     /// Whether the backup checksum is valid.
@@ -1267,13 +1418,24 @@ impl BackupInfo {
             self.valid, self.timestamp, self.sequence, self.record_count, self.size
         )
     }
+
+    /// Returns all fields as a dict, in a single call.
+    fn as_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        dict.set_item("valid", self.valid)?;
+        dict.set_item("timestamp", self.timestamp)?;
+        dict.set_item("sequence", self.sequence)?;
+        dict.set_item("record_count", self.record_count)?;
+        dict.set_item("size", self.size)?;
+        Ok(dict)
+    }
 }
 
 /// Database statistics snapshot.
 ///
 /// Contains counters for various database operations, useful for
 /// monitoring and diagnostics.
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct DatabaseStats {
     /// Number of entity read operations.
@@ -1345,7 +1507,7 @@ impl DatabaseStats {
 ///
 /// Contains information about what was removed during compaction
 /// and how much space was saved.
-#[pyclass]
+#[pyclass(frozen)]
 #[derive(Clone)]
 pub struct CompactionStats {
     /// Number of records in the input.
@@ -1448,6 +1610,40 @@ impl ChangeEvent {
 // Crypto Manager
 // ============================================================================
 
+/// Payload size from which crypto calls run with the GIL released.
+///
+/// For small payloads, releasing and re-acquiring the GIL costs more than
+/// the AEAD work itself.
+#[cfg(feature = "encryption")]
+const CRYPTO_GIL_RELEASE_THRESHOLD: usize = 64 * 1024;
+
+/// Runs `f` with the GIL released when `len` reaches the crypto threshold.
+#[cfg(feature = "encryption")]
+fn allow_threads_if_large<T, F>(py: Python<'_>, len: usize, f: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    if len >= CRYPTO_GIL_RELEASE_THRESHOLD {
+        py.allow_threads(f)
+    } else {
+        f()
+    }
+}
+
+/// Borrows the contents of a bytes-like object.
+///
+/// `bytes` is borrowed without copying. Other buffer-protocol objects
+/// (`bytearray`, `memoryview`, ...) are copied once, since their contents
+/// may change while the GIL is released.
+fn bytes_like<'a>(obj: &'a Bound<'_, PyAny>) -> PyResult<Cow<'a, [u8]>> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        return Ok(Cow::Borrowed(bytes.as_bytes()));
+    }
+    let buffer = PyBuffer::<u8>::get(obj)?;
+    Ok(Cow::Owned(buffer.to_vec(obj.py())?))
+}
+
 /// Encryption manager for AES-256-GCM encryption.
 ///
 /// Provides encryption and decryption capabilities using AES-256-GCM.
@@ -1473,10 +1669,21 @@ impl ChangeEvent {
 #[cfg(feature = "encryption")]
 #[pyclass]
 pub struct CryptoManager {
+    /// Initialized cipher, built once at construction and reused per call.
     inner: Option<CoreCryptoManager>,
     key: [u8; 32],
 }
 
+#[cfg(feature = "encryption")]
+impl CryptoManager {
+    /// Returns the cipher, or an error if the manager has been closed.
+    fn manager(&self) -> PyResult<&CoreCryptoManager> {
+        self.inner
+            .as_ref()
+            .ok_or_else(|| PyRuntimeError::new_err("CryptoManager has been closed"))
+    }
+}
+
 #[cfg(feature = "encryption")]
 #[pymethods]
 impl CryptoManager {
@@ -1486,6 +1693,19 @@ impl CryptoManager {
         true
     }
 
+    /// Returns the name of the AEAD algorithm (always "aes256gcm").
+    #[staticmethod]
+    fn backend() -> &'static str {
+        ALGORITHM
+    }
+
+    /// Returns True if the CPU provides AES and carry-less multiply
+    /// instructions, which the cipher then uses automatically.
+    #[staticmethod]
+    fn hardware_accelerated() -> bool {
+        entidb_core::crypto::hardware_accelerated()
+    }
+
     /// Creates a new CryptoManager with a generated random key.
     ///
     /// The generated key can be accessed via get_key() and should be
@@ -1525,8 +1745,12 @@ impl CryptoManager {
 
     /// Creates a CryptoManager from a password and salt.
     ///
-    /// The password and salt are used to derive a key.
+    /// The password and salt are used to derive a key with HKDF-SHA256.
     /// The same password and salt will always produce the same key.
+    ///
+    /// HKDF is a fast key derivation function, not a memory-hard password
+    /// hash, so this call is cheap; use a high-entropy passphrase, or derive
+    /// the key yourself with a password hash and pass it to `from_key()`.
     #[staticmethod]
     fn from_password(password: &[u8], salt: &[u8]) -> PyResult<Self> {
         let key = EncryptionKey::derive_from_password(password, salt)
@@ -1550,31 +1774,41 @@ impl CryptoManager {
     ///
     /// Returns the encrypted data with nonce prepended:
     /// nonce (12 bytes) || ciphertext || tag (16 bytes)
-    fn encrypt<'py>(&self, py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
-        let manager = self
-            .inner
-            .as_ref()
-            .ok_or_else(|| PyRuntimeError::new_err("CryptoManager has been closed"))?;
-
-        manager
-            .encrypt(data)
-            .map(|encrypted| PyBytes::new(py, &encrypted))
-            .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+    fn encrypt<'py>(
+        &self,
+        py: Python<'py>,
+        data: &Bound<'_, PyAny>,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let manager = self.manager()?;
+        let data = bytes_like(data)?;
+        let data = data.as_ref();
+
+        // Encrypt straight into the returned bytes object (no Vec + copy)
+        PyBytes::new_with(py, encrypted_len(data.len()), |out| {
+            allow_threads_if_large(py, data.len(), || manager.encrypt_into(data, &[], out))
+                .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+        })
     }
 
     /// Decrypts data that was encrypted with encrypt().
     ///
     /// Raises an exception if decryption fails (wrong key, corrupted data, etc.).
-    fn decrypt<'py>(&self, py: Python<'py>, data: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
-        let manager = self
-            .inner
-            .as_ref()
-            .ok_or_else(|| PyRuntimeError::new_err("CryptoManager has been closed"))?;
-
-        manager
-            .decrypt(data)
-            .map(|decrypted| PyBytes::new(py, &decrypted))
-            .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+    fn decrypt<'py>(
+        &self,
+        py: Python<'py>,
+        data: &Bound<'_, PyAny>,
+    ) -> PyResult<Bound<'py, PyBytes>> {
+        let manager = self.manager()?;
+        let data = bytes_like(data)?;
+        let data = data.as_ref();
+
+        // Decrypt straight into the returned bytes object. Too-short input
+        // gets an empty buffer and is rejected by decrypt_into itself.
+        let len = decrypted_len(data.len()).unwrap_or(0);
+        PyBytes::new_with(py, len, |out| {
+            allow_threads_if_large(py, data.len(), || manager.decrypt_into(data, &[], out))
+                .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+        })
     }
 
     /// Encrypts data with associated authenticated data (AAD).
@@ -1584,18 +1818,19 @@ impl CryptoManager {
     fn encrypt_with_aad<'py>(
         &self,
         py: Python<'py>,
-        data: &[u8],
-        aad: &[u8],
+        data: &Bound<'_, PyAny>,
+        aad: &Bound<'_, PyAny>,
     ) -> PyResult<Bound<'py, PyBytes>> {
-        let manager = self
-            .inner
-            .as_ref()
-            .ok_or_else(|| PyRuntimeError::new_err("CryptoManager has been closed"))?;
+        let manager = self.manager()?;
+        let (data, aad) = (bytes_like(data)?, bytes_like(aad)?);
+        let (data, aad) = (data.as_ref(), aad.as_ref());
 
-        manager
-            .encrypt_with_aad(data, aad)
-            .map(|encrypted| PyBytes::new(py, &encrypted))
+        PyBytes::new_with(py, encrypted_len(data.len()), |out| {
+            allow_threads_if_large(py, data.len() + aad.len(), || {
+                manager.encrypt_into(data, aad, out)
+            })
             .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+        })
     }
 
     /// Decrypts data with associated authenticated data (AAD).
@@ -1604,18 +1839,20 @@ impl CryptoManager {
     fn decrypt_with_aad<'py>(
         &self,
         py: Python<'py>,
-        data: &[u8],
-        aad: &[u8],
+        data: &Bound<'_, PyAny>,
+        aad: &Bound<'_, PyAny>,
     ) -> PyResult<Bound<'py, PyBytes>> {
-        let manager = self
-            .inner
-            .as_ref()
-            .ok_or_else(|| PyRuntimeError::new_err("CryptoManager has been closed"))?;
-
-        manager
-            .decrypt_with_aad(data, aad)
-            .map(|decrypted| PyBytes::new(py, &decrypted))
+        let manager = self.manager()?;
+        let (data, aad) = (bytes_like(data)?, bytes_like(aad)?);
+        let (data, aad) = (data.as_ref(), aad.as_ref());
+
+        let len = decrypted_len(data.len()).unwrap_or(0);
+        PyBytes::new_with(py, len, |out| {
+            allow_threads_if_large(py, data.len() + aad.len(), || {
+                manager.decrypt_into(data, aad, out)
+            })
             .map_err(|e| PyRuntimeError::new_err(e.to_string()))
+        })
     }
 
     /// Closes the crypto manager and releases resources.
@@ -1678,9 +1915,11 @@ fn entidb(m: &Bound<'_, PyModule>) -> PyResult<()> {
 }
 
 /// Returns the EntiDB library version.
+///
+/// The string object is created once and shared by every call.
 #[pyfunction]
-fn version() -> &'static str {
-    VERSION
+fn version(py: Python<'_>) -> Bound<'_, PyString> {
+    intern!(py, VERSION).clone()
 }
 
 /// Returns True if encryption support is available.
@@ -0,0 +1,67 @@
+"""Shared fixtures for EntiDB Python binding tests."""
+
+import pytest
+
+try:
+    from entidb import Database
+
+    ENTIDB_AVAILABLE = True
+except ImportError:
+    ENTIDB_AVAILABLE = False
+
+try:
+    from entidb import CryptoManager
+
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    CRYPTO_AVAILABLE = False
+
+
+@pytest.fixture(scope="class")
+def shared_db():
+    """An in-memory database shared by every test of one class."""
+    if not ENTIDB_AVAILABLE:
+        pytest.skip("entidb not built")
+    with Database.open_memory() as database:
+        yield database
+
+
+@pytest.fixture
+def db(request):
+    """An open in-memory database, closed when the test finishes.
+
+    Classes marked ``shared_db`` reuse one database for all their tests
+    instead; they must only look at their own ``users`` collection.
+    """
+    if request.node.get_closest_marker("shared_db"):
+        yield request.getfixturevalue("shared_db")
+        return
+    if not ENTIDB_AVAILABLE:
+        pytest.skip("entidb not built")
+    with Database.open_memory() as database:
+        yield database
+
+
+@pytest.fixture
+def users(db, request):
+    """The "users" collection of the test database.
+
+    On a shared database each test gets its own collection.
+    """
+    if request.node.get_closest_marker("shared_db"):
+        return db.collection(f"users_{request.node.name}")
+    return db.collection("users")
+
+
+@pytest.fixture(scope="module")
+def crypto():
+    """A CryptoManager shared by the tests of one module.
+
+    Tests that close the manager or need distinct keys must create
+    their own instead of using this fixture.
+    """
+    if not CRYPTO_AVAILABLE:
+        pytest.skip("entidb crypto not built")
+    manager = CryptoManager.create()
+    yield manager
+    manager.close()
@@ -7,6 +7,7 @@ import pytest
 
 try:
     from entidb import CryptoManager, crypto_available
+
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
@@ -21,6 +22,11 @@ class TestCryptoManager:
         assert CryptoManager.is_available()
         assert crypto_available()
 
+    def test_backend(self):
+        """Test that the backend is reported for diagnostics."""
+        assert CryptoManager.backend() == "aes256gcm"
+        assert isinstance(CryptoManager.hardware_accelerated(), bool)
+
     def test_create_generates_unique_key(self):
         """Test that create() generates unique keys."""
         crypto1 = CryptoManager.create()
@@ -38,7 +44,7 @@ class TestCryptoManager:
     def test_from_key_restores_encryption_context(self):
         """Test that from_key can decrypt data encrypted with the same key."""
         crypto1 = CryptoManager.create()
-        key = bytes(crypto1.get_key())
+        key = crypto1.get_key()
         plaintext = b"test message"
         encrypted = crypto1.encrypt(plaintext)
         crypto1.close()
@@ -51,69 +57,53 @@ class TestCryptoManager:
         finally:
             crypto2.close()
 
-    def test_encrypt_decrypt_roundtrip(self):
+    def test_encrypt_decrypt_roundtrip(self, crypto):
         """Test basic encrypt/decrypt roundtrip."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"Hello, EntiDB!"
-            encrypted = crypto.encrypt(plaintext)
+        plaintext = b"Hello, EntiDB!"
+        encrypted = crypto.encrypt(plaintext)
 
-            # Encrypted data should be larger (nonce + ciphertext + tag)
-            assert len(encrypted) == len(plaintext) + 28
+        # Encrypted data should be larger (nonce + ciphertext + tag)
+        assert len(encrypted) == len(plaintext) + 28
 
-            # Encrypted data should be different from plaintext
-            assert encrypted != plaintext
+        # Encrypted data should be different from plaintext
+        assert encrypted != plaintext
 
-            decrypted = crypto.decrypt(encrypted)
-            assert decrypted == plaintext
-        finally:
-            crypto.close()
+        decrypted = crypto.decrypt(encrypted)
+        assert decrypted == plaintext
 
-    def test_encrypt_produces_different_ciphertext(self):
+    def test_encrypt_produces_different_ciphertext(self, crypto):
         """Test that encrypting the same data produces different ciphertext."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"same message"
-            encrypted1 = crypto.encrypt(plaintext)
-            encrypted2 = crypto.encrypt(plaintext)
+        plaintext = b"same message"
+        encrypted1 = crypto.encrypt(plaintext)
+        encrypted2 = crypto.encrypt(plaintext)
 
-            # Different nonces should produce different ciphertext
-            assert encrypted1 != encrypted2
+        # Different nonces should produce different ciphertext
+        assert encrypted1 != encrypted2
 
-            # But both should decrypt to same plaintext
-            assert crypto.decrypt(encrypted1) == plaintext
-            assert crypto.decrypt(encrypted2) == plaintext
-        finally:
-            crypto.close()
+        # But both should decrypt to same plaintext
+        assert crypto.decrypt(encrypted1) == plaintext
+        assert crypto.decrypt(encrypted2) == plaintext
 
-    def test_encrypt_decrypt_with_aad_roundtrip(self):
+    def test_encrypt_decrypt_with_aad_roundtrip(self, crypto):
         """Test encrypt/decrypt with AAD."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"secret data"
-            aad = b"entity-id-123"
+        plaintext = b"secret data"
+        aad = b"entity-id-123"
 
-            encrypted = crypto.encrypt_with_aad(plaintext, aad)
-            decrypted = crypto.decrypt_with_aad(encrypted, aad)
+        encrypted = crypto.encrypt_with_aad(plaintext, aad)
+        decrypted = crypto.decrypt_with_aad(encrypted, aad)
 
-            assert decrypted == plaintext
-        finally:
-            crypto.close()
+        assert decrypted == plaintext
 
-    def test_decrypt_with_wrong_aad_fails(self):
+    def test_decrypt_with_wrong_aad_fails(self, crypto):
         """Test that decryption fails with wrong AAD."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"secret data"
-            correct_aad = b"correct-aad"
-            wrong_aad = b"wrong-aad"
+        plaintext = b"secret data"
+        correct_aad = b"correct-aad"
+        wrong_aad = b"wrong-aad"
 
-            encrypted = crypto.encrypt_with_aad(plaintext, correct_aad)
+        encrypted = crypto.encrypt_with_aad(plaintext, correct_aad)
 
-            with pytest.raises(RuntimeError):
-                crypto.decrypt_with_aad(encrypted, wrong_aad)
-        finally:
-            crypto.close()
+        with pytest.raises(RuntimeError):
+            crypto.decrypt_with_aad(encrypted, wrong_aad)
 
     def test_decrypt_with_wrong_key_fails(self):
         """Test that decryption fails with wrong key."""
@@ -129,37 +119,39 @@ class TestCryptoManager:
             crypto1.close()
             crypto2.close()
 
-    def test_decrypt_with_corrupted_data_fails(self):
+    def test_decrypt_with_corrupted_data_fails(self, crypto):
         """Test that decryption fails with corrupted data."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"original"
-            encrypted = crypto.encrypt(plaintext)
+        plaintext = b"original"
+        encrypted = crypto.encrypt(plaintext)
 
-            # Corrupt the ciphertext
-            corrupted = bytearray(encrypted)
-            corrupted[20] ^= 0xFF
-            corrupted = bytes(corrupted)
+        # Corrupt the ciphertext
+        corrupted = bytearray(encrypted)
+        corrupted[20] ^= 0xFF
 
-            with pytest.raises(RuntimeError):
-                crypto.decrypt(corrupted)
-        finally:
-            crypto.close()
+        with pytest.raises(RuntimeError):
+            crypto.decrypt(corrupted)
+
+    @pytest.mark.parametrize("position", [0, 11, 12, 20, -16, -1])
+    def test_decrypt_rejects_any_tampered_byte(self, crypto, position):
+        """Test that tampering with nonce, ciphertext or tag fails uniformly."""
+        encrypted = crypto.encrypt(b"original message")
 
-    def test_decrypt_with_truncated_data_fails(self):
+        corrupted = bytearray(encrypted)
+        corrupted[position] ^= 0x01
+
+        with pytest.raises(RuntimeError, match="decryption failed: decryption error"):
+            crypto.decrypt(corrupted)
+
+    def test_decrypt_with_truncated_data_fails(self, crypto):
         """Test that decryption fails with truncated data."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"test data"
-            encrypted = crypto.encrypt(plaintext)
+        plaintext = b"test data"
+        encrypted = crypto.encrypt(plaintext)
 
-            # Truncate the data (too short for nonce + tag)
-            truncated = encrypted[:10]
+        # Truncate the data (too short for nonce + tag)
+        truncated = encrypted[:10]
 
-            with pytest.raises(RuntimeError):
-                crypto.decrypt(truncated)
-        finally:
-            crypto.close()
+        with pytest.raises(RuntimeError):
+            crypto.decrypt(truncated)
 
     def test_from_password_consistent_key(self):
         """Test that same password/salt produces same key."""
@@ -253,63 +245,59 @@ class TestCryptoManager:
 
         assert crypto.is_closed
 
-    def test_encrypt_empty_data(self):
+    def test_encrypt_empty_data(self, crypto):
         """Test encrypting empty data."""
-        crypto = CryptoManager.create()
-        try:
-            empty = b""
-            encrypted = crypto.encrypt(empty)
+        empty = b""
+        encrypted = crypto.encrypt(empty)
 
-            # Should have overhead but no plaintext bytes
-            assert len(encrypted) == 28  # 12 (nonce) + 0 + 16 (tag)
+        # Should have overhead but no plaintext bytes
+        assert len(encrypted) == 28  # 12 (nonce) + 0 + 16 (tag)
 
-            decrypted = crypto.decrypt(encrypted)
-            assert decrypted == b""
-        finally:
-            crypto.close()
+        decrypted = crypto.decrypt(encrypted)
+        assert decrypted == b""
 
-    def test_encrypt_large_data(self):
+    def test_encrypt_large_data(self, crypto):
         """Test encrypting large data."""
-        crypto = CryptoManager.create()
-        try:
-            # 1 MB of data
-            large = bytes([i % 256 for i in range(1024 * 1024)])
-            encrypted = crypto.encrypt(large)
+        # 1 MB of data
+        large = bytes(range(256)) * 4096
+        encrypted = crypto.encrypt(large)
 
-            assert len(encrypted) == len(large) + 28
+        assert len(encrypted) == len(large) + 28
 
-            decrypted = crypto.decrypt(encrypted)
-            assert decrypted == large
-        finally:
-            crypto.close()
+        decrypted = crypto.decrypt(encrypted)
+        assert decrypted == large
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_accepts_buffer_inputs(self, crypto, wrap):
+        """Test that bytes-like objects other than bytes are accepted."""
+        data = b"buffer input"
+        aad = b"context"
+
+        encrypted = crypto.encrypt(wrap(data))
+        assert crypto.decrypt(wrap(encrypted)) == data
 
-    def test_encrypt_with_empty_aad(self):
+        encrypted = crypto.encrypt_with_aad(wrap(data), wrap(aad))
+        assert crypto.decrypt_with_aad(wrap(encrypted), wrap(aad)) == data
+
+    def test_encrypt_with_empty_aad(self, crypto):
         """Test encryption with empty AAD."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"data"
-            empty_aad = b""
+        plaintext = b"data"
+        empty_aad = b""
 
-            encrypted = crypto.encrypt_with_aad(plaintext, empty_aad)
-            decrypted = crypto.decrypt_with_aad(encrypted, empty_aad)
+        encrypted = crypto.encrypt_with_aad(plaintext, empty_aad)
+        decrypted = crypto.decrypt_with_aad(encrypted, empty_aad)
 
-            assert decrypted == plaintext
-        finally:
-            crypto.close()
+        assert decrypted == plaintext
 
-    def test_encrypt_with_large_aad(self):
+    def test_encrypt_with_large_aad(self, crypto):
         """Test encryption with large AAD."""
-        crypto = CryptoManager.create()
-        try:
-            plaintext = b"data"
-            large_aad = bytes([i % 256 for i in range(10000)])
+        plaintext = b"data"
+        large_aad = (bytes(range(256)) * 40)[:10000]
 
-            encrypted = crypto.encrypt_with_aad(plaintext, large_aad)
-            decrypted = crypto.decrypt_with_aad(encrypted, large_aad)
+        encrypted = crypto.encrypt_with_aad(plaintext, large_aad)
+        decrypted = crypto.decrypt_with_aad(encrypted, large_aad)
 
-            assert decrypted == plaintext
-        finally:
-            crypto.close()
+        assert decrypted == plaintext
 
     def test_repr(self):
         """Test CryptoManager repr."""
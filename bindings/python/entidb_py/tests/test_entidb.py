@@ -1,5 +1,7 @@
 """Tests for EntiDB Python bindings."""
 
+import operator
+
 import pytest
 
 # Note: Tests require the native library to be built.
@@ -16,10 +18,14 @@ try:
         BackupInfo,
         version,
     )
+
     ENTIDB_AVAILABLE = True
 except ImportError:
     ENTIDB_AVAILABLE = False
 
+# Pre-encoded payloads for tests that write a handful of entities
+DATA_VALUES = [b"data-0", b"data-1", b"data-2", b"data-3", b"data-4"]
+
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
 class TestVersion:
@@ -27,6 +33,7 @@ class TestVersion:
         ver = version()
         assert isinstance(ver, str)
         assert len(ver) > 0
+        assert version() is ver
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
@@ -37,7 +44,7 @@ class TestEntityId:
         assert id1 != id2
 
     def test_from_bytes(self):
-        data = bytes([1] * 16)
+        data = b"\x01" * 16
         entity_id = EntityId.from_bytes(data)
         assert entity_id.to_bytes() == data
 
@@ -46,15 +53,40 @@ class TestEntityId:
             EntityId.from_bytes(b"short")
 
     def test_to_hex(self):
-        entity_id = EntityId.from_bytes(bytes([0x01, 0x02] + [0] * 14))
+        entity_id = EntityId.from_bytes(b"\x01\x02" + bytes(14))
         hex_str = entity_id.to_hex()
         assert hex_str.startswith("0102")
 
+    def test_to_hex_matches_bytes(self):
+        all_bytes = bytes(range(256))
+        for start in range(0, 256, 16):
+            entity_id = EntityId.from_bytes(all_bytes[start : start + 16])
+            assert entity_id.to_hex() == entity_id.to_bytes().hex()
+
+    def test_buffer_protocol(self):
+        data = bytes(range(16))
+        entity_id = EntityId.from_bytes(data)
+        assert bytes(entity_id) == data
+
+        view = memoryview(entity_id)
+        assert view.readonly
+        assert view.nbytes == 16
+        assert view.tobytes() == entity_id.to_bytes()
+
     def test_equality(self):
-        data = bytes([42] * 16)
+        data = b"\x2a" * 16
         id1 = EntityId.from_bytes(data)
         id2 = EntityId.from_bytes(data)
         assert id1 == id2
+        assert (id1 != id2) is False
+        assert id1 != EntityId()
+
+    def test_equality_with_other_types(self):
+        entity_id = EntityId()
+        assert entity_id != entity_id.to_bytes()
+        assert entity_id != None
+        with pytest.raises(TypeError):
+            operator.lt(entity_id, EntityId())
 
     def test_hash(self):
         id1 = EntityId()
@@ -64,6 +96,10 @@ class TestEntityId:
         id3 = EntityId.from_bytes(id1.to_bytes())
         assert hash(id1) == hash(id3)
 
+    def test_hash_spreads_structured_ids(self):
+        ids = [EntityId.from_bytes(bytes(15) + bytes([i])) for i in range(256)]
+        assert len({hash(entity_id) for entity_id in ids}) == 256
+
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
 class TestDatabase:
@@ -78,270 +114,239 @@ class TestDatabase:
             assert db.is_open
         # Database should be closed after context
 
-    def test_collection(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            assert users.name == "users"
-            assert users.id >= 0
+    def test_collection(self, db, users):
+        assert users.name == "users"
+        assert users.id >= 0
 
-    def test_put_and_get(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
-            data = b"hello world"
+    def test_collection_handle_is_cached(self, db, users):
+        assert db.collection("users") is users
+        assert db.collection("orders") is not users
 
-            db.put(users, entity_id, data)
-            result = db.get(users, entity_id)
+    def test_put_and_get(self, db, users):
+        entity_id = EntityId()
+        data = b"hello world"
 
-            assert result == data
+        db.put(users, entity_id, data)
+        result = db.get(users, entity_id)
 
-    def test_get_missing(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+        assert result == data
 
-            result = db.get(users, entity_id)
-            assert result is None
+    def test_get_missing(self, db, users):
+        entity_id = EntityId()
 
-    def test_delete(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+        result = db.get(users, entity_id)
+        assert result is None
 
-            db.put(users, entity_id, b"data")
-            assert db.get(users, entity_id) is not None
+    def test_delete(self, db, users):
+        entity_id = EntityId()
 
-            db.delete(users, entity_id)
-            assert db.get(users, entity_id) is None
+        db.put(users, entity_id, b"data")
+        assert db.get(users, entity_id) is not None
 
-    def test_list(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
+        db.delete(users, entity_id)
+        assert db.get(users, entity_id) is None
 
-            ids = [EntityId() for _ in range(3)]
-            for i, entity_id in enumerate(ids):
-                db.put(users, entity_id, f"data-{i}".encode())
+    def test_list(self, db, users):
+        for data in DATA_VALUES[:3]:
+            db.put(users, EntityId(), data)
 
-            entities = db.list(users)
-            assert len(entities) == 3
+        entities = db.list(users)
+        assert len(entities) == 3
 
-    def test_count(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            assert db.count(users) == 0
+    def test_count(self, db, users):
+        assert db.count(users) == 0
 
-            for i in range(5):
-                db.put(users, EntityId(), f"data-{i}".encode())
+        for data in DATA_VALUES:
+            db.put(users, EntityId(), data)
 
-            assert db.count(users) == 5
+        assert db.count(users) == 5
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
+@pytest.mark.shared_db
 class TestTransaction:
-    def test_commit(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_commit(self, db, users):
+        entity_id = EntityId()
 
-            txn = db.transaction()
-            txn.put(users, entity_id, b"txn data")
-            txn.commit()
+        txn = db.transaction()
+        txn.put(users, entity_id, b"txn data")
+        txn.commit()
 
-            assert db.get(users, entity_id) == b"txn data"
+        assert db.get(users, entity_id) == b"txn data"
 
-    def test_uncommitted_not_visible(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_uncommitted_not_visible(self, db, users):
+        entity_id = EntityId()
 
-            txn = db.transaction()
-            txn.put(users, entity_id, b"data")
+        txn = db.transaction()
+        txn.put(users, entity_id, b"data")
 
-            # Without commit, data is not visible outside transaction
-            assert db.get(users, entity_id) is None
+        # Without commit, data is not visible outside transaction
+        assert db.get(users, entity_id) is None
 
-    def test_transaction_sees_own_writes(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_transaction_sees_own_writes(self, db, users):
+        entity_id = EntityId()
 
-            txn = db.transaction()
-            txn.put(users, entity_id, b"uncommitted")
+        txn = db.transaction()
+        txn.put(users, entity_id, b"uncommitted")
 
-            # Transaction should see its own writes
-            result = txn.get(users, entity_id)
-            assert result == b"uncommitted"
+        # Transaction should see its own writes
+        result = txn.get(users, entity_id)
+        assert result == b"uncommitted"
 
-    def test_multiple_operations(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
+    def test_multiple_operations(self, db, users):
+        ids = [EntityId() for _ in range(3)]
+        txn = db.transaction()
+        for entity_id, data in zip(ids, DATA_VALUES):
+            txn.put(users, entity_id, data)
+        assert txn.get(users, ids[2]) == b"data-2"
+        txn.commit()
 
-            ids = [EntityId() for _ in range(3)]
-            txn = db.transaction()
-            for i, entity_id in enumerate(ids):
-                txn.put(users, entity_id, f"data-{i}".encode())
-            txn.commit()
+        assert db.count(users) == 3
 
-            assert db.count(users) == 3
+    def test_delete_in_transaction(self, db, users):
+        entity_id = EntityId()
 
-    def test_delete_in_transaction(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+        # First put outside transaction
+        db.put(users, entity_id, b"original")
 
-            # First put outside transaction
-            db.put(users, entity_id, b"original")
+        # Delete in transaction
+        txn = db.transaction()
+        txn.delete(users, entity_id)
 
-            # Delete in transaction
-            txn = db.transaction()
-            txn.delete(users, entity_id)
+        # Transaction should see the delete
+        assert txn.get(users, entity_id) is None
 
-            # Transaction should see the delete
-            assert txn.get(users, entity_id) is None
+        txn.commit()
 
-            txn.commit()
+        # After commit, should be deleted
+        assert db.get(users, entity_id) is None
 
-            # After commit, should be deleted
-            assert db.get(users, entity_id) is None
+    def test_abort(self, db, users):
+        entity_id = EntityId()
 
-    def test_abort(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+        txn = db.transaction()
+        txn.put(users, entity_id, b"aborted data")
+        txn.abort()
 
-            txn = db.transaction()
-            txn.put(users, entity_id, b"aborted data")
-            txn.abort()
+        # Aborted transaction should not persist
+        assert db.get(users, entity_id) is None
 
-            # Aborted transaction should not persist
-            assert db.get(users, entity_id) is None
+    def test_context_manager_commit(self, db, users):
+        entity_id = EntityId()
 
-    def test_context_manager_commit(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+        with db.transaction() as txn:
+            txn.put(users, entity_id, b"context data")
 
-            with db.transaction() as txn:
-                txn.put(users, entity_id, b"context data")
-
-            # Should be committed after context exit
-            assert db.get(users, entity_id) == b"context data"
+        # Should be committed after context exit
+        assert db.get(users, entity_id) == b"context data"
 
-    def test_context_manager_abort_on_exception(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_context_manager_abort_on_exception(self, db, users):
+        entity_id = EntityId()
 
-            try:
-                with db.transaction() as txn:
-                    txn.put(users, entity_id, b"error data")
-                    raise ValueError("simulated error")
-            except ValueError:
-                pass
+        try:
+            with db.transaction() as txn:
+                txn.put(users, entity_id, b"error data")
+                raise ValueError("simulated error")
+        except ValueError:
+            pass
 
-            # Should not be committed due to exception
-            assert db.get(users, entity_id) is None
+        # Should not be committed due to exception
+        assert db.get(users, entity_id) is None
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
+@pytest.mark.shared_db
 class TestEntityIterator:
-    def test_iter(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
+    def test_iter(self, db, users):
+        for data in DATA_VALUES[:3]:
+            db.put(users, EntityId(), data)
 
-            ids = [EntityId() for _ in range(3)]
-            for i, entity_id in enumerate(ids):
-                db.put(users, entity_id, f"data-{i}".encode())
+        iterator = db.iter(users)
+        count = 0
+        for entity_id, data in iterator:
+            count += 1
+            assert isinstance(entity_id, EntityId)
+            assert isinstance(data, bytes)
 
-            iterator = db.iter(users)
-            count = 0
-            for entity_id, data in iterator:
-                count += 1
-                assert isinstance(entity_id, EntityId)
-                assert isinstance(data, bytes)
+        assert count == 3
 
-            assert count == 3
+    def test_iter_matches_list(self, db, users):
+        for data in DATA_VALUES[:4]:
+            db.put(users, EntityId(), data)
 
-    def test_remaining(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
+        streamed = {entity_id.to_bytes(): data for entity_id, data in db.iter(users)}
+        listed = {entity_id.to_bytes(): data for entity_id, data in db.list(users)}
+        assert streamed == listed
+        assert len(streamed) == 4
 
-            for i in range(5):
-                db.put(users, EntityId(), f"data-{i}".encode())
+    def test_remaining(self, db, users):
+        for data in DATA_VALUES:
+            db.put(users, EntityId(), data)
 
-            iterator = db.iter(users)
-            assert iterator.remaining() == 5
-            assert iterator.count() == 5
+        iterator = db.iter(users)
+        assert iterator.remaining() == 5
+        assert iterator.count() == 5
 
-            next(iterator)
-            assert iterator.remaining() == 4
+        next(iterator)
+        assert iterator.remaining() == 4
+        assert operator.length_hint(iterator) == 4
+        assert len(list(iterator)) == 4
 
-    def test_empty_collection(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            iterator = db.iter(users)
+    def test_empty_collection(self, db, users):
+        iterator = db.iter(users)
 
-            items = list(iterator)
-            assert items == []
+        items = list(iterator)
+        assert items == []
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
 class TestCheckpoint:
-    def test_checkpoint(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_checkpoint(self, db, users):
+        entity_id = EntityId()
 
-            db.put(users, entity_id, b"checkpoint test")
+        db.put(users, entity_id, b"checkpoint test")
 
-            # Checkpoint should succeed
-            db.checkpoint()
+        # Checkpoint should succeed
+        db.checkpoint()
 
-            # Data should still be accessible
-            assert db.get(users, entity_id) == b"checkpoint test"
+        # Data should still be accessible
+        assert db.get(users, entity_id) == b"checkpoint test"
 
-    def test_checkpoint_updates_sequence(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-
-            # Add some data
-            db.put(users, EntityId(), b"data1")
-            seq1 = db.committed_seq
+    def test_checkpoint_updates_sequence(self, db, users):
+        # Add some data
+        db.put(users, EntityId(), b"data1")
+        seq1 = db.committed_seq
 
-            # Checkpoint
-            db.checkpoint()
+        # Checkpoint
+        db.checkpoint()
 
-            # Sequence should be the same (checkpoint doesn't create new commits)
-            assert db.committed_seq >= seq1
+        # Sequence should be the same (checkpoint doesn't create new commits)
+        assert db.committed_seq >= seq1
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
 class TestBackupRestore:
-    def test_backup(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_backup(self, db, users):
+        entity_id = EntityId()
 
-            db.put(users, entity_id, b"backup test")
+        db.put(users, entity_id, b"backup test")
 
-            backup_data = db.backup()
-            assert isinstance(backup_data, bytes)
-            assert len(backup_data) > 0
+        backup_data = db.backup()
+        assert isinstance(backup_data, bytes)
+        assert len(backup_data) > 0
 
-    def test_backup_with_options(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_backup_with_options(self, db, users):
+        entity_id = EntityId()
 
-            db.put(users, entity_id, b"data")
+        db.put(users, entity_id, b"data")
 
-            # Backup without tombstones
-            backup1 = db.backup_with_options(include_tombstones=False)
-            assert len(backup1) > 0
+        # Backup without tombstones
+        backup1 = db.backup_with_options(include_tombstones=False)
+        assert len(backup1) > 0
 
-            # Backup with tombstones
-            backup2 = db.backup_with_options(include_tombstones=True)
-            assert len(backup2) > 0
+        # Backup with tombstones
+        backup2 = db.backup_with_options(include_tombstones=True)
+        assert len(backup2) > 0
 
     def test_restore(self):
         # Create first database with data
@@ -357,7 +362,7 @@ class TestBackupRestore:
             # Create second database and restore
             with Database.open_memory() as db2:
                 # Need to create collection first
-                db2.collection("users")
+                users2 = db2.collection("users")
 
                 stats = db2.restore(backup_data)
 
@@ -366,7 +371,7 @@ class TestBackupRestore:
                 assert stats.tombstones_applied == 0
 
                 # Data should be accessible
-                result = db2.get(db2.collection("users"), entity_id)
+                result = db2.get(users2, entity_id)
                 assert result == b"original data"
 
     def test_restore_stats(self):
@@ -374,8 +379,8 @@ class TestBackupRestore:
             users = db1.collection("users")
 
             # Add multiple entities
-            for i in range(5):
-                db1.put(users, EntityId(), f"data-{i}".encode())
+            for data in DATA_VALUES:
+                db1.put(users, EntityId(), data)
 
             backup_data = db1.backup()
 
@@ -387,64 +392,89 @@ class TestBackupRestore:
                 assert stats.backup_timestamp > 0
                 assert stats.backup_sequence >= 0
 
-    def test_validate_backup(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            db.put(users, EntityId(), b"validation test")
-
-            backup_data = db.backup()
-
-            info = db.validate_backup(backup_data)
-
-            assert isinstance(info, BackupInfo)
-            assert info.valid is True
-            assert info.record_count > 0
-            assert info.size > 0
-            assert info.timestamp > 0
-
-    def test_validate_invalid_backup(self):
-        with Database.open_memory() as db:
-            # Try to validate garbage data
-            with pytest.raises(IOError):
-                db.validate_backup(b"not a valid backup")
+                as_dict = stats.as_dict()
+                assert as_dict["entities_restored"] == 5
+                assert as_dict["backup_timestamp"] == stats.backup_timestamp
+                assert set(as_dict) == {
+                    "entities_restored",
+                    "tombstones_applied",
+                    "backup_timestamp",
+                    "backup_sequence",
+                }
+
+    def test_validate_backup(self, db, users):
+        db.put(users, EntityId(), b"validation test")
+
+        backup_data = db.backup()
+
+        info = db.validate_backup(backup_data)
+
+        assert isinstance(info, BackupInfo)
+        assert info.valid is True
+        assert info.record_count > 0
+        assert info.size > 0
+        assert info.timestamp > 0
+
+        assert info.as_dict() == {
+            "valid": True,
+            "timestamp": info.timestamp,
+            "sequence": info.sequence,
+            "record_count": info.record_count,
+            "size": info.size,
+        }
+
+    def test_backup_accepts_buffer_inputs(self, db, users):
+        entity_id = EntityId()
+        db.put(users, entity_id, b"buffer test")
+        backup_data = db.backup()
+
+        assert db.validate_backup(memoryview(backup_data)).valid
+        assert db.validate_backup(bytearray(backup_data)).record_count == 1
+
+        with Database.open_memory() as db2:
+            users2 = db2.collection("users")
+            stats = db2.restore(memoryview(backup_data))
+            assert stats.entities_restored == 1
+            assert db2.get(users2, entity_id) == b"buffer test"
+
+    def test_validate_invalid_backup(self, db):
+        # Try to validate garbage data
+        with pytest.raises(IOError):
+            db.validate_backup(b"not a valid backup")
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
 class TestDatabaseProperties:
-    def test_committed_seq(self):
-        with Database.open_memory() as db:
-            initial_seq = db.committed_seq
-            assert initial_seq >= 0
+    def test_committed_seq(self, db):
+        initial_seq = db.committed_seq
+        assert initial_seq >= 0
 
-            users = db.collection("users")
-            db.put(users, EntityId(), b"data")
+        users = db.collection("users")
+        db.put(users, EntityId(), b"data")
 
-            # Sequence should increase after commit
-            assert db.committed_seq > initial_seq
+        # Sequence should increase after commit
+        assert db.committed_seq > initial_seq
 
-    def test_entity_count(self):
-        with Database.open_memory() as db:
-            assert db.entity_count == 0
+    def test_entity_count(self, db):
+        assert db.entity_count == 0
 
-            users = db.collection("users")
-            for i in range(3):
-                db.put(users, EntityId(), f"data-{i}".encode())
+        users = db.collection("users")
+        for data in DATA_VALUES[:3]:
+            db.put(users, EntityId(), data)
 
-            assert db.entity_count == 3
+        assert db.entity_count == 3
 
-    def test_entity_count_after_delete(self):
-        with Database.open_memory() as db:
-            users = db.collection("users")
-            entity_id = EntityId()
+    def test_entity_count_after_delete(self, db, users):
+        entity_id = EntityId()
 
-            db.put(users, entity_id, b"data")
-            assert db.entity_count == 1
+        db.put(users, entity_id, b"data")
+        assert db.entity_count == 1
 
-            db.delete(users, entity_id)
-            # Note: Entity count may not decrease immediately after delete
-            # because tombstones are still tracked until compaction
-            # The entity should not be retrievable, which is the key invariant
-            assert db.get(users, entity_id) is None
+        db.delete(users, entity_id)
+        # Note: Entity count may not decrease immediately after delete
+        # because tombstones are still tracked until compaction
+        # The entity should not be retrievable, which is the key invariant
+        assert db.get(users, entity_id) is None
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
@@ -532,11 +562,11 @@ class TestBTreeIndex:
             e3 = EntityId()
 
             # Use big-endian encoding for proper ordering
-            db.btree_index_insert(users, "age", (25).to_bytes(8, 'big'), e1)
-            db.btree_index_insert(users, "age", (30).to_bytes(8, 'big'), e2)
-            db.btree_index_insert(users, "age", (35).to_bytes(8, 'big'), e3)
+            db.btree_index_insert(users, "age", (25).to_bytes(8, "big"), e1)
+            db.btree_index_insert(users, "age", (30).to_bytes(8, "big"), e2)
+            db.btree_index_insert(users, "age", (35).to_bytes(8, "big"), e3)
 
-            results = db.btree_index_lookup(users, "age", (30).to_bytes(8, 'big'))
+            results = db.btree_index_lookup(users, "age", (30).to_bytes(8, "big"))
             assert len(results) == 1
             assert results[0] == e2
 
@@ -550,14 +580,14 @@ class TestBTreeIndex:
             e3 = EntityId()
             e4 = EntityId()
 
-            db.btree_index_insert(users, "age", (20).to_bytes(8, 'big'), e1)
-            db.btree_index_insert(users, "age", (25).to_bytes(8, 'big'), e2)
-            db.btree_index_insert(users, "age", (30).to_bytes(8, 'big'), e3)
-            db.btree_index_insert(users, "age", (35).to_bytes(8, 'big'), e4)
+            db.btree_index_insert(users, "age", (20).to_bytes(8, "big"), e1)
+            db.btree_index_insert(users, "age", (25).to_bytes(8, "big"), e2)
+            db.btree_index_insert(users, "age", (30).to_bytes(8, "big"), e3)
+            db.btree_index_insert(users, "age", (35).to_bytes(8, "big"), e4)
 
             # Range: 25 <= age <= 30
-            min_key = (25).to_bytes(8, 'big')
-            max_key = (30).to_bytes(8, 'big')
+            min_key = (25).to_bytes(8, "big")
+            max_key = (30).to_bytes(8, "big")
             results = db.btree_index_range(users, "age", min_key, max_key)
             assert len(results) == 2
 
@@ -578,7 +608,7 @@ class TestBTreeIndex:
 
             # Lookup on dropped index should fail
             with pytest.raises(IOError):
-                db.btree_index_lookup(users, "age", (25).to_bytes(8, 'big'))
+                db.btree_index_lookup(users, "age", (25).to_bytes(8, "big"))
 
 
 @pytest.mark.skipif(not ENTIDB_AVAILABLE, reason="entidb not built")
@@ -597,10 +627,11 @@ class TestFtsIndex:
         with Database.open_memory() as db:
             docs = db.collection("documents")
             db.create_fts_index_with_config(
-                docs, "content",
+                docs,
+                "content",
                 min_token_length=2,
                 max_token_length=100,
-                case_sensitive=True
+                case_sensitive=True,
             )
 
             assert db.fts_index_len(docs, "content") == 0
@@ -770,9 +801,7 @@ class TestFtsIndex:
     def test_case_sensitivity(self):
         with Database.open_memory() as db:
             docs = db.collection("documents")
-            db.create_fts_index_with_config(
-                docs, "content", case_sensitive=True
-            )
+            db.create_fts_index_with_config(docs, "content", case_sensitive=True)
 
             entity_id = EntityId()
             db.fts_index_text(docs, "content", entity_id, "Hello World")
@@ -806,8 +835,7 @@ class TestFtsIndex:
             db.create_fts_index(docs, "content")
 
             for i in range(5):
-                entity_id = EntityId()
-                db.fts_index_text(docs, "content", entity_id, f"document {i}")
+                db.fts_index_text(docs, "content", EntityId(), f"document {i}")
 
             assert db.fts_index_len(docs, "content") == 5
 
@@ -4,232 +4,279 @@ These tests validate that Python produces identical CBOR encoding
 and entity ID handling as Rust and Dart implementations.
 """
 
+import functools
 import json
 import os
+import struct
 import pytest
 from pathlib import Path
 
+try:
+    import cbor2
 
-def hex_decode(hex_str: str) -> bytes:
-    """Decode hex string to bytes."""
-    if not hex_str:
-        return b""
-    return bytes.fromhex(hex_str)
+    _HAS_CBOR2 = True
+except ImportError:
+    _HAS_CBOR2 = False
 
 
-def hex_encode(data: bytes) -> str:
-    """Encode bytes to hex string."""
-    return data.hex()
+# Find test vectors directory
+VECTORS_DIR = (
+    Path(__file__).parent.parent.parent.parent.parent / "docs" / "test_vectors"
+)
 
 
-# Find test vectors directory
-VECTORS_DIR = Path(__file__).parent.parent.parent.parent.parent / "docs" / "test_vectors"
+@functools.lru_cache(maxsize=None)
+def _load_vectors(name: str) -> tuple:
+    """Load a vector file, or return an empty tuple if it is missing.
+
+    Each file is parsed once per session. An empty result leaves the
+    parametrized test with no cases, which pytest reports as skipped.
+    """
+    vector_file = VECTORS_DIR / name
+    if not vector_file.exists():
+        return ()
+    return tuple(json.loads(vector_file.read_bytes()))
+
+
+def _vector_id(vector) -> str:
+    return vector["id"]
+
+
+def _split_vectors(vectors):
+    """Split vectors into (expected to pass, expected to fail)."""
+    ok = [v for v in vectors if not v.get("expected_error")]
+    bad = [v for v in vectors if v.get("expected_error")]
+    return ok, bad
+
+
+_CBOR_OK, _CBOR_BAD = _split_vectors(_load_vectors("cbor.json"))
+
+
+# Both encoders run against the vectors, so the in-tree fallback is checked
+# whether or not cbor2 is installed
+_ENCODERS = [
+    "py",
+    pytest.param(
+        "cbor2", marks=pytest.mark.skipif(not _HAS_CBOR2, reason="cbor2 not installed")
+    ),
+]
 
 
 class TestCborVectors:
     """Test CBOR encoding vectors."""
 
-    @pytest.fixture
-    def vectors(self):
-        """Load CBOR test vectors."""
-        vector_file = VECTORS_DIR / "cbor.json"
-        if not vector_file.exists():
-            pytest.skip(f"Test vectors not found at {vector_file}")
-        with open(vector_file) as f:
-            return json.load(f)
-
-    def test_all_cbor_vectors(self, vectors):
-        """Validate all CBOR vectors pass."""
-        for vector in vectors:
-            vid = vector["id"]
-            description = vector["description"]
-            input_hex = vector["input_hex"]
-            expected_hex = vector["expected_hex"]
-            expected_error = vector.get("expected_error")
-
-            input_bytes = hex_decode(input_hex)
-
-            if expected_error:
-                # This vector should fail
-                with pytest.raises(Exception):
-                    decoded = decode_cbor(input_bytes)
-                    encode_cbor(decoded)
-            else:
-                # This vector should succeed and round-trip
-                try:
-                    decoded = decode_cbor(input_bytes)
-                    reencoded = encode_cbor(decoded)
-                    reencoded_hex = hex_encode(reencoded)
+    @pytest.mark.parametrize("encoder", _ENCODERS)
+    @pytest.mark.parametrize("vector", _CBOR_OK, ids=_vector_id)
+    def test_cbor_vector_roundtrips(self, vector, encoder):
+        """A valid vector decodes and re-encodes to the expected bytes."""
+        encode = _encode_cbor2 if encoder == "cbor2" else _encode_cbor_py
+        reencoded = encode(decode_cbor(bytes.fromhex(vector["input_hex"])))
+        assert reencoded.hex() == vector["expected_hex"].lower(), (
+            f"Vector {vector['id']} failed: {vector['description']}"
+        )
 
-                    assert reencoded_hex.lower() == expected_hex.lower(), \
-                        f"Vector {vid} failed: {description}"
-                except Exception as e:
-                    pytest.fail(f"Vector {vid} unexpected failure: {description} - {e}")
+    @pytest.mark.parametrize("vector", _CBOR_BAD, ids=_vector_id)
+    def test_cbor_vector_rejected(self, vector):
+        """An invalid vector fails to decode or encode."""
+        with pytest.raises(Exception):
+            encode_cbor(decode_cbor(bytes.fromhex(vector["input_hex"])))
 
 
 class TestEntityIdVectors:
     """Test Entity ID vectors."""
 
-    @pytest.fixture
-    def vectors(self):
-        """Load Entity ID test vectors."""
-        vector_file = VECTORS_DIR / "entity_id.json"
-        if not vector_file.exists():
-            pytest.skip(f"Test vectors not found at {vector_file}")
-        with open(vector_file) as f:
-            return json.load(f)
-
-    def test_all_entity_id_vectors(self, vectors):
-        """Validate all Entity ID vectors pass."""
-        for vector in vectors:
-            vid = vector["id"]
-            description = vector["description"]
-            input_hex = vector["input_hex"]
-            expected_hex = vector["expected_hex"]
-            expected_error = vector.get("expected_error")
-
-            input_bytes = hex_decode(input_hex)
-
-            if expected_error:
-                # This vector should fail (wrong length)
-                assert len(input_bytes) != 16, \
-                    f"Vector {vid} should fail: {description}"
-            else:
-                # This vector should succeed
-                assert len(input_bytes) == 16
-                roundtripped = hex_encode(input_bytes)
-                assert roundtripped.lower() == expected_hex.lower(), \
-                    f"Vector {vid} failed: {description}"
+    @pytest.mark.parametrize("vector", _load_vectors("entity_id.json"), ids=_vector_id)
+    def test_all_entity_id_vectors(self, vector):
+        """Validate an Entity ID vector."""
+        vid = vector["id"]
+        description = vector["description"]
+        input_hex = vector["input_hex"]
+        expected_hex = vector["expected_hex"]
+        expected_error = vector.get("expected_error")
+
+        input_bytes = bytes.fromhex(input_hex)
+
+        if expected_error:
+            # This vector should fail (wrong length)
+            assert len(input_bytes) != 16, f"Vector {vid} should fail: {description}"
+        else:
+            # This vector should succeed
+            assert len(input_bytes) == 16
+            roundtripped = input_bytes.hex()
+            assert roundtripped.lower() == expected_hex.lower(), (
+                f"Vector {vid} failed: {description}"
+            )
+
+
+# Big-endian integer arguments for additional info 25, 26 and 27
+_UINT_ARGS = (struct.Struct(">H"), struct.Struct(">I"), struct.Struct(">Q"))
 
 
 # Minimal CBOR implementation for testing
-def decode_cbor(data: bytes):
-    """Decode CBOR data (minimal implementation for tests)."""
-    if not data:
-        raise ValueError("Empty CBOR data")
+class _Decoder:
+    """Cursor over CBOR input; state lives in slots rather than closure cells."""
+
+    __slots__ = ("data", "offset")
 
-    offset = 0
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
 
-    def read_byte():
-        nonlocal offset
-        if offset >= len(data):
+    def read_byte(self):
+        if self.offset >= len(self.data):
             raise ValueError("Unexpected end of data")
-        b = data[offset]
-        offset += 1
+        b = self.data[self.offset]
+        self.offset += 1
         return b
 
-    def read_uint(additional_info):
-        nonlocal offset
+    def read_uint(self, additional_info):
         if additional_info < 24:
             return additional_info
         elif additional_info == 24:
-            return read_byte()
-        elif additional_info == 25:
-            return (read_byte() << 8) | read_byte()
-        elif additional_info == 26:
-            return (read_byte() << 24) | (read_byte() << 16) | (read_byte() << 8) | read_byte()
-        elif additional_info == 27:
-            value = 0
-            for _ in range(8):
-                value = (value << 8) | read_byte()
+            return self.read_byte()
+        elif 25 <= additional_info <= 27:
+            # 2, 4 or 8 big-endian bytes
+            reader = _UINT_ARGS[additional_info - 25]
+            if self.offset + reader.size > len(self.data):
+                raise ValueError("Unexpected end of data")
+            (value,) = reader.unpack_from(self.data, self.offset)
+            self.offset += reader.size
             return value
         elif additional_info >= 28:
             raise ValueError("Indefinite-length items are forbidden")
         else:
             raise ValueError(f"Invalid additional info: {additional_info}")
 
-    def decode():
-        nonlocal offset
-        initial = read_byte()
-        major_type = initial >> 5
-        additional_info = initial & 0x1f
+    def read_slice(self, length):
+        start = self.offset
+        self.offset = start + length
+        return self.data[start : self.offset]
+
+    def decode(self):
+        initial = self.read_byte()
+        additional_info = initial & 0x1F
 
         # Check for indefinite-length items
         if additional_info == 31:
             raise ValueError("Indefinite-length items are forbidden")
 
-        if major_type == 0:  # Unsigned integer
-            return read_uint(additional_info)
-        elif major_type == 1:  # Negative integer
-            return -1 - read_uint(additional_info)
-        elif major_type == 2:  # Byte string
-            length = read_uint(additional_info)
-            result = data[offset:offset + length]
-            offset += length
-            return result
-        elif major_type == 3:  # Text string
-            length = read_uint(additional_info)
-            result = data[offset:offset + length].decode("utf-8")
-            offset += length
-            return result
-        elif major_type == 4:  # Array
-            length = read_uint(additional_info)
-            return [decode() for _ in range(length)]
-        elif major_type == 5:  # Map
-            length = read_uint(additional_info)
-            result = {}
-            for _ in range(length):
-                key = decode()
-                value = decode()
-                # Convert mutable types to hashable for dict keys
-                if isinstance(key, list):
-                    key = tuple(key)
-                elif isinstance(key, bytes):
-                    key = key  # bytes are hashable
-                result[key] = value
-            return result
-        elif major_type == 6:  # Tag (not used)
-            raise ValueError("Tags are not supported")
-        elif major_type == 7:  # Simple/float
-            if additional_info == 20:
-                return False
-            elif additional_info == 21:
-                return True
-            elif additional_info == 22:
-                return None
-            elif 25 <= additional_info <= 27:
-                raise ValueError("Floats are not allowed")
-            else:
-                raise ValueError(f"Unknown simple value: {additional_info}")
-        else:
-            raise ValueError(f"Unknown major type: {major_type}")
+        # The major type is 3 bits, so every value indexes the table
+        return _Decoder._DISPATCH[initial >> 5](self, additional_info)
 
-    return decode()
+    def _decode_uint(self, additional_info):
+        return self.read_uint(additional_info)
+
+    def _decode_nint(self, additional_info):
+        return -1 - self.read_uint(additional_info)
+
+    def _decode_bytes(self, additional_info):
+        return self.read_slice(self.read_uint(additional_info))
+
+    def _decode_text(self, additional_info):
+        return self.read_slice(self.read_uint(additional_info)).decode("utf-8")
+
+    def _decode_array(self, additional_info):
+        length = self.read_uint(additional_info)
+        return [self.decode() for _ in range(length)]
+
+    def _decode_map(self, additional_info):
+        length = self.read_uint(additional_info)
+        result = {}
+        for _ in range(length):
+            key = self.decode()
+            value = self.decode()
+            # Convert mutable types to hashable for dict keys
+            if isinstance(key, list):
+                key = tuple(key)
+            result[key] = value
+        return result
+
+    def _decode_tag(self, additional_info):
+        raise ValueError("Tags are not supported")
+
+    def _decode_simple(self, additional_info):
+        if additional_info in _SIMPLE_VALUES:
+            return _SIMPLE_VALUES[additional_info]
+        if 25 <= additional_info <= 27:
+            raise ValueError("Floats are not allowed")
+        raise ValueError(f"Unknown simple value: {additional_info}")
+
+    # Handlers indexed by major type (0-7)
+    _DISPATCH = (
+        _decode_uint,
+        _decode_nint,
+        _decode_bytes,
+        _decode_text,
+        _decode_array,
+        _decode_map,
+        _decode_tag,
+        _decode_simple,
+    )
+
+
+# Simple values (major type 7) that EntiDB accepts
+_SIMPLE_VALUES = {20: False, 21: True, 22: None}
+
+
+def decode_cbor(data: bytes):
+    """Decode CBOR data (minimal implementation for tests)."""
+    if not data:
+        raise ValueError("Empty CBOR data")
+    return _Decoder(data).decode()
+
+
+# Initial byte plus a 1, 2, 4 or 8 byte big-endian argument
+_HEAD_U8 = struct.Struct(">BB")
+_HEAD_U16 = struct.Struct(">BH")
+_HEAD_U32 = struct.Struct(">BI")
+_HEAD_U64 = struct.Struct(">BQ")
 
 
 def encode_cbor(value) -> bytes:
+    """Encode value to canonical CBOR.
+
+    Uses cbor2's C encoder when installed; its canonical mode emits the
+    same shortest-form, length-first key order as the fallback below.
+    Decoding stays in Python because cbor2 accepts floats and
+    indefinite-length items, which EntiDB rejects.
+    """
+    if _HAS_CBOR2:
+        return _encode_cbor2(value)
+    return _encode_cbor_py(value)
+
+
+def _encode_cbor2(value) -> bytes:
+    """Encode value to canonical CBOR with cbor2's C encoder."""
+    return cbor2.dumps(value, canonical=True)
+
+
+def _encode_cbor_py(value) -> bytes:
     """Encode value to canonical CBOR (minimal implementation for tests)."""
     buffer = bytearray()
+    # Bound once: the nested helpers call these for every item
+    append = buffer.append
+    extend = buffer.extend
 
     def write_uint(major_type, val):
         major = major_type << 5
         if val < 24:
-            buffer.append(major | val)
+            append(major | val)
         elif val < 256:
-            buffer.append(major | 24)
-            buffer.append(val)
+            extend(_HEAD_U8.pack(major | 24, val))
         elif val < 65536:
-            buffer.append(major | 25)
-            buffer.append((val >> 8) & 0xff)
-            buffer.append(val & 0xff)
+            extend(_HEAD_U16.pack(major | 25, val))
         elif val < 4294967296:
-            buffer.append(major | 26)
-            buffer.append((val >> 24) & 0xff)
-            buffer.append((val >> 16) & 0xff)
-            buffer.append((val >> 8) & 0xff)
-            buffer.append(val & 0xff)
+            extend(_HEAD_U32.pack(major | 26, val))
         else:
-            buffer.append(major | 27)
-            for i in range(7, -1, -1):
-                buffer.append((val >> (i * 8)) & 0xff)
+            extend(_HEAD_U64.pack(major | 27, val))
 
     def encode(v):
         if v is None:
-            buffer.append(0xf6)
+            append(0xF6)
         elif v is True:
-            buffer.append(0xf5)
+            append(0xF5)
         elif v is False:
-            buffer.append(0xf4)
+            append(0xF4)
         elif isinstance(v, int):
             if v >= 0:
                 write_uint(0, v)
@@ -237,26 +284,31 @@ def encode_cbor(value) -> bytes:
                 write_uint(1, -1 - v)
         elif isinstance(v, bytes):
             write_uint(2, len(v))
-            buffer.extend(v)
+            extend(v)
         elif isinstance(v, str):
             encoded = v.encode("utf-8")
             write_uint(3, len(encoded))
-            buffer.extend(encoded)
+            extend(encoded)
         elif isinstance(v, (list, tuple)):
             write_uint(4, len(v))
             for item in v:
                 encode(item)
         elif isinstance(v, dict):
-            # Sort keys canonically (by encoded bytes)
-            def key_bytes(k):
-                return encode_cbor(k)
-
-            sorted_items = sorted(v.items(), key=lambda x: (len(key_bytes(x[0])), key_bytes(x[0])))
+            write_uint(5, len(v))
+            if all(type(key) is int and 0 <= key < 24 for key in v):
+                # Keys 0..23 encode as the single byte of their value, so
+                # canonical order is plain numeric order
+                for key in sorted(v):
+                    append(key)
+                    encode(v[key])
+            else:
+                # Sort keys canonically (by encoded bytes), encoding each key once
+                items = [(_encode_cbor_py(key), val) for key, val in v.items()]
+                items.sort(key=lambda item: (len(item[0]), item[0]))
 
-            write_uint(5, len(sorted_items))
-            for key, val in sorted_items:
-                encode(key)
-                encode(val)
+                for encoded_key, val in items:
+                    extend(encoded_key)
+                    encode(val)
         else:
             raise TypeError(f"Unsupported type: {type(v)}")
 
@@ -3,7 +3,7 @@
 EntiDB Build and Test Script
 
 This script automates the complete build and test workflow for EntiDB:
-1. Builds Rust crates (including entidb_ffi)
+1. Builds Rust crates (including entidb_ffi) and their tests in one cargo run
 2. Sets up a Python virtual environment for isolated testing
 3. Builds Python bindings using maturin
 4. Runs Python binding tests
@@ -21,7 +21,7 @@ Usage:
     python build_and_test.py [options]
 
 Options:
-    --release           Build in release mode (default: debug)
+    --release           Build and run Rust tests in release mode (default: debug)
     --skip-rust         Skip Rust build (use existing artifacts)
     --skip-rust-tests   Skip Rust tests
     --skip-python       Skip Python bindings build and test
@@ -30,7 +30,12 @@ Options:
     --examples-only     Only run examples (skip tests, requires prior build)
     --python-version    Python version for bindings (default: 3.13)
     --clean-venv        Remove and recreate the Python virtual environment
-    --verbose, -v       Show verbose output
+    --no-parallel-tests Run the Python tests in one process instead of on xdist workers
+    --jobs, -j N        Limit Rust compile jobs and test threads (default: all CPUs)
+    --watch             Rerun the build and tests whenever sources change
+    --serial            Run test and example stages one after another, not in parallel
+    --ci                Print status as JSON lines, without colors (implies --verbose)
+    --verbose, -v       Show verbose output (implies --serial)
     --help              Show this help message
 
 Virtual Environment:
@@ -50,22 +55,49 @@ Examples:
 
     # Quick iteration on Dart only
     python build_and_test.py --skip-rust --skip-python
+
+    # Rerun the tests on every save
+    python build_and_test.py --watch
 """
 
 import argparse
+import functools
+import hashlib
+import io
+import json
 import os
 import platform
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
 import venv
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, NamedTuple
+
+
+# Host OS name, looked up once
+_SYSTEM = platform.system()
+
+# Shared library file name parts for the host (Linux and others use lib*.so)
+_LIB_PREFIX, _LIB_SUFFIX = {
+    "Windows": ("", ".dll"),
+    "Darwin": ("lib", ".dylib"),
+}.get(_SYSTEM, ("lib", ".so"))
+
+# Environment snapshot that per-command overrides are layered onto; the
+# script never modifies os.environ
+_BASE_ENV = dict(os.environ)
 
 
 # Enable ANSI colors on Windows 10+
 def _enable_windows_ansi() -> bool:
     """Enable ANSI escape codes on Windows."""
-    if platform.system() != "Windows":
+    if _SYSTEM != "Windows":
         return True
     try:
         import ctypes
@@ -105,97 +137,300 @@ class Colors:
     BOLD = '\033[1m' if _USE_COLORS else ''
 
 
+# Message prefixes, formatted once
+_STEP_PREFIX = f"\n{Colors.BOLD}{Colors.BLUE}==> "
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.FAIL}✗ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠ "
+_END = Colors.END
+
+
 def print_step(msg: str) -> None:
     """Print a step header."""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}==> {msg}{Colors.END}")
+    print(f"{_STEP_PREFIX}{msg}{_END}")
 
 
 def print_success(msg: str) -> None:
     """Print a success message."""
-    print(f"{Colors.GREEN}✓ {msg}{Colors.END}")
+    print(f"{_SUCCESS_PREFIX}{msg}{_END}")
 
 
 def print_error(msg: str) -> None:
     """Print an error message."""
-    print(f"{Colors.FAIL}✗ {msg}{Colors.END}")
+    print(f"{_ERROR_PREFIX}{msg}{_END}")
 
 
 def print_warning(msg: str) -> None:
     """Print a warning message."""
-    print(f"{Colors.WARNING}⚠ {msg}{Colors.END}")
+    print(f"{_WARNING_PREFIX}{msg}{_END}")
+
+
+def _emit_event(event: str, msg: str) -> None:
+    """Print a message as a single JSON line for CI log parsers."""
+    print(json.dumps({"evt": event, "msg": msg}), flush=True)
+
+
+def use_ci_output() -> None:
+    """Switch the print helpers to JSON lines and turn colors off.
+
+    The helpers are rebound rather than branching on a flag, so normal runs
+    pay nothing for CI mode.
+    """
+    global print_step, print_success, print_error, print_warning
+    print_step = functools.partial(_emit_event, "step")
+    print_success = functools.partial(_emit_event, "success")
+    print_error = functools.partial(_emit_event, "error")
+    print_warning = functools.partial(_emit_event, "warning")
+    for name, value in vars(Colors).items():
+        if isinstance(value, str) and not name.startswith("__"):
+            setattr(Colors, name, "")
+
+
+class CommandResult(NamedTuple):
+    """Exit status and output tail of a finished command."""
+
+    returncode: int
+    # Merged stdout/stderr tail; empty in verbose mode, where output is shown live
+    output: str
 
 
 def run_command(
     cmd: list[str],
     cwd: Path | None = None,
     env: dict | None = None,
-    check: bool = True,
     verbose: bool = False,
     timeout: int | None = None,
-) -> subprocess.CompletedProcess:
-    """Run a command and handle errors."""
+    on_line: Callable[[str], bool] | None = None,
+) -> CommandResult:
+    """Run a command and return its exit status.
+
+    A non-zero exit is not an error here: callers branch on ``returncode``
+    and report failures themselves, usually via ``report_failure``.
+
+    ``on_line`` sees each output line as it arrives; lines it returns True
+    for are consumed and neither shown nor kept in the output tail.
+
+    The executable is resolved to an absolute path and file descriptors are
+    not swept on POSIX, so CPython can start the child with posix_spawn /
+    vfork instead of fork(). Python creates its own descriptors
+    non-inheritable, so skipping close_fds leaks nothing into the child.
+    """
+    if not os.path.isabs(cmd[0]):
+        # Unresolvable names are left alone so subprocess reports them
+        cmd = [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+
     if verbose:
         print(f"  Running: {' '.join(cmd)}")
     
-    merged_env = os.environ.copy()
-    if env:
-        merged_env.update(env)
+    # Without overrides the child inherits our environment as is
+    merged_env = {**_BASE_ENV, **env} if env else None
     
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            env=merged_env,
-            check=check,
-            capture_output=not verbose,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=timeout,
-        )
-        return result
+        # Timeouts go through _run_streamed, which can kill the whole tree
+        if verbose and on_line is None and timeout is None:
+            completed = subprocess.run(
+                cmd,
+                cwd=cwd,
+                env=merged_env,
+                close_fds=_SYSTEM == "Windows",
+                timeout=timeout,
+            )
+            return CommandResult(completed.returncode, "")
+        return _run_streamed(cmd, cwd, merged_env, timeout, echo=verbose, on_line=on_line)
     except subprocess.TimeoutExpired:
         print_error(f"Command timed out: {' '.join(cmd)}")
         raise
-    except subprocess.CalledProcessError as e:
-        print_error(f"Command failed: {' '.join(cmd)}")
-        if e.stdout:
-            print(f"stdout:\n{e.stdout}")
-        if e.stderr:
-            print(f"stderr:\n{e.stderr}")
-        raise
 
 
-def find_executable(name: str, alternatives: list[str] | None = None) -> str | None:
-    """Find an executable in PATH."""
-    candidates = [name] + (alternatives or [])
-    for candidate in candidates:
+def report_failure(message: str, result: CommandResult, verbose: bool) -> None:
+    """Print an error and, unless it was already shown live, the command output."""
+    print_error(message)
+    if not verbose and result.output:
+        print(result.output)
+
+
+def _probe(cmd: list[str]) -> subprocess.CompletedProcess:
+    """Run a short command and capture its output as text.
+
+    Like ``run_command``, it sets no cwd and skips the descriptor sweep so
+    CPython can use posix_spawn; commands that need a directory take it as
+    an argument instead.
+    """
+    return subprocess.run(cmd, capture_output=True, text=True, close_fds=_SYSTEM == "Windows")
+
+
+# Lines of output kept from a quiet command, for error reports
+_OUTPUT_TAIL_LINES = 500
+
+# Lines of output per progress dot
+_LINES_PER_DOT = 50
+
+
+def _run_streamed(
+    cmd: list[str],
+    cwd: Path | None,
+    env: dict | None,
+    timeout: int | None,
+    echo: bool = False,
+    on_line: Callable[[str], bool] | None = None,
+) -> CommandResult:
+    """Run a command quietly, keeping only the tail of its output.
+
+    stdout and stderr are merged and read line by line on a helper thread,
+    so memory stays bounded however much a build prints. A dot goes to
+    stderr every few lines to show the command is still making progress.
+    With ``echo``, lines are printed as they arrive and no tail is kept.
+    Lines ``on_line`` consumes are skipped either way.
+
+    With a timeout on POSIX, the command gets its own session so that on
+    expiry its whole process group (cargo's rustc children included) is
+    killed, not just the direct child. That forgoes posix_spawn, so it is
+    only done when a timeout is set.
+    """
+    own_group = timeout is not None and _SYSTEM != "Windows"
+    tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        close_fds=_SYSTEM == "Windows",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        start_new_session=own_group,
+    ) as process:
+        def read_output() -> None:
+            for count, line in enumerate(process.stdout, 1):
+                if on_line is not None and on_line(line):
+                    continue
+                if echo:
+                    sys.stdout.write(line)
+                    continue
+                tail.append(line)
+                if count % _LINES_PER_DOT == 0:
+                    sys.stderr.write(".")
+                    sys.stderr.flush()
+
+        reader = threading.Thread(target=read_output, daemon=True)
+        reader.start()
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            if own_group:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+            process.wait()
+            raise
+        finally:
+            reader.join()
+
+    return CommandResult(returncode, "".join(tail))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_path_index() -> dict[str, str]:
+    """Map each file name on PATH to its full path, earliest directory first.
+
+    Each PATH directory is listed once with os.scandir, instead of probing
+    every directory (and, on Windows, every PATHEXT suffix) per tool. On
+    Windows, keys are lowercased with the PATHEXT suffix removed.
+    """
+    if _SYSTEM == "Windows":
+        pathext = tuple(ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(";") if ext)
+    index: dict[str, str] = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            entries = os.scandir(directory or os.curdir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if _SYSTEM == "Windows":
+                    stem, ext = os.path.splitext(name.lower())
+                    if ext not in pathext:
+                        continue
+                    name = stem
+                if name not in index:
+                    index[name] = entry.path
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name: str, alternatives: tuple[str, ...] = ()) -> str | None:
+    """Find an executable in PATH.
+
+    Looks names up in a PATH index built once per run, so a miss costs no
+    system calls at all.
+    """
+    index = _build_path_index()
+    for candidate in (name, *alternatives):
+        path = index.get(candidate.lower() if _SYSTEM == "Windows" else candidate)
+        if path is None:
+            continue
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+        # Something that is not an executable file shadows the name;
+        # let shutil.which search the later PATH entries
         path = shutil.which(candidate)
         if path:
             return path
     return None
 
 
-def check_dependencies(skip_rust: bool, skip_python: bool, skip_dart: bool, verbose: bool) -> bool:
+def _load_dep_cache(root: Path) -> dict:
+    """Load cached tool versions, or an empty cache if there is none."""
+    try:
+        return json.loads((root / ".cache" / "tool-versions.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_dep_cache(root: Path, cache: dict) -> None:
+    cache_file = root / ".cache" / "tool-versions.json"
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+
+def _tool_version(tool: str, cache: dict) -> str:
+    """Output of ``tool --version``, reused while the binary is unchanged.
+
+    Entries are keyed by path and invalidated when the file's mtime
+    changes. Some tools (Dart) print the version to stderr.
+    """
+    mtime_ns = os.stat(tool).st_mtime_ns
+    entry = cache.get(tool)
+    if entry and entry["mtime_ns"] == mtime_ns:
+        return entry["version"]
+    result = _probe([tool, "--version"])
+    version = result.stdout.strip() or result.stderr.strip()
+    cache[tool] = {"mtime_ns": mtime_ns, "version": version}
+    return version
+
+
+def check_dependencies(
+    root: Path, skip_rust: bool, skip_python: bool, skip_dart: bool, verbose: bool
+) -> bool:
     """
     Check that required build dependencies are available.
     
-    Returns True if all required dependencies are found.
+    Returns True if all required dependencies are found. Tool versions are
+    cached in .cache/tool-versions.json, so unchanged tools are not run.
     """
     print_step("Checking dependencies")
     all_ok = True
+    versions = _load_dep_cache(root)
     
     # Always need cargo for Rust
     if not skip_rust:
         cargo = find_executable("cargo")
         if cargo:
             if verbose:
-                result = subprocess.run(
-                    [cargo, "--version"],
-                    capture_output=True,
-                    text=True
-                )
-                print_success(f"Found cargo: {result.stdout.strip()}")
+                print_success(f"Found cargo: {_tool_version(cargo, versions)}")
             else:
                 print_success("Found cargo")
         else:
@@ -204,14 +439,9 @@ def check_dependencies(skip_rust: bool, skip_python: bool, skip_dart: bool, verb
     
     # Python checks
     if not skip_python:
-        python = find_executable("python3", ["python"])
+        python = find_executable("python3", ("python",))
         if python:
-            result = subprocess.run(
-                [python, "--version"],
-                capture_output=True,
-                text=True
-            )
-            print_success(f"Found Python: {result.stdout.strip()}")
+            print_success(f"Found Python: {_tool_version(python, versions)}")
         else:
             print_error("python3 not found")
             all_ok = False
@@ -227,24 +457,18 @@ def check_dependencies(skip_rust: bool, skip_python: bool, skip_dart: bool, verb
     if not skip_dart:
         dart = find_executable("dart")
         if dart:
-            result = subprocess.run(
-                [dart, "--version"],
-                capture_output=True,
-                text=True
-            )
-            # Dart prints version to stderr
-            version = result.stderr.strip() or result.stdout.strip()
-            print_success(f"Found Dart: {version}")
+            print_success(f"Found Dart: {_tool_version(dart, versions)}")
         else:
             print_error("dart not found - install from https://dart.dev/get-dart")
             all_ok = False
     
+    _save_dep_cache(root, versions)
     return all_ok
 
 
 def get_venv_python(venv_dir: Path) -> Path:
     """Get the Python executable path inside a virtual environment."""
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         return venv_dir / "Scripts" / "python.exe"
     else:
         return venv_dir / "bin" / "python"
@@ -252,28 +476,50 @@ def get_venv_python(venv_dir: Path) -> Path:
 
 def get_venv_pip(venv_dir: Path) -> Path:
     """Get the pip executable path inside a virtual environment."""
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         return venv_dir / "Scripts" / "pip.exe"
     else:
         return venv_dir / "bin" / "pip"
 
 
+def _venv_site_packages(venv_dir: Path) -> list[Path]:
+    """The venv's site-packages directories (one per Python version on POSIX)."""
+    if _SYSTEM == "Windows":
+        return [venv_dir / "Lib" / "site-packages"]
+    return list((venv_dir / "lib").glob("python*/site-packages"))
+
+
+def _installed_entidb_files(venv_dir: Path) -> list[Path]:
+    """The compiled entidb extension files installed in the venv.
+
+    Looks in site-packages, both at the top level and inside the ``entidb``
+    package maturin creates.
+    """
+    suffix = ".pyd" if _SYSTEM == "Windows" else ".so"
+    return [
+        path
+        for site_packages in _venv_site_packages(venv_dir)
+        for pattern in (f"entidb*{suffix}", f"entidb/entidb*{suffix}")
+        for path in site_packages.glob(pattern)
+    ]
+
+
 def validate_venv_has_entidb(venv_dir: Path) -> bool:
     """Check if the virtual environment has entidb installed."""
     venv_python = get_venv_python(venv_dir)
     if not venv_python.exists():
         return False
     try:
-        result = subprocess.run(
-            [str(venv_python), "-c", "import entidb"],
-            capture_output=True,
-            text=True,
-        )
+        result = _probe([str(venv_python), "-c", "import entidb"])
         return result.returncode == 0
     except Exception:
         return False
 
 
+# Build and test tools installed into the test venv
+_VENV_TOOLS = ("maturin", "pytest", "pytest-xdist")
+
+
 def setup_python_venv(root: Path, python_version: str, verbose: bool) -> Path:
     """
     Set up a Python virtual environment for testing.
@@ -281,154 +527,498 @@ def setup_python_venv(root: Path, python_version: str, verbose: bool) -> Path:
     Returns the path to the virtual environment directory.
     """
     venv_dir = root / ".venv-test"
+    # Records the --python-version the venv was created for and, on the
+    # second line, the tools installed into it
+    version_marker = venv_dir / ".entidb-python-version"
+    tools = " ".join(_VENV_TOOLS)
     
     # Check if venv already exists and is valid
     venv_python = get_venv_python(venv_dir)
     if venv_python.exists():
-        if verbose:
-            print(f"  Using existing virtual environment: {venv_dir}")
-        return venv_dir
-    
-    print_step("Setting up Python virtual environment")
+        created_for, installed = None, None
+        if version_marker.exists():
+            created_for, _, installed = version_marker.read_text().strip().partition("\n")
+        if created_for == python_version and installed == tools:
+            if verbose:
+                print(f"  Using existing virtual environment: {venv_dir}")
+            return venv_dir
+        if created_for is not None and created_for != python_version:
+            print_warning(
+                f"Virtual environment was created for Python {created_for}, recreating for {python_version}"
+            )
+            remove_in_background(venv_dir)
     
+    if not venv_python.exists():
+        print_step("Setting up Python virtual environment")
+        _create_python_venv(root, venv_dir, python_version, verbose)
+    
+    # Install the build and test tools once, in a single resolution, instead
+    # of before every build and test run. A venv without a marker (older
+    # script or interrupted setup) gets them installed here too.
+    install_venv_packages(venv_dir, list(_VENV_TOOLS), verbose)
+    version_marker.write_text(f"{python_version}\n{tools}")
+    return venv_dir
+
+
+def _create_python_venv(root: Path, venv_dir: Path, python_version: str, verbose: bool) -> None:
+    """Create the virtual environment, preferring uv."""
     # Try using uv first (faster)
     uv = find_executable("uv")
     if uv:
         # Create venv with specific Python version using uv
         cmd = [uv, "venv", str(venv_dir), "--python", python_version]
-        try:
-            run_command(cmd, cwd=root, verbose=verbose)
+        if run_command(cmd, cwd=root, verbose=verbose).returncode == 0:
             print_success(f"Created virtual environment with uv: {venv_dir}")
-            return venv_dir
-        except subprocess.CalledProcessError:
-            print_warning(f"Failed to create venv with Python {python_version}, trying system Python")
-            # Fall through to try with system Python
+            return
+        print_warning(f"Failed to create venv with Python {python_version}, trying system Python")
+        # Fall through to try with system Python
     
     # Fall back to standard venv module
-    python = find_executable("python", ["python3"])
+    python = find_executable("python", ("python3",))
     if not python:
         print_error("Python not found. Please install Python 3.8+.")
         sys.exit(1)
     
-    # Create venv using the venv module
+    # Create venv using the venv module. install_venv_packages installs
+    # through uv whenever it is available, so pip is only bootstrapped
+    # (via ensurepip, which takes seconds) when there is no uv.
     try:
-        venv.create(venv_dir, with_pip=True, clear=True)
+        venv.create(venv_dir, with_pip=uv is None, clear=True)
         print_success(f"Created virtual environment: {venv_dir}")
     except Exception as e:
         print_error(f"Failed to create virtual environment: {e}")
         sys.exit(1)
-    
-    return venv_dir
+
+
+def _venv_has_packages(venv_dir: Path, packages: list[str]) -> bool:
+    """Check with importlib.metadata whether all packages are in the venv."""
+    venv_python = get_venv_python(venv_dir)
+    if not venv_python.exists():
+        return False
+    script = "import importlib.metadata as m, sys\nfor p in sys.argv[1:]: m.version(p)"
+    result = _probe([str(venv_python), "-c", script, *packages])
+    return result.returncode == 0
 
 
 def install_venv_packages(venv_dir: Path, packages: list[str], verbose: bool) -> None:
-    """Install packages into the virtual environment."""
+    """Install packages into the virtual environment in a single resolution.
+
+    Nothing is run if the venv already has every package installed.
+    """
+    if _venv_has_packages(venv_dir, packages):
+        if verbose:
+            print(f"  Already installed: {', '.join(packages)}")
+        return
+    
     uv = find_executable("uv")
+    env = None
     
     if uv:
         # Use uv pip for faster installation
         cmd = [uv, "pip", "install", "--python", str(get_venv_python(venv_dir))] + packages
-        run_command(cmd, verbose=verbose)
     else:
         # Use pip from the venv
         pip = get_venv_pip(venv_dir)
         if not pip.exists():
             print_error(f"pip not found in virtual environment: {pip}")
             sys.exit(1)
-        cmd = [str(pip), "install"] + packages
-        run_command(cmd, verbose=verbose)
+        cmd = [str(pip), "install", "--disable-pip-version-check", "--no-input"] + packages
+        # Skip pip's self-update check and interpreter deprecation notices
+        env = {"PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_PYTHON_VERSION_WARNING": "1"}
+    
+    result = run_command(cmd, env=env, verbose=verbose)
+    if result.returncode != 0:
+        report_failure(f"Failed to install {', '.join(packages)}", result, verbose)
+        sys.exit(1)
 
 
-def get_native_lib_path(root: Path, release: bool) -> Path:
-    """Get the path to the built native library."""
+@functools.lru_cache(maxsize=None)
+def _cargo_metadata(root: Path) -> dict | None:
+    """Workspace ``cargo metadata`` (without dependencies), asked once per run.
+
+    Returns None when cargo is unavailable or the call fails.
+    """
+    cargo = find_executable("cargo")
+    if cargo:
+        result = _probe([
+            cargo, "metadata", "--format-version", "1", "--no-deps",
+            "--manifest-path", str(root / "Cargo.toml"),
+        ])
+        if result.returncode == 0:
+            return json.loads(result.stdout)
+    return None
+
+
+def _cargo_target_dir(root: Path) -> Path:
+    """Cargo's target directory, honouring CARGO_TARGET_DIR and config files.
+
+    Falls back to ``root/target`` when cargo is unavailable.
+    """
+    metadata = _cargo_metadata(root)
+    if metadata is not None:
+        return Path(metadata["target_directory"])
+    return root / "target"
+
+
+def _workspace_member_dirs(root: Path) -> list[Path]:
+    """Package directories of the Cargo workspace members.
+
+    Taken from ``cargo metadata`` so new members, such as the Rust examples,
+    are picked up without listing them here; without cargo, falls back to
+    the crates and Rust example directories.
+    """
+    metadata = _cargo_metadata(root)
+    if metadata is not None:
+        return [Path(package["manifest_path"]).parent for package in metadata["packages"]]
+    return [path.parent for path in (*root.glob("crates/*/Cargo.toml"), *root.glob("examples/rust_*/Cargo.toml"))]
+
+
+# File extensions of a cdylib across platforms
+_NATIVE_LIB_SUFFIXES = (".so", ".dylib", ".dll")
+
+
+def _native_lib_record(root: Path, release: bool) -> Path:
+    """File recording where cargo last reported the entidb_ffi cdylib."""
     build_type = "release" if release else "debug"
-    target_dir = root / "target" / build_type
+    return _cargo_target_dir(root) / build_type / ".entidb-ffi-artifact"
+
+
+def get_native_lib_path(root: Path, release: bool) -> Path:
+    """Get the path to the built native library.
+
+    Prefers the path cargo reported for the last build; the platform's
+    default file name is only a fallback for trees built by other means.
+    """
+    record = _native_lib_record(root, release)
+    if record.exists():
+        return Path(record.read_text(encoding="utf-8"))
     
-    system = platform.system()
-    if system == "Windows":
-        return target_dir / "entidb_ffi.dll"
-    elif system == "Darwin":
-        return target_dir / "libentidb_ffi.dylib"
-    else:  # Linux and others
-        return target_dir / "libentidb_ffi.so"
+    build_type = "release" if release else "debug"
+    return _cargo_target_dir(root) / build_type / f"{_LIB_PREFIX}entidb_ffi{_LIB_SUFFIX}"
+
 
+def _tree_hash(root: Path, paths: list[Path]) -> str:
+    """Hash the names, mtimes and sizes of a set of files.
 
-def build_rust(root: Path, release: bool, verbose: bool) -> Path:
-    """Build Rust crates including entidb_ffi."""
+    Reading metadata rather than contents keeps this cheap on every run;
+    touching a file counts as a change, which only costs a rebuild.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        st = path.stat()
+        digest.update(f"{path.relative_to(root).as_posix()}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _rust_sources(root: Path) -> list[Path]:
+    """Files that feed the Rust workspace build, across every member."""
+    paths = [root / "Cargo.toml"]
+    for member in _workspace_member_dirs(root):
+        paths.extend(member.glob("**/*.rs"))
+        paths.append(member / "Cargo.toml")
+    lock = root / "Cargo.lock"
+    if lock.exists():
+        paths.append(lock)
+    return paths
+
+
+def _python_sources(root: Path) -> list[Path]:
+    """Files that feed the Python extension build, including the core crates."""
+    python_dir = root / "bindings" / "python" / "entidb_py"
+    # entidb_py is itself a workspace member, so dedupe its sources
+    return list({
+        *_rust_sources(root),
+        *python_dir.glob("src/**/*.rs"),
+        python_dir / "Cargo.toml",
+        python_dir / "pyproject.toml",
+    })
+
+
+def _stamp_path(root: Path, release: bool, name: str) -> Path:
+    build_type = "release" if release else "debug"
+    return _cargo_target_dir(root) / build_type / f".entidb-{name}.stamp"
+
+
+def _stamp_is_current(stamp: Path, key: str) -> bool:
+    try:
+        return stamp.read_text(encoding="utf-8") == key
+    except OSError:
+        return False
+
+
+def _write_stamp(stamp: Path, key: str) -> None:
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.write_text(key, encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _sccache_env(root: Path) -> tuple[tuple[str, str], ...]:
+    """Environment that makes sccache the rustc wrapper, if it is installed.
+
+    The cache lives in ``root/.cache/sccache`` unless SCCACHE_DIR is already
+    set, so it is per-repo and survives ``cargo clean``. Returned as a tuple
+    so the result can be cached; every cargo call must use the same wrapper
+    or cargo treats earlier artifacts as stale.
+    """
+    sccache = find_executable("sccache")
+    if not sccache or "RUSTC_WRAPPER" in os.environ:
+        return ()
+    env = [("RUSTC_WRAPPER", sccache)]
+    if "SCCACHE_DIR" not in os.environ:
+        env.append(("SCCACHE_DIR", str(root / ".cache" / "sccache")))
+    return tuple(env)
+
+
+def _cargo_env(root: Path, release: bool, verbose: bool, jobs: int | None = None) -> dict[str, str]:
+    """Environment overrides shared by every cargo invocation.
+
+    Incremental compilation is pinned on for debug builds, which are rebuilt
+    after every edit, and off for release builds, where it bloats target/
+    and hurts codegen. A CARGO_INCREMENTAL already in the environment wins.
+
+    ``jobs`` caps both rustc jobs and test threads; without it cargo and
+    the test harness use every CPU (or CARGO_BUILD_JOBS/RUST_TEST_THREADS).
+    """
+    env = dict(_sccache_env(root))
+    if jobs is not None:
+        env["CARGO_BUILD_JOBS"] = str(jobs)
+        env["RUST_TEST_THREADS"] = str(jobs)
+    if "CARGO_INCREMENTAL" not in os.environ:
+        env["CARGO_INCREMENTAL"] = "0" if release else "1"
+    if not verbose:
+        # Output goes to a pipe; don't let cargo draw a progress bar into it
+        env["CARGO_TERM_PROGRESS_WHEN"] = "never"
+    return env
+
+
+def build_rust(
+    root: Path, release: bool, verbose: bool, with_tests: bool = False, jobs: int | None = None
+) -> Path | None:
+    """Build Rust crates including entidb_ffi.
+
+    With ``with_tests``, the whole workspace and its test binaries are built
+    in the same cargo invocation, so ``run_rust_tests`` finds everything
+    compiled and cargo resolves the dependency graph once instead of twice.
+
+    Skipped when a stamp shows the sources are unchanged since the last
+    successful build and the library is still in place. Returns None if
+    the build fails.
+    """
     print_step("Building Rust crates")
     
+    lib_path = get_native_lib_path(root, release)
+    stamp = _stamp_path(root, release, "rust")
+    key = f"{_tree_hash(root, _rust_sources(root))}\nrelease={release}\ntests={with_tests}\n"
+    if lib_path.exists() and _stamp_is_current(stamp, key):
+        print_success(f"Native library up to date (cache hit): {lib_path}")
+        return lib_path
+    
     cargo = find_executable("cargo")
     if not cargo:
         print_error("cargo not found. Please install Rust toolchain.")
-        sys.exit(1)
+        return None
     
-    cmd = [cargo, "build", "-p", "entidb_ffi"]
+    if with_tests:
+        # --lib builds every library crate type, including the FFI cdylib
+        cmd = [cargo, "build", "--workspace", "--exclude", "entidb_py", "--lib", "--bins", "--tests"]
+    else:
+        cmd = [cargo, "build", "-p", "entidb_ffi"]
     if release:
         cmd.append("--release")
+    # Artifact paths come back as JSON on stdout; diagnostics stay readable
+    cmd.append("--message-format=json-render-diagnostics")
     
-    run_command(cmd, cwd=root, verbose=verbose)
+    artifacts: list[Path] = []
     
-    lib_path = get_native_lib_path(root, release)
-    if lib_path.exists():
-        print_success(f"Built native library: {lib_path}")
-    else:
-        print_error(f"Expected library not found: {lib_path}")
-        sys.exit(1)
+    def collect_artifact(line: str) -> bool:
+        if not line.startswith("{"):
+            return False
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            # e.g. a build script printing its own braces; show it as output
+            return False
+        target = message.get("target") or {}
+        if (
+            message.get("reason") == "compiler-artifact"
+            and target.get("name") == "entidb_ffi"
+            and "cdylib" in target.get("crate_types", ())
+        ):
+            artifacts.extend(
+                Path(name) for name in message.get("filenames", ()) if name.endswith(_NATIVE_LIB_SUFFIXES)
+            )
+        return True
+    
+    cargo_env = _cargo_env(root, release, verbose, jobs)
+    if "RUSTC_WRAPPER" in cargo_env:
+        print_success("Using sccache (see 'sccache --show-stats' for cache hits)")
+    
+    result = run_command(cmd, cwd=root, env=cargo_env, verbose=verbose, on_line=collect_artifact)
+    if result.returncode != 0:
+        report_failure("Rust build failed", result, verbose)
+        return None
+    
+    if not artifacts:
+        print_error("cargo did not report an entidb_ffi library")
+        return None
+    lib_path = artifacts[0]
+    _write_stamp(_native_lib_record(root, release), str(lib_path))
+    _write_stamp(stamp, key)
+    print_success(f"Built native library: {lib_path}")
     
     return lib_path
 
 
-def build_python_bindings(root: Path, venv_dir: Path, release: bool, verbose: bool) -> None:
-    """Build Python bindings using maturin into the virtual environment."""
+def build_python_bindings(
+    root: Path, venv_dir: Path, release: bool, verbose: bool, jobs: int | None = None
+) -> bool:
+    """Build Python bindings using maturin into the virtual environment.
+
+    Skipped when a stamp shows the sources are unchanged since the last
+    successful build into this venv, and that build installed exactly the
+    extension files present now and passed an import check.
+    """
     print_step("Building Python bindings")
     
     python_dir = root / "bindings" / "python" / "entidb_py"
     venv_python = get_venv_python(venv_dir)
     
-    # Ensure maturin is installed in the venv
-    install_venv_packages(venv_dir, ["maturin"], verbose)
+    stamp = _stamp_path(root, release, "python")
+    # The venv's version marker is rewritten whenever the venv is recreated
+    inputs = _python_sources(root)
+    version_marker = venv_dir / ".entidb-python-version"
+    if version_marker.exists():
+        inputs.append(version_marker)
+    sources_key = f"{_tree_hash(root, inputs)}\nrelease={release}\nvenv={venv_dir}\n"
+
+    def installed_key() -> str:
+        # A reinstalled or removed extension invalidates the cached import check
+        files = sorted(_installed_entidb_files(venv_dir))
+        return sources_key + "".join(
+            f"installed={path}\0{path.stat().st_mtime_ns}\0{path.stat().st_size}\n" for path in files
+        )
+
+    if _stamp_is_current(stamp, installed_key()):
+        print_success("Python bindings up to date (cache hit)")
+        return True
     
     # Run maturin develop using the venv Python
     # Use VIRTUAL_ENV env var to ensure maturin installs to our venv
-    # This is needed because maturin may create its own .venv otherwise
-    env = {"VIRTUAL_ENV": str(venv_dir)}
+    # This is needed because maturin may create its own .venv otherwise.
+    # maturin drives cargo, so it gets the same wrapper and incremental
+    # settings as the cargo builds sharing the target directory.
+    env = {**_cargo_env(root, release, verbose, jobs), "VIRTUAL_ENV": str(venv_dir)}
     
     cmd = [str(venv_python), "-m", "maturin", "develop"]
     if release:
         cmd.append("--release")
-    run_command(cmd, cwd=python_dir, env=env, verbose=verbose)
+    result = run_command(cmd, cwd=python_dir, env=env, verbose=verbose)
+    if result.returncode != 0:
+        report_failure("Python bindings build failed", result, verbose)
+        return False
+    if not validate_venv_has_entidb(venv_dir):
+        print_error("Python bindings built, but 'import entidb' fails in the venv")
+        return False
     
+    _write_stamp(stamp, installed_key())
     print_success("Python bindings built successfully")
-
-
-def test_python_bindings(root: Path, venv_dir: Path, verbose: bool) -> bool:
-    """Run Python binding tests using the virtual environment."""
+    return True
+
+
+def test_python_bindings(
+    root: Path,
+    venv_dir: Path,
+    verbose: bool,
+    failed_first: bool = False,
+    parallel: bool = True,
+) -> bool:
+    """Run Python binding tests using the virtual environment.
+
+    With ``parallel``, tests are spread over one xdist worker per CPU,
+    grouped by class so class-scoped fixtures are shared. pytest's cache
+    lives in .cache/pytest under the root, and ``failed_first`` runs the
+    last failures first.
+    """
     print_step("Running Python binding tests")
     
     python_dir = root / "bindings" / "python" / "entidb_py"
     venv_python = get_venv_python(venv_dir)
     
-    # Ensure pytest is installed
-    install_venv_packages(venv_dir, ["pytest"], verbose)
-    
     # Run pytest using the venv Python
-    cmd = [str(venv_python), "-m", "pytest", "-v"]
-    result = run_command(cmd, cwd=python_dir, verbose=verbose, check=False)
+    cmd = [str(venv_python), "-m", "pytest", "-v", "-o", f"cache_dir={root / '.cache' / 'pytest'}"]
+    if parallel:
+        cmd += ["-n", "auto", "--dist", "loadscope"]
+    if failed_first:
+        cmd.append("--ff")
+    result = run_command(cmd, cwd=python_dir, verbose=verbose)
     
     if result.returncode == 0:
         print_success("Python tests passed")
         return True
     else:
-        print_error("Python tests failed")
-        if not verbose and result.stdout:
-            print(result.stdout)
-        if not verbose and result.stderr:
-            print(result.stderr)
+        report_failure("Python tests failed", result, verbose)
         return False
 
 
-def test_dart_bindings(root: Path, lib_path: Path, verbose: bool) -> bool:
-    """Run Dart binding tests."""
+def _pubspec_hash(package_dir: Path) -> str:
+    """Hash pubspec.yaml and pubspec.lock (if present)."""
+    digest = hashlib.sha256()
+    for name in ("pubspec.yaml", "pubspec.lock"):
+        path = package_dir / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def dart_pub_get(dart: str, package_dir: Path, verbose: bool) -> bool:
+    """Run ``dart pub get`` unless the pubspec is unchanged since the last run.
+
+    The hash of pubspec.yaml and pubspec.lock is recorded after a successful
+    run, when the lockfile is up to date, and compared on the next call.
+    """
+    stamp = package_dir / ".dart_tool" / ".entidb_pub_stamp"
+    package_config = package_dir / ".dart_tool" / "package_config.json"
+    if package_config.exists() and _stamp_is_current(stamp, _pubspec_hash(package_dir)):
+        if verbose:
+            print(f"  Dependencies up to date: {package_dir}")
+        return True
+    
+    result = run_command([dart, "pub", "get"], cwd=package_dir, verbose=verbose)
+    if result.returncode != 0:
+        report_failure(f"dart pub get failed in {package_dir}", result, verbose)
+        return False
+    _write_stamp(stamp, _pubspec_hash(package_dir))
+    return True
+
+
+def _dart_bindings_dir(root: Path) -> Path:
+    return root / "bindings" / "dart" / "entidb_dart"
+
+
+def prefetch_dart_dependencies(root: Path) -> Future[bool] | None:
+    """Start ``dart pub get`` for the bindings on a background thread.
+
+    Fetching packages is network and disk bound, so it can overlap the
+    CPU-bound Rust build. Returns None if the Dart SDK is not installed.
+    """
+    dart = find_executable("dart")
+    if not dart:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(dart_pub_get, dart, _dart_bindings_dir(root), False)
+    executor.shutdown(wait=False)
+    return future
+
+
+def test_dart_bindings(
+    root: Path, lib_path: Path, verbose: bool, dependencies: Future[bool] | None = None
+) -> bool:
+    """Run Dart binding tests.
+
+    ``dependencies`` is a pending ``prefetch_dart_dependencies`` result; if
+    not given, ``dart pub get`` runs here first.
+    """
     print_step("Running Dart binding tests")
     
     dart = find_executable("dart")
@@ -436,33 +1026,46 @@ def test_dart_bindings(root: Path, lib_path: Path, verbose: bool) -> bool:
         print_warning("Dart SDK not found. Skipping Dart tests.")
         return True
     
-    dart_dir = root / "bindings" / "dart" / "entidb_dart"
+    dart_dir = _dart_bindings_dir(root)
     
     # Get dependencies first
-    run_command([dart, "pub", "get"], cwd=dart_dir, verbose=verbose)
+    if dependencies is not None:
+        if not dependencies.result():
+            return False
+    elif not dart_pub_get(dart, dart_dir, verbose):
+        return False
     
     # Set environment variable for library path
     env = {"ENTIDB_LIB_PATH": str(lib_path)}
     
     cmd = [dart, "test", "-r", "expanded"]
-    result = run_command(cmd, cwd=dart_dir, env=env, verbose=verbose, check=False)
+    result = run_command(cmd, cwd=dart_dir, env=env, verbose=verbose)
     
     if result.returncode == 0:
         print_success("Dart tests passed")
         return True
     else:
-        print_error("Dart tests failed")
-        if not verbose and result.stdout:
-            print(result.stdout)
-        if not verbose and result.stderr:
-            print(result.stderr)
+        report_failure("Dart tests failed", result, verbose)
         return False
 
 
-def run_rust_tests(root: Path, verbose: bool) -> bool:
-    """Run Rust tests."""
+def run_rust_tests(root: Path, release: bool, verbose: bool, jobs: int | None = None) -> bool:
+    """Run Rust tests.
+
+    Uses the same profile as ``build_rust`` so the test binaries it built
+    are reused rather than compiled again. Skipped entirely when nothing the
+    Rust tests read has changed since they last passed, e.g. when only
+    binding code or docs were edited.
+    """
     print_step("Running Rust tests")
     
+    stamp = _stamp_path(root, release, "rust-tests")
+    inputs = [*_rust_sources(root), *root.glob("docs/test_vectors/*.json")]
+    key = f"{_tree_hash(root, inputs)}\nrelease={release}\n"
+    if _stamp_is_current(stamp, key):
+        print_warning("Skipping Rust tests: no relevant changes since they last passed")
+        return True
+    
     cargo = find_executable("cargo")
     if not cargo:
         print_error("cargo not found")
@@ -470,21 +1073,90 @@ def run_rust_tests(root: Path, verbose: bool) -> bool:
     
     # Exclude Python binding (entidb_py) from workspace tests since it requires
     # a specific Python version that pyo3 supports
+    cmd = [cargo, "test", "--workspace", "--exclude", "entidb_py", "--no-fail-fast"]
+    if release:
+        cmd.append("--release")
     result = run_command(
-        [cargo, "test", "--workspace", "--exclude", "entidb_py"],
+        cmd,
         cwd=root,
+        env=_cargo_env(root, release, verbose, jobs),
         verbose=verbose,
-        check=False,
     )
     
     if result.returncode == 0:
+        _write_stamp(stamp, key)
         print_success("Rust tests passed")
         return True
     else:
-        print_error("Rust tests failed")
+        report_failure("Rust tests failed", result, verbose)
         return False
 
 
+class _StageOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that lets worker threads buffer their output.
+
+    Threads that registered a buffer write into it; everything else goes
+    straight to the real stdout.
+    """
+
+    def __init__(self, target) -> None:
+        self.target = target
+        self._local = threading.local()
+
+    def set_buffer(self, buffer: io.StringIO | None) -> None:
+        self._local.buffer = buffer
+
+    def write(self, s: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self.target.write(s)
+        return buffer.write(s)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def isatty(self) -> bool:
+        return self.target.isatty()
+
+
+def run_stages(stages: list[Callable[[], bool]], parallel: bool) -> bool:
+    """
+    Run independent test or example stages and return True if all of them passed.
+
+    In parallel mode each stage runs on its own thread. Its output is
+    buffered and printed as one block when it finishes, so the output of
+    concurrent stages does not interleave. Every stage runs even if an
+    earlier one fails.
+    """
+    if not parallel or len(stages) < 2:
+        results = [stage() for stage in stages]
+        return all(results)
+
+    output = _StageOutput(sys.stdout)
+    print_lock = threading.Lock()
+
+    def run_buffered(stage: Callable[[], bool]) -> bool:
+        buffer = io.StringIO()
+        output.set_buffer(buffer)
+        try:
+            return stage()
+        finally:
+            output.set_buffer(None)
+            with print_lock:
+                output.target.write(buffer.getvalue())
+                output.target.flush()
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [executor.submit(run_buffered, stage) for stage in stages]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = output.target
+
+    return all(results)
+
+
 def run_rust_examples(root: Path, verbose: bool) -> bool:
     """Run Rust examples."""
     print_step("Running Rust examples")
@@ -508,13 +1180,12 @@ def run_rust_examples(root: Path, verbose: bool) -> bool:
             [cargo, "run"],
             cwd=example_dir,
             verbose=verbose,
-            check=False,
         )
         
         if result.returncode == 0:
             print_success(f"{example} completed successfully")
         else:
-            print_error(f"{example} failed")
+            report_failure(f"{example} failed", result, verbose)
             all_passed = False
     
     return all_passed
@@ -545,17 +1216,12 @@ def run_python_examples(root: Path, venv_dir: Path, verbose: bool) -> bool:
             [str(venv_python), str(main_file)],
             cwd=example_dir,
             verbose=verbose,
-            check=False,
         )
         
         if result.returncode == 0:
             print_success(f"{example} completed successfully")
         else:
-            print_error(f"{example} failed")
-            if not verbose and result.stdout:
-                print(result.stdout)
-            if not verbose and result.stderr:
-                print(result.stderr)
+            report_failure(f"{example} failed", result, verbose)
             all_passed = False
     
     return all_passed
@@ -584,32 +1250,159 @@ def run_dart_examples(root: Path, lib_path: Path, verbose: bool) -> bool:
         print(f"  Running {example}...")
         
         # Get dependencies first
-        run_command([dart, "pub", "get"], cwd=example_dir, verbose=verbose)
+        if not dart_pub_get(dart, example_dir, verbose):
+            all_passed = False
+            continue
         
         # Set environment variable for library path
         env = {"ENTIDB_LIB_PATH": str(lib_path)}
         
+        # Dependencies were resolved just above; skip dart run's implicit pub get
         result = run_command(
-            [dart, "run", str(main_file)],
+            [dart, "run", "--no-pub", str(main_file)],
             cwd=example_dir,
             env=env,
             verbose=verbose,
-            check=False,
         )
         
         if result.returncode == 0:
             print_success(f"{example} completed successfully")
         else:
-            print_error(f"{example} failed")
-            if not verbose and result.stdout:
-                print(result.stdout)
-            if not verbose and result.stderr:
-                print(result.stderr)
+            report_failure(f"{example} failed", result, verbose)
             all_passed = False
     
     return all_passed
 
 
+def build_and_run_tests(
+    root: Path, args: argparse.Namespace, venv_dir: Path | None
+) -> tuple[Path | None, bool]:
+    """Build the native library, then run the Rust, Python and Dart test stages.
+
+    Returns the native library path (None if it could not be built or
+    found) and whether every stage passed.
+    """
+    # Verbose output from pub get would interleave with cargo's, so it only
+    # overlaps the Rust build in quiet mode
+    dart_dependencies = None
+    if not args.skip_dart and not args.verbose:
+        dart_dependencies = prefetch_dart_dependencies(root)
+    
+    if not args.skip_rust:
+        lib_path = build_rust(
+            root, args.release, args.verbose, with_tests=not args.skip_rust_tests, jobs=args.jobs
+        )
+        if lib_path is None:
+            return None, False
+    else:
+        lib_path = get_native_lib_path(root, args.release)
+        if lib_path.exists():
+            print_step("Using existing Rust build")
+            print_success(f"Found native library: {lib_path}")
+        else:
+            print_error(f"Native library not found: {lib_path}")
+            print_error("Run without --skip-rust to build it first.")
+            return None, False
+    
+    # maturin compiles into the same target directory as the Rust tests, and
+    # concurrent cargo runs there just wait on each other's lock, so the
+    # bindings are built before the test stages start
+    python_built = False
+    if not args.skip_python and venv_dir is not None:
+        python_built = build_python_bindings(root, venv_dir, args.release, args.verbose, args.jobs)
+    
+    # The remaining stages don't compile into the target directory, so they
+    # run as independent stages
+    stages: list[Callable[[], bool]] = []
+    
+    if not args.skip_rust_tests:
+        stages.append(lambda: run_rust_tests(root, args.release, args.verbose, args.jobs))
+    
+    if python_built:
+        stages.append(
+            lambda: test_python_bindings(
+                root,
+                venv_dir,
+                args.verbose,
+                failed_first=args.watch,
+                parallel=not args.no_parallel_tests,
+            )
+        )
+    
+    if not args.skip_dart:
+        stages.append(
+            lambda: test_dart_bindings(root, lib_path, args.verbose, dart_dependencies)
+        )
+    
+    # Verbose mode streams subprocess output straight to the terminal, which
+    # cannot be buffered per stage, so stages run one after another
+    passed = run_stages(stages, parallel=not (args.verbose or args.serial))
+    python_failed = not args.skip_python and venv_dir is not None and not python_built
+    return lib_path, passed and not python_failed
+
+
+# Seconds between checks for changed sources in --watch mode
+_WATCH_INTERVAL = 1.0
+
+
+def _watched_sources(root: Path) -> list[Path]:
+    """Files whose changes trigger a rerun in --watch mode."""
+    python_tests = root / "bindings" / "python" / "entidb_py" / "tests"
+    dart_dir = _dart_bindings_dir(root)
+    paths = [
+        *_python_sources(root),
+        *python_tests.glob("**/*.py"),
+        *dart_dir.glob("lib/**/*.dart"),
+        *dart_dir.glob("test/**/*.dart"),
+        dart_dir / "pubspec.yaml",
+    ]
+    return [path for path in paths if path.exists()]
+
+
+def watch(root: Path, run_once: Callable[[], bool]) -> int:
+    """Call ``run_once`` whenever a watched source changes, until Ctrl+C.
+
+    The script stays alive between runs, so tool lookups, cargo metadata
+    and the build and dependency stamps carry over, and each edit only pays
+    for the steps it invalidates.
+    """
+    last = _tree_hash(root, _watched_sources(root))
+    try:
+        while True:
+            print_step("Watching for changes (Ctrl+C to stop)")
+            current = last
+            while current == last:
+                time.sleep(_WATCH_INTERVAL)
+                current = _tree_hash(root, _watched_sources(root))
+            last = current
+            run_once()
+    except KeyboardInterrupt:
+        return 0
+
+
+def remove_in_background(path: Path) -> None:
+    """Move a directory out of the way and delete it on a background thread.
+
+    The rename is a single system call, so whatever recreates ``path`` can
+    start at once. The thread is not a daemon: the script waits for the
+    deletion before exiting. Only the directory renamed here is deleted;
+    another run may still be removing its own trash next to it. Falls back
+    to deleting in place if the rename fails (e.g. a file is open on
+    Windows).
+    """
+    # Unique per call, so repeated removals in one --watch session don't clash
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}.{time.monotonic_ns()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, name=f"remove {path.name}"
+    ).start()
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -662,6 +1455,32 @@ def main() -> int:
         action="store_true",
         help="Remove and recreate the Python virtual environment",
     )
+    parser.add_argument(
+        "--no-parallel-tests",
+        action="store_true",
+        help="Run the Python tests in a single pytest process (for debugging)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        metavar="N",
+        help="Limit Rust compile jobs and test threads to N (default: all CPUs)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the first run, rebuild and rerun the tests whenever sources change",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run the Rust, Python and Dart test and example stages one after another",
+    )
+    parser.add_argument(
+        "--ci",
+        action="store_true",
+        help="CI mode: JSON-line status messages, no colors, tool output passed through",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -670,6 +1489,12 @@ def main() -> int:
     
     args = parser.parse_args()
     
+    if args.ci:
+        use_ci_output()
+        # Tool output goes straight to the CI log instead of being captured,
+        # which also means stages run one after another
+        args.verbose = True
+    
     # Find project root (where this script is located)
     root = Path(__file__).parent.resolve()
     
@@ -677,15 +1502,22 @@ def main() -> int:
     venv_path = root / ".venv-test"
     if args.clean_venv and venv_path.exists():
         print_step("Cleaning existing virtual environment")
-        shutil.rmtree(venv_path)
+        remove_in_background(venv_path)
         print_success("Removed old virtual environment")
     
     # Determine mode
     examples_only = args.examples_only
     run_examples = args.run_examples or examples_only
-    run_tests = not examples_only
     
     # Validate mode combinations
+    if args.jobs is not None and args.jobs < 1:
+        print_error("--jobs must be at least 1.")
+        return 1
+    
+    if args.watch and run_examples:
+        print_error("--watch reruns the tests only; it cannot be combined with examples.")
+        return 1
+    
     if examples_only and args.clean_venv and not args.skip_python:
         print_error("Cannot use --clean-venv with --examples-only (no way to rebuild).")
         print_error("Either remove --clean-venv or run a full build first.")
@@ -707,7 +1539,7 @@ def main() -> int:
     
     # Dependency check (skip in examples-only mode since we just run existing builds)
     if not examples_only:
-        if not check_dependencies(args.skip_rust, args.skip_python, args.skip_dart, args.verbose):
+        if not check_dependencies(root, args.skip_rust, args.skip_python, args.skip_dart, args.verbose):
             print_error("Missing required dependencies. Install them and try again.")
             return 1
     
@@ -734,54 +1566,34 @@ def main() -> int:
             print_success(f"Found virtual environment: {venv_dir}")
         else:
             print_warning("No virtual environment found. Python examples will be skipped.")
-    elif not args.skip_rust:
-        lib_path = build_rust(root, args.release, args.verbose)
     else:
-        lib_path = get_native_lib_path(root, args.release)
-        if lib_path.exists():
-            print_step("Using existing Rust build")
-            print_success(f"Found native library: {lib_path}")
-        else:
-            print_error(f"Native library not found: {lib_path}")
-            print_error("Run without --skip-rust to build it first.")
-            return 1
-    
-    # Run Rust tests
-    if run_tests and not args.skip_rust_tests:
-        if not run_rust_tests(root, args.verbose):
-            all_passed = False
-    
-    # Build and test Python bindings
-    if run_tests and not args.skip_python:
-        try:
+        if not args.skip_python:
             # Set up virtual environment (clean_venv already handled above)
             venv_dir = setup_python_venv(root, args.python_version, args.verbose)
-            
-            # Build and test
-            build_python_bindings(root, venv_dir, args.release, args.verbose)
-            if not test_python_bindings(root, venv_dir, args.verbose):
-                all_passed = False
-        except subprocess.CalledProcessError:
-            all_passed = False
-    
-    # Test Dart bindings
-    if run_tests and not args.skip_dart:
-        if not test_dart_bindings(root, lib_path, args.verbose):
-            all_passed = False
+        
+        lib_path, all_passed = build_and_run_tests(root, args, venv_dir)
+        
+        # A failed first run is just another edit away from passing
+        if args.watch:
+            return watch(root, lambda: build_and_run_tests(root, args, venv_dir)[1])
+        if lib_path is None:
+            return 1
     
     # Run examples
     if run_examples:
         print(f"\n{Colors.BOLD}{Colors.CYAN}--- Running Examples ---{Colors.END}\n")
         
+        # Each language's examples are independent of the others', so they
+        # run as parallel stages like the tests
+        example_stages: list[Callable[[], bool]] = []
+        
         # Rust examples (always available, they use workspace deps)
-        if not run_rust_examples(root, args.verbose):
-            all_passed = False
+        example_stages.append(lambda: run_rust_examples(root, args.verbose))
         
         # Python examples (need venv with entidb)
         if not args.skip_python and venv_dir is not None:
             if validate_venv_has_entidb(venv_dir):
-                if not run_python_examples(root, venv_dir, args.verbose):
-                    all_passed = False
+                example_stages.append(lambda: run_python_examples(root, venv_dir, args.verbose))
             else:
                 print_warning("Skipping Python examples (entidb not installed in venv)")
                 print_warning("Run without --examples-only to build Python bindings first.")
@@ -790,8 +1602,14 @@ def main() -> int:
         
         # Dart examples (need native library)
         if not args.skip_dart:
-            if not run_dart_examples(root, lib_path, args.verbose):
-                all_passed = False
+            example_stages.append(lambda: run_dart_examples(root, lib_path, args.verbose))
+        
+        if not run_stages(example_stages, parallel=not (args.verbose or args.serial)):
+            all_passed = False
+    
+    if args.ci:
+        _emit_event("result", "passed" if all_passed else "failed")
+        return 0 if all_passed else 1
     
     # Summary
     print(f"\n{Colors.BOLD}")
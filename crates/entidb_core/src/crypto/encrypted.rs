@@ -2,7 +2,7 @@
 
 use crate::error::{CoreError, CoreResult};
 use aes_gcm::{
-    aead::{generic_array::GenericArray, Aead, KeyInit},
+    aead::{generic_array::GenericArray, AeadInPlace, KeyInit},
     Aes256Gcm, Nonce,
 };
 use rand::RngCore;
@@ -15,6 +15,50 @@ pub const NONCE_SIZE: usize = 12;
 /// Size of the GCM authentication tag in bytes.
 pub const TAG_SIZE: usize = 16;
 
+/// Returns the size of the output of encrypting `plaintext_len` bytes.
+///
+/// The output is `nonce (12 bytes) || ciphertext || tag (16 bytes)`.
+#[must_use]
+pub const fn encrypted_len(plaintext_len: usize) -> usize {
+    NONCE_SIZE + plaintext_len + TAG_SIZE
+}
+
+/// Returns the plaintext size for a ciphertext of `ciphertext_len` bytes.
+///
+/// Returns `None` if the ciphertext is too short to hold a nonce and tag.
+#[must_use]
+pub const fn decrypted_len(ciphertext_len: usize) -> Option<usize> {
+    ciphertext_len.checked_sub(NONCE_SIZE + TAG_SIZE)
+}
+
+/// Name of the AEAD algorithm used for all encryption.
+///
+/// The algorithm is fixed, not chosen per CPU: ciphertext written on one
+/// machine must decrypt on any other.
+pub const ALGORITHM: &str = "aes256gcm";
+
+/// Returns `true` if the CPU has AES and carry-less multiply instructions.
+///
+/// The `aes` and `ghash` backends detect these at runtime and use them
+/// automatically, falling back to constant-time software otherwise. This
+/// only reports what was detected, for diagnostics.
+#[must_use]
+pub fn hardware_accelerated() -> bool {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    {
+        std::is_x86_feature_detected!("aes") && std::is_x86_feature_detected!("pclmulqdq")
+    }
+    #[cfg(target_arch = "aarch64")]
+    {
+        std::arch::is_aarch64_feature_detected!("aes")
+            && std::arch::is_aarch64_feature_detected!("pmull")
+    }
+    #[cfg(not(any(target_arch = "x86", target_arch = "x86_64", target_arch = "aarch64")))]
+    {
+        false
+    }
+}
+
 /// Encryption key for AES-256-GCM.
 ///
 /// The key is automatically zeroized when dropped for security.
@@ -99,6 +143,11 @@ impl std::fmt::Debug for EncryptionKey {
 ///
 /// This is the main interface for encrypting and decrypting data.
 /// It uses AES-256-GCM for authenticated encryption.
+///
+/// The AES key schedule and GHASH key are expanded once in
+/// [`new`](Self::new); every call afterwards only draws a fresh nonce.
+/// Create one manager per key and reuse it rather than constructing a
+/// manager per operation.
 pub struct CryptoManager {
     cipher: Aes256Gcm,
 }
@@ -127,23 +176,7 @@ impl CryptoManager {
     ///
     /// The encrypted data with nonce prepended.
     pub fn encrypt(&self, plaintext: &[u8]) -> CoreResult<Vec<u8>> {
-        // Generate random nonce
-        let mut nonce_bytes = [0u8; NONCE_SIZE];
-        rand::thread_rng().fill_bytes(&mut nonce_bytes);
-        let nonce = Nonce::from_slice(&nonce_bytes);
-
-        // Encrypt
-        let ciphertext = self
-            .cipher
-            .encrypt(nonce, plaintext)
-            .map_err(|_| CoreError::encryption_failed("encryption error"))?;
-
-        // Prepend nonce
-        let mut result = Vec::with_capacity(NONCE_SIZE + ciphertext.len());
-        result.extend_from_slice(&nonce_bytes);
-        result.extend(ciphertext);
-
-        Ok(result)
+        self.encrypt_with_aad(plaintext, &[])
     }
 
     /// Decrypts data that was encrypted with [`encrypt`](Self::encrypt).
@@ -159,19 +192,15 @@ impl CryptoManager {
     /// # Errors
     ///
     /// Returns an error if decryption fails (wrong key, corrupted data, etc.).
+    ///
+    /// # Security
+    ///
+    /// The authentication tag is compared in constant time, and every
+    /// authentication failure (wrong key, wrong AAD, any tampered byte)
+    /// produces the same error, so failures reveal nothing about where the
+    /// input differs.
     pub fn decrypt(&self, ciphertext: &[u8]) -> CoreResult<Vec<u8>> {
-        if ciphertext.len() < NONCE_SIZE + TAG_SIZE {
-            return Err(CoreError::decryption_failed("ciphertext too short"));
-        }
-
-        // Extract nonce
-        let nonce = Nonce::from_slice(&ciphertext[..NONCE_SIZE]);
-        let encrypted = &ciphertext[NONCE_SIZE..];
-
-        // Decrypt
-        self.cipher
-            .decrypt(nonce, encrypted)
-            .map_err(|_| CoreError::decryption_failed("decryption error"))
+        self.decrypt_with_aad(ciphertext, &[])
     }
 
     /// Encrypts data with associated data (AEAD).
@@ -179,49 +208,87 @@ impl CryptoManager {
     /// The associated data is authenticated but not encrypted.
     /// This is useful for binding ciphertext to metadata.
     pub fn encrypt_with_aad(&self, plaintext: &[u8], aad: &[u8]) -> CoreResult<Vec<u8>> {
-        use aes_gcm::aead::Payload;
-
-        let mut nonce_bytes = [0u8; NONCE_SIZE];
-        rand::thread_rng().fill_bytes(&mut nonce_bytes);
-        let nonce = Nonce::from_slice(&nonce_bytes);
+        // Single allocation: the plaintext is copied into its final position
+        // and encrypted in place, instead of building a separate ciphertext
+        // buffer and copying it behind the nonce.
+        let mut result = vec![0u8; encrypted_len(plaintext.len())];
+        self.encrypt_into(plaintext, aad, &mut result)?;
+        Ok(result)
+    }
 
-        let payload = Payload {
-            msg: plaintext,
-            aad,
+    /// Decrypts data that was encrypted with [`encrypt_with_aad`](Self::encrypt_with_aad).
+    ///
+    /// The same AAD must be provided as was used during encryption.
+    pub fn decrypt_with_aad(&self, ciphertext: &[u8], aad: &[u8]) -> CoreResult<Vec<u8>> {
+        let Some(len) = decrypted_len(ciphertext.len()) else {
+            return Err(CoreError::decryption_failed("ciphertext too short"));
         };
 
-        let ciphertext = self
+        let mut result = vec![0u8; len];
+        self.decrypt_into(ciphertext, aad, &mut result)?;
+        Ok(result)
+    }
+
+    /// Encrypts `plaintext` with `aad` directly into a caller-provided buffer.
+    ///
+    /// Writes `nonce || ciphertext || tag` into `out`, which must be exactly
+    /// [`encrypted_len`]`(plaintext.len())` bytes. Lets callers that own the
+    /// destination (e.g. a binding allocating a host-language byte string)
+    /// avoid an intermediate `Vec` and copy.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if `out` has the wrong length or encryption fails.
+    pub fn encrypt_into(&self, plaintext: &[u8], aad: &[u8], out: &mut [u8]) -> CoreResult<()> {
+        if out.len() != encrypted_len(plaintext.len()) {
+            return Err(CoreError::encryption_failed("output buffer size mismatch"));
+        }
+
+        let (nonce_bytes, rest) = out.split_at_mut(NONCE_SIZE);
+        let (body, tag_out) = rest.split_at_mut(plaintext.len());
+
+        // Generate random nonce
+        rand::thread_rng().fill_bytes(nonce_bytes);
+
+        body.copy_from_slice(plaintext);
+        let tag = self
             .cipher
-            .encrypt(nonce, payload)
+            .encrypt_in_place_detached(Nonce::from_slice(nonce_bytes), aad, body)
             .map_err(|_| CoreError::encryption_failed("encryption error"))?;
+        tag_out.copy_from_slice(&tag);
 
-        let mut result = Vec::with_capacity(NONCE_SIZE + ciphertext.len());
-        result.extend_from_slice(&nonce_bytes);
-        result.extend(ciphertext);
-
-        Ok(result)
+        Ok(())
     }
 
-    /// Decrypts data that was encrypted with [`encrypt_with_aad`](Self::encrypt_with_aad).
+    /// Verifies `ciphertext` with `aad` and decrypts it into a caller-provided buffer.
     ///
-    /// The same AAD must be provided as was used during encryption.
-    pub fn decrypt_with_aad(&self, ciphertext: &[u8], aad: &[u8]) -> CoreResult<Vec<u8>> {
-        use aes_gcm::aead::Payload;
-
+    /// `out` must be exactly [`decrypted_len`]`(ciphertext.len())` bytes.
+    /// The counterpart of [`encrypt_into`](Self::encrypt_into).
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the ciphertext is too short, `out` has the wrong
+    /// length, or authentication fails. On failure the contents of `out`
+    /// are unspecified and must not be used.
+    pub fn decrypt_into(&self, ciphertext: &[u8], aad: &[u8], out: &mut [u8]) -> CoreResult<()> {
         if ciphertext.len() < NONCE_SIZE + TAG_SIZE {
             return Err(CoreError::decryption_failed("ciphertext too short"));
         }
 
-        let nonce = Nonce::from_slice(&ciphertext[..NONCE_SIZE]);
-        let encrypted = &ciphertext[NONCE_SIZE..];
-
-        let payload = Payload {
-            msg: encrypted,
-            aad,
-        };
+        let (nonce_bytes, rest) = ciphertext.split_at(NONCE_SIZE);
+        let (body, tag) = rest.split_at(rest.len() - TAG_SIZE);
+        if out.len() != body.len() {
+            return Err(CoreError::decryption_failed("output buffer size mismatch"));
+        }
 
+        out.copy_from_slice(body);
         self.cipher
-            .decrypt(nonce, payload)
+            .decrypt_in_place_detached(
+                Nonce::from_slice(nonce_bytes),
+                aad,
+                out,
+                GenericArray::from_slice(tag),
+            )
             .map_err(|_| CoreError::decryption_failed("decryption error"))
     }
 }
@@ -359,6 +426,55 @@ mod tests {
         assert!(manager.decrypt_with_aad(&ciphertext, wrong_aad).is_err());
     }
 
+    #[test]
+    fn encrypt_is_empty_aad() {
+        let key = EncryptionKey::generate();
+        let manager = CryptoManager::new(key);
+
+        let plaintext = b"layout";
+        let ciphertext = manager.encrypt(plaintext).unwrap();
+        assert_eq!(ciphertext.len(), encrypted_len(plaintext.len()));
+
+        // Plain encrypt/decrypt must interoperate with the empty-AAD variants
+        assert_eq!(
+            manager.decrypt_with_aad(&ciphertext, b"").unwrap(),
+            plaintext
+        );
+        let with_aad = manager.encrypt_with_aad(plaintext, b"").unwrap();
+        assert_eq!(manager.decrypt(&with_aad).unwrap(), plaintext);
+    }
+
+    #[test]
+    fn encrypt_into_buffer() {
+        let key = EncryptionKey::generate();
+        let manager = CryptoManager::new(key);
+
+        let plaintext = b"direct";
+        let mut out = vec![0u8; encrypted_len(plaintext.len())];
+        manager.encrypt_into(plaintext, b"aad", &mut out).unwrap();
+        assert_eq!(manager.decrypt_with_aad(&out, b"aad").unwrap(), plaintext);
+
+        // Wrongly sized buffers are rejected instead of truncated
+        let mut short = vec![0u8; encrypted_len(plaintext.len()) - 1];
+        assert!(manager.encrypt_into(plaintext, b"", &mut short).is_err());
+    }
+
+    #[test]
+    fn decrypt_into_buffer() {
+        let key = EncryptionKey::generate();
+        let manager = CryptoManager::new(key);
+
+        let ciphertext = manager.encrypt_with_aad(b"direct", b"aad").unwrap();
+        let mut out = vec![0u8; decrypted_len(ciphertext.len()).unwrap()];
+        manager.decrypt_into(&ciphertext, b"aad", &mut out).unwrap();
+        assert_eq!(out, b"direct");
+
+        assert!(manager
+            .decrypt_into(&ciphertext, b"other", &mut out)
+            .is_err());
+        assert_eq!(decrypted_len(NONCE_SIZE + TAG_SIZE - 1), None);
+    }
+
     #[test]
     fn derive_key_from_password() {
         let password = b"my_password";
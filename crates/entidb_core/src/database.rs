@@ -96,12 +96,12 @@ pub struct Database {
     /// Central index engine managing all indexes (new architecture).
     /// This replaces the separate hash_indexes/btree_indexes maps for persistence.
     index_engine: IndexEngine,
-    /// Hash indexes keyed by (collection_id, index_name).
+    /// Hash indexes keyed by collection_id, then index_name.
     /// DEPRECATED: Retained for backward API compatibility. Will be removed in future version.
-    hash_indexes: RwLock<HashMap<(u32, String), HashIndex<Vec<u8>>>>,
-    /// BTree indexes keyed by (collection_id, index_name).
+    hash_indexes: RwLock<HashMap<u32, HashMap<String, HashIndex<Vec<u8>>>>>,
+    /// BTree indexes keyed by collection_id, then index_name.
     /// DEPRECATED: Retained for backward API compatibility. Will be removed in future version.
-    btree_indexes: RwLock<HashMap<(u32, String), BTreeIndex<Vec<u8>>>>,
+    btree_indexes: RwLock<HashMap<u32, HashMap<String, BTreeIndex<Vec<u8>>>>>,
     /// FTS indexes keyed by (collection_id, index_name).
     fts_indexes: RwLock<HashMap<(u32, String), FtsIndex>>,
     /// Change feed for observing committed operations.
@@ -1002,6 +1002,30 @@ impl Database {
         result
     }
 
+    /// Gets several entities by collection and ID.
+    ///
+    /// All entities are read at the same committed snapshot. The result has
+    /// one entry per requested ID, in order, `None` for missing entities.
+    pub fn get_many(
+        &self,
+        collection_id: CollectionId,
+        entity_ids: &[EntityId],
+    ) -> CoreResult<Vec<Option<Vec<u8>>>> {
+        self.ensure_open()?;
+        let snapshot_seq = self.txn_manager.committed_seq();
+        let mut results = Vec::with_capacity(entity_ids.len());
+        for &entity_id in entity_ids {
+            let result =
+                self.entity_store
+                    .get_at_snapshot(collection_id, entity_id, snapshot_seq)?;
+            if let Some(ref data) = result {
+                self.stats.record_read(data.len() as u64);
+            }
+            results.push(result);
+        }
+        Ok(results)
+    }
+
     /// Gets an entity within a transaction.
     pub fn get_in_txn(
         &self,
@@ -1041,6 +1065,15 @@ impl Database {
         self.entity_store.list(collection_id)
     }
 
+    /// Counts the entities in a collection.
+    ///
+    /// Sees the same snapshot as [`list`](Self::list) without reading or
+    /// copying any payloads.
+    pub fn count(&self, collection_id: CollectionId) -> CoreResult<usize> {
+        self.ensure_open()?;
+        self.entity_store.count(collection_id)
+    }
+
     /// Creates or retrieves a collection, ensuring persistence.
     ///
     /// This is the **recommended** method for collection creation. It guarantees that:
@@ -1059,9 +1092,14 @@ impl Database {
     /// let users = db.create_collection("users")?;
     /// ```
     pub fn create_collection(&self, name: &str) -> CoreResult<CollectionId> {
+        // Fast path: collection already exists, only a shared lock needed
+        if let Some(id) = self.manifest.read().get_collection(name) {
+            return Ok(CollectionId::new(id));
+        }
+
         let mut manifest = self.manifest.write();
 
-        // Fast path: collection already exists
+        // Re-check: another thread may have created it in between
         if let Some(id) = manifest.get_collection(name) {
             return Ok(CollectionId::new(id));
         }
@@ -1668,10 +1706,10 @@ impl Database {
         )?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let key = (collection_id.as_u32(), field.to_string());
-        let mut indexes = self.hash_indexes.write();
+        let mut all_indexes = self.hash_indexes.write();
+        let indexes = all_indexes.entry(collection_id.as_u32()).or_default();
 
-        if indexes.contains_key(&key) {
+        if indexes.contains_key(field) {
             return Ok(()); // Already created by IndexEngine
         }
 
@@ -1681,7 +1719,7 @@ impl Database {
             IndexSpec::new(collection_id, field)
         };
 
-        indexes.insert(key, HashIndex::new(spec));
+        indexes.insert(field.to_string(), HashIndex::new(spec));
         Ok(())
     }
 
@@ -1729,10 +1767,10 @@ impl Database {
         )?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let key = (collection_id.as_u32(), field.to_string());
-        let mut indexes = self.btree_indexes.write();
+        let mut all_indexes = self.btree_indexes.write();
+        let indexes = all_indexes.entry(collection_id.as_u32()).or_default();
 
-        if indexes.contains_key(&key) {
+        if indexes.contains_key(field) {
             return Ok(()); // Already created by IndexEngine
         }
 
@@ -1742,7 +1780,7 @@ impl Database {
             IndexSpec::new(collection_id, field)
         };
 
-        indexes.insert(key, BTreeIndex::new(spec));
+        indexes.insert(field.to_string(), BTreeIndex::new(spec));
         Ok(())
     }
 
@@ -1770,16 +1808,57 @@ impl Database {
             .hash_index_insert_legacy(collection_id, field, key.clone(), entity_id)?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.hash_indexes.write();
 
         // Legacy index may not exist if only using IndexEngine
-        if let Some(index) = indexes.get_mut(&idx_key) {
+        if let Some(index) = indexes
+            .get_mut(&collection_id.as_u32())
+            .and_then(|fields| fields.get_mut(field))
+        {
             let _ = index.insert(key, entity_id);
         }
         Ok(())
     }
 
+    /// Inserts several entries into a hash index.
+    ///
+    /// Equivalent to calling [`hash_index_insert`](Self::hash_index_insert)
+    /// for each entry in order, but resolves and locks the index once. The
+    /// first failing entry (e.g. a unique-key violation) stops the batch;
+    /// the entries before it stay inserted and its error is returned.
+    ///
+    /// # Arguments
+    ///
+    /// * `collection_id` - The collection
+    /// * `field` - The indexed field (must match the field used in `create_hash_index`)
+    /// * `entries` - The (key, entity ID) pairs to insert
+    pub fn hash_index_insert_many(
+        &self,
+        collection_id: CollectionId,
+        field: &str,
+        entries: Vec<(Vec<u8>, EntityId)>,
+    ) -> CoreResult<()> {
+        self.ensure_open()?;
+
+        let (inserted, result) =
+            self.index_engine
+                .hash_index_insert_many_legacy(collection_id, field, &entries);
+
+        // Also maintain legacy in-memory index for backward compatibility,
+        // mirroring only the entries the engine accepted
+        let mut indexes = self.hash_indexes.write();
+
+        if let Some(index) = indexes
+            .get_mut(&collection_id.as_u32())
+            .and_then(|fields| fields.get_mut(field))
+        {
+            for (key, entity_id) in entries.into_iter().take(inserted) {
+                let _ = index.insert(key, entity_id);
+            }
+        }
+        result
+    }
+
     /// Removes an entry from a hash index.
     ///
     /// # Arguments
@@ -1802,10 +1881,12 @@ impl Database {
             .hash_index_remove_legacy(collection_id, field, key, entity_id)?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.hash_indexes.write();
 
-        if let Some(index) = indexes.get_mut(&idx_key) {
+        if let Some(index) = indexes
+            .get_mut(&collection_id.as_u32())
+            .and_then(|fields| fields.get_mut(field))
+        {
             let _ = index.remove(&key.to_vec(), entity_id);
         }
         Ok(true)
@@ -1877,10 +1958,12 @@ impl Database {
         )?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.btree_indexes.write();
 
-        if let Some(index) = indexes.get_mut(&idx_key) {
+        if let Some(index) = indexes
+            .get_mut(&collection_id.as_u32())
+            .and_then(|fields| fields.get_mut(field))
+        {
             let _ = index.insert(key, entity_id);
         }
         Ok(())
@@ -1908,10 +1991,12 @@ impl Database {
             .btree_index_remove_legacy(collection_id, field, key, entity_id)?;
 
         // Also maintain legacy in-memory index for backward compatibility
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.btree_indexes.write();
 
-        if let Some(index) = indexes.get_mut(&idx_key) {
+        if let Some(index) = indexes
+            .get_mut(&collection_id.as_u32())
+            .and_then(|fields| fields.get_mut(field))
+        {
             let _ = index.remove(&key.to_vec(), entity_id);
         }
         Ok(true)
@@ -2044,9 +2129,10 @@ impl Database {
             .drop_hash_index_legacy(collection_id, field);
 
         // Also remove from legacy in-memory index
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.hash_indexes.write();
-        indexes.remove(&idx_key);
+        if let Some(fields) = indexes.get_mut(&collection_id.as_u32()) {
+            fields.remove(field);
+        }
 
         result
     }
@@ -2066,9 +2152,10 @@ impl Database {
             .drop_btree_index_legacy(collection_id, field);
 
         // Also remove from legacy in-memory index
-        let idx_key = (collection_id.as_u32(), field.to_string());
         let mut indexes = self.btree_indexes.write();
-        indexes.remove(&idx_key);
+        if let Some(fields) = indexes.get_mut(&collection_id.as_u32()) {
+            fields.remove(field);
+        }
 
         result
     }
@@ -2197,6 +2284,42 @@ impl Database {
         Ok(())
     }
 
+    /// Indexes text for several entities in an FTS index.
+    ///
+    /// Equivalent to calling [`fts_index_text`](Self::fts_index_text) for
+    /// each item, but resolves the index and takes its lock once.
+    ///
+    /// # Arguments
+    ///
+    /// * `collection_id` - The collection
+    /// * `field` - The indexed field (must match the field used in `create_fts_index`)
+    /// * `items` - The entities to index with their text
+    pub fn fts_index_text_many(
+        &self,
+        collection_id: CollectionId,
+        field: &str,
+        items: &[(EntityId, &str)],
+    ) -> CoreResult<()> {
+        self.ensure_open()?;
+
+        let idx_key = (collection_id.as_u32(), field.to_string());
+        let mut indexes = self.fts_indexes.write();
+
+        let index = indexes.get_mut(&idx_key).ok_or_else(|| {
+            CoreError::invalid_operation(format!(
+                "FTS index on field '{}' not found on collection {}",
+                field,
+                collection_id.as_u32()
+            ))
+        })?;
+
+        index.index_many(items)?;
+        for &(_, text) in items {
+            self.stats.record_write(text.len() as u64);
+        }
+        Ok(())
+    }
+
     /// Removes an entity from an FTS index.
     ///
     /// # Arguments
@@ -2492,6 +2615,47 @@ mod tests {
         assert_eq!(result, Some(payload));
     }
 
+    #[test]
+    fn count_matches_list() {
+        let db = create_db();
+        let collection = db.collection("users");
+        let ids = [EntityId::new(), EntityId::new(), EntityId::new()];
+
+        db.transaction(|txn| {
+            for id in ids {
+                txn.put(collection, id, vec![1])?;
+            }
+            Ok(())
+        })
+        .unwrap();
+        db.transaction(|txn| txn.delete(collection, ids[0]))
+            .unwrap();
+
+        assert_eq!(db.count(collection).unwrap(), 2);
+        assert_eq!(
+            db.count(collection).unwrap(),
+            db.list(collection).unwrap().len()
+        );
+        assert_eq!(db.count(db.collection("empty")).unwrap(), 0);
+    }
+
+    #[test]
+    fn get_many_preserves_order() {
+        let db = create_db();
+        let collection = db.collection("users");
+        let present = EntityId::new();
+        let missing = EntityId::new();
+
+        db.transaction(|txn| {
+            txn.put(collection, present, vec![1, 2, 3])?;
+            Ok(())
+        })
+        .unwrap();
+
+        let results = db.get_many(collection, &[missing, present]).unwrap();
+        assert_eq!(results, vec![None, Some(vec![1, 2, 3])]);
+    }
+
     #[test]
     fn delete_entity() {
         let db = create_db();
@@ -3427,6 +3591,37 @@ mod observability_tests {
         assert!(results.contains(&entity2));
     }
 
+    #[test]
+    fn fts_index_text_many_matches_single_calls() {
+        let db = create_db();
+        let collection = db.collection("documents");
+
+        db.create_fts_index(collection, "content").unwrap();
+
+        let entity1 = EntityId::new();
+        let entity2 = EntityId::new();
+        db.fts_index_text_many(
+            collection,
+            "content",
+            &[(entity1, "Hello world"), (entity2, "Goodbye world")],
+        )
+        .unwrap();
+
+        assert_eq!(db.fts_index_len(collection, "content").unwrap(), 2);
+        assert_eq!(
+            db.fts_search(collection, "content", "hello").unwrap(),
+            vec![entity1]
+        );
+        assert_eq!(
+            db.fts_search(collection, "content", "world").unwrap().len(),
+            2
+        );
+
+        assert!(db
+            .fts_index_text_many(collection, "missing", &[(entity1, "text")])
+            .is_err());
+    }
+
     #[test]
     fn fts_search_and_semantics() {
         let db = create_db();
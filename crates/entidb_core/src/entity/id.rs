@@ -1,7 +1,9 @@
 //! Entity identifier.
 
-use std::fmt;
-use uuid::Uuid;
+use crate::error::{CoreError, CoreResult};
+use std::hash::{Hash, Hasher};
+use std::{fmt, io};
+use uuid::{Builder, Uuid};
 
 /// Unique identifier for an entity.
 ///
@@ -9,7 +11,7 @@ use uuid::Uuid;
 /// - Globally unique within a database
 /// - Immutable once assigned
 /// - Never reused
-#[derive(Clone, Copy, PartialEq, Eq, PartialOrd, Ord, Hash)]
+#[derive(Clone, Copy, PartialEq, Eq, PartialOrd, Ord)]
 pub struct EntityId([u8; 16]);
 
 impl EntityId {
@@ -26,6 +28,31 @@ impl EntityId {
         Self(Uuid::new_v4().into_bytes())
     }
 
+    /// Creates `n` new random entity IDs.
+    ///
+    /// Equivalent to calling [`EntityId::new`] `n` times, but draws the
+    /// randomness for the whole batch from the OS in a single call.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if the OS random source fails or `n` is too large.
+    pub fn new_many(n: usize) -> CoreResult<Vec<Self>> {
+        let len = n.checked_mul(16).ok_or_else(|| {
+            CoreError::invalid_argument(format!("cannot generate {n} entity IDs"))
+        })?;
+        let mut random = vec![0u8; len];
+        getrandom::getrandom(&mut random).map_err(|e| io::Error::other(e.to_string()))?;
+
+        Ok(random
+            .chunks_exact(16)
+            .map(|chunk| {
+                let mut bytes = [0u8; 16];
+                bytes.copy_from_slice(chunk);
+                Self(Builder::from_random_bytes(bytes).into_uuid().into_bytes())
+            })
+            .collect())
+    }
+
     /// Creates an entity ID from a UUID.
     #[must_use]
     pub fn from_uuid(uuid: Uuid) -> Self {
@@ -66,6 +93,17 @@ impl Default for EntityId {
     }
 }
 
+impl Hash for EntityId {
+    /// Feeds the ID to the hasher as a single 128-bit word.
+    ///
+    /// The derived impl would hash it as a byte slice, which writes a
+    /// length prefix and then the bytes.
+    #[inline]
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        state.write_u128(u128::from_ne_bytes(self.0));
+    }
+}
+
 impl fmt::Debug for EntityId {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         write!(f, "EntityId({})", self.to_uuid())
@@ -106,6 +144,22 @@ impl From<EntityId> for [u8; 16] {
 mod tests {
     use super::*;
 
+    #[test]
+    fn hash_agrees_with_eq() {
+        use std::collections::hash_map::DefaultHasher;
+
+        fn hash_of(id: &EntityId) -> u64 {
+            let mut hasher = DefaultHasher::new();
+            id.hash(&mut hasher);
+            hasher.finish()
+        }
+
+        let id = EntityId::new();
+        let copy = EntityId::from_bytes(*id.as_bytes());
+        assert_eq!(hash_of(&id), hash_of(&copy));
+        assert_ne!(hash_of(&id), hash_of(&EntityId::from_bytes([0; 16])));
+    }
+
     #[test]
     fn new_is_unique() {
         let id1 = EntityId::new();
@@ -113,6 +167,20 @@ mod tests {
         assert_ne!(id1, id2);
     }
 
+    #[test]
+    fn new_many_is_unique_v4() {
+        let ids = EntityId::new_many(64).unwrap();
+        assert_eq!(ids.len(), 64);
+
+        let unique: std::collections::HashSet<_> = ids.iter().collect();
+        assert_eq!(unique.len(), ids.len());
+        for id in &ids {
+            assert_eq!(id.to_uuid().get_version_num(), 4);
+        }
+
+        assert!(EntityId::new_many(0).unwrap().is_empty());
+    }
+
     #[test]
     fn from_bytes_roundtrip() {
         let bytes = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16];
@@ -99,8 +99,14 @@ impl EntityStore {
     }
 
     /// Returns the count of entities in a collection.
+    ///
+    /// Uses the same snapshot as [`list`](Self::list) but never reads
+    /// entity payloads.
     pub fn count(&self, collection_id: CollectionId) -> CoreResult<usize> {
-        Ok(self.list(collection_id)?.len())
+        let snapshot_seq = self.txn_manager.committed_seq();
+        Ok(self
+            .segments
+            .count_collection_at_snapshot(collection_id, Some(snapshot_seq)))
     }
 
     /// Returns the total number of entities across all collections.
@@ -3,8 +3,9 @@
 use crate::entity::EntityId;
 use crate::error::CoreResult;
 use crate::index::traits::{Index, IndexKey, IndexSpec};
+use std::borrow::Borrow;
 use std::collections::{BTreeMap, HashSet};
-use std::ops::Bound;
+use std::ops::{Bound, RangeBounds};
 
 /// BTree-based index for ordered traversal and range queries.
 ///
@@ -55,10 +56,27 @@ impl<K: IndexKey> BTreeIndex<K> {
     /// This is the primary range query method.
     pub fn range<R>(&self, range: R) -> CoreResult<Vec<EntityId>>
     where
-        R: std::ops::RangeBounds<K>,
+        R: RangeBounds<K>,
     {
-        let mut result = Vec::new();
-        for (_, entities) in self.entries.range(range) {
+        self.range_by::<K, R>(range)
+    }
+
+    /// Returns entities with keys in a range given by borrowed bounds.
+    ///
+    /// Same result as [`BTreeIndex::range`], but lets callers holding e.g.
+    /// `&[u8]` bounds for a `Vec<u8>` keyed index query without allocating
+    /// owned keys.
+    pub fn range_by<Q, R>(&self, range: R) -> CoreResult<Vec<EntityId>>
+    where
+        K: Borrow<Q>,
+        Q: Ord + ?Sized,
+        R: RangeBounds<Q>,
+    {
+        // Size the result exactly: the counting pass only reads set lengths
+        let entries = self.entries.range(range);
+        let len = entries.clone().map(|(_, entities)| entities.len()).sum();
+        let mut result = Vec::with_capacity(len);
+        for (_, entities) in entries {
             result.extend(entities.iter().copied());
         }
         Ok(result)
@@ -66,27 +84,27 @@ impl<K: IndexKey> BTreeIndex<K> {
 
     /// Returns entities with keys greater than the given key.
     pub fn greater_than(&self, key: &K) -> CoreResult<Vec<EntityId>> {
-        self.range((Bound::Excluded(key.clone()), Bound::Unbounded))
+        self.range_by::<K, _>((Bound::Excluded(key), Bound::Unbounded))
     }
 
     /// Returns entities with keys greater than or equal to the given key.
     pub fn greater_than_or_equal(&self, key: &K) -> CoreResult<Vec<EntityId>> {
-        self.range((Bound::Included(key.clone()), Bound::Unbounded))
+        self.range_by::<K, _>((Bound::Included(key), Bound::Unbounded))
     }
 
     /// Returns entities with keys less than the given key.
     pub fn less_than(&self, key: &K) -> CoreResult<Vec<EntityId>> {
-        self.range((Bound::Unbounded, Bound::Excluded(key.clone())))
+        self.range_by::<K, _>((Bound::Unbounded, Bound::Excluded(key)))
     }
 
     /// Returns entities with keys less than or equal to the given key.
     pub fn less_than_or_equal(&self, key: &K) -> CoreResult<Vec<EntityId>> {
-        self.range((Bound::Unbounded, Bound::Included(key.clone())))
+        self.range_by::<K, _>((Bound::Unbounded, Bound::Included(key)))
     }
 
     /// Returns entities with keys between min and max (inclusive).
     pub fn between(&self, min: &K, max: &K) -> CoreResult<Vec<EntityId>> {
-        self.range(min.clone()..=max.clone())
+        self.range_by::<K, _>((Bound::Included(min), Bound::Included(max)))
     }
 
     /// Returns all entries in order.
@@ -151,6 +151,9 @@ pub struct IndexEngine {
     btree_indexes: RwLock<HashMap<u64, BTreeIndex<Vec<u8>>>>,
     /// Collection+field -> index ID lookup for access path selection.
     field_index_map: RwLock<HashMap<(CollectionId, Vec<String>), u64>>,
+    /// Collection -> field name -> index ID for single-field indexes, so the
+    /// by-name legacy API can look up with a borrowed `&str`.
+    field_name_map: RwLock<HashMap<CollectionId, HashMap<String, u64>>>,
     /// Next index ID to assign.
     next_index_id: AtomicU64,
     /// Statistics.
@@ -173,6 +176,7 @@ impl IndexEngine {
             hash_indexes: RwLock::new(HashMap::new()),
             btree_indexes: RwLock::new(HashMap::new()),
             field_index_map: RwLock::new(HashMap::new()),
+            field_name_map: RwLock::new(HashMap::new()),
             next_index_id: AtomicU64::new(1),
             stats: RwLock::new(IndexStats::default()),
             invalid_indexes: RwLock::new(std::collections::HashSet::new()),
@@ -183,6 +187,7 @@ impl IndexEngine {
     pub fn from_definitions(config: IndexEngineConfig, definitions: Vec<IndexDefinition>) -> Self {
         let mut defs_map = HashMap::new();
         let mut field_map = HashMap::new();
+        let mut name_map: HashMap<CollectionId, HashMap<String, u64>> = HashMap::new();
         let mut hash_indexes = HashMap::new();
         let mut btree_indexes = HashMap::new();
         let mut max_id = 0u64;
@@ -191,6 +196,12 @@ impl IndexEngine {
             max_id = max_id.max(def.id);
             let key = (def.collection_id, def.field_path.clone());
             field_map.insert(key, def.id);
+            if let [name] = def.field_path.as_slice() {
+                name_map
+                    .entry(def.collection_id)
+                    .or_default()
+                    .insert(name.clone(), def.id);
+            }
 
             // Create empty indexes (will be rebuilt from segments)
             let spec = IndexSpec::new(def.collection_id, def.canonical_name());
@@ -214,6 +225,7 @@ impl IndexEngine {
             hash_indexes: RwLock::new(hash_indexes),
             btree_indexes: RwLock::new(btree_indexes),
             field_index_map: RwLock::new(field_map),
+            field_name_map: RwLock::new(name_map),
             next_index_id: AtomicU64::new(max_id + 1),
             stats: RwLock::new(IndexStats::default()),
             invalid_indexes: RwLock::new(std::collections::HashSet::new()),
@@ -262,6 +274,7 @@ impl IndexEngine {
         }
 
         self.field_index_map.write().insert(key, def.id);
+        self.register_field_name(def.collection_id, &def.field_path, def.id);
         self.definitions.write().insert(def.id, def);
     }
 
@@ -314,6 +327,7 @@ impl IndexEngine {
         }
 
         self.field_index_map.write().insert(key, id);
+        self.register_field_name(collection_id, &field_path, id);
         self.definitions.write().insert(id, def);
 
         Ok(id)
@@ -335,6 +349,16 @@ impl IndexEngine {
             }
         };
 
+        if let [name] = field_path {
+            let mut name_map = self.field_name_map.write();
+            if let Some(fields) = name_map.get_mut(&collection_id) {
+                fields.remove(name.as_str());
+                if fields.is_empty() {
+                    name_map.remove(&collection_id);
+                }
+            }
+        }
+
         self.definitions.write().remove(&id);
         self.hash_indexes.write().remove(&id);
         self.btree_indexes.write().remove(&id);
@@ -343,6 +367,26 @@ impl IndexEngine {
         Ok(true)
     }
 
+    /// Records a single-field index under its field name.
+    fn register_field_name(&self, collection_id: CollectionId, field_path: &[String], id: u64) {
+        if let [name] = field_path {
+            self.field_name_map
+                .write()
+                .entry(collection_id)
+                .or_default()
+                .insert(name.clone(), id);
+        }
+    }
+
+    /// Gets the index ID for a single-field index without allocating a path.
+    fn index_for_field_name(&self, collection_id: CollectionId, field: &str) -> Option<u64> {
+        self.field_name_map
+            .read()
+            .get(&collection_id)
+            .and_then(|fields| fields.get(field))
+            .copied()
+    }
+
     /// Marks a specific index as valid (successfully rebuilt).
     ///
     /// This is called after a successful index rebuild for a newly created index.
@@ -527,7 +571,7 @@ impl IndexEngine {
         {
             let hash_indexes = self.hash_indexes.read();
             if let Some(index) = hash_indexes.get(&index_id) {
-                return index.lookup(&key.to_vec());
+                return Ok(index.lookup_by(key));
             }
         }
 
@@ -585,16 +629,10 @@ impl IndexEngine {
             .ok_or_else(|| CoreError::invalid_operation("index is not a BTree index"))?;
 
         use std::ops::Bound;
-        let start = match min_key {
-            Some(k) => Bound::Included(k.to_vec()),
-            None => Bound::Unbounded,
-        };
-        let end = match max_key {
-            Some(k) => Bound::Included(k.to_vec()),
-            None => Bound::Unbounded,
-        };
+        let start = min_key.map_or(Bound::Unbounded, Bound::Included);
+        let end = max_key.map_or(Bound::Unbounded, Bound::Included);
 
-        index.range((start, end))
+        index.range_by::<[u8], _>((start, end))
     }
 
     /// Rebuilds all indexes from segment records.
@@ -891,10 +929,7 @@ impl IndexEngine {
         key: Vec<u8>,
         entity_id: EntityId,
     ) -> CoreResult<()> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -914,6 +949,46 @@ impl IndexEngine {
         index.insert(key, entity_id)
     }
 
+    /// Inserts several entries into a hash index by field (legacy API for
+    /// backward compatibility).
+    ///
+    /// The index is resolved and locked once for the whole batch. Entries
+    /// are applied in order and the first failure stops the batch; entries
+    /// before it stay inserted, as with repeated single inserts.
+    ///
+    /// Returns how many entries were inserted, together with the error that
+    /// stopped the batch, if any, so callers can mirror the applied prefix.
+    #[doc(hidden)]
+    pub fn hash_index_insert_many_legacy(
+        &self,
+        collection_id: CollectionId,
+        field: &str,
+        entries: &[(Vec<u8>, EntityId)],
+    ) -> (usize, CoreResult<()>) {
+        let Some(index_id) = self.index_for_field_name(collection_id, field) else {
+            return (
+                0,
+                Err(CoreError::invalid_format(format!(
+                    "hash index on field '{}' not found on collection {}",
+                    field,
+                    collection_id.as_u32()
+                ))),
+            );
+        };
+
+        let mut hash_indexes = self.hash_indexes.write();
+        let Some(index) = hash_indexes.get_mut(&index_id) else {
+            return (0, Err(CoreError::invalid_format("index not found")));
+        };
+
+        for (inserted, (key, entity_id)) in entries.iter().enumerate() {
+            if let Err(e) = index.insert(key.clone(), *entity_id) {
+                return (inserted, Err(e));
+            }
+        }
+        (entries.len(), Ok(()))
+    }
+
     /// Removes from hash index by field (legacy API for backward compatibility).
     #[doc(hidden)]
     pub fn hash_index_remove_legacy(
@@ -923,10 +998,7 @@ impl IndexEngine {
         key: &[u8],
         entity_id: EntityId,
     ) -> CoreResult<bool> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -954,10 +1026,7 @@ impl IndexEngine {
         field: &str,
         key: &[u8],
     ) -> CoreResult<Vec<EntityId>> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -975,7 +1044,7 @@ impl IndexEngine {
             .ok_or_else(|| CoreError::invalid_format("index not found"))?;
 
         self.stats.write().lookups += 1;
-        index.lookup(&key.to_vec())
+        Ok(index.lookup_by(key))
     }
 
     /// Gets hash index length by field (legacy API for backward compatibility).
@@ -985,10 +1054,7 @@ impl IndexEngine {
         collection_id: CollectionId,
         field: &str,
     ) -> CoreResult<usize> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1015,8 +1081,7 @@ impl IndexEngine {
         collection_id: CollectionId,
         field: &str,
     ) -> CoreResult<bool> {
-        let field_path = vec![field.to_string()];
-        self.drop_index(collection_id, &field_path)
+        self.drop_index(collection_id, &[field.to_string()])
     }
 
     /// Inserts into btree index by field (legacy API for backward compatibility).
@@ -1028,10 +1093,7 @@ impl IndexEngine {
         key: Vec<u8>,
         entity_id: EntityId,
     ) -> CoreResult<()> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1060,10 +1122,7 @@ impl IndexEngine {
         key: &[u8],
         entity_id: EntityId,
     ) -> CoreResult<bool> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1091,10 +1150,7 @@ impl IndexEngine {
         field: &str,
         key: &[u8],
     ) -> CoreResult<Vec<EntityId>> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1124,10 +1180,7 @@ impl IndexEngine {
         min_key: Option<&[u8]>,
         max_key: Option<&[u8]>,
     ) -> CoreResult<Vec<EntityId>> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1147,16 +1200,10 @@ impl IndexEngine {
         self.stats.write().lookups += 1;
 
         use std::ops::Bound;
-        let start = match min_key {
-            Some(k) => Bound::Included(k.to_vec()),
-            None => Bound::Unbounded,
-        };
-        let end = match max_key {
-            Some(k) => Bound::Included(k.to_vec()),
-            None => Bound::Unbounded,
-        };
+        let start = min_key.map_or(Bound::Unbounded, Bound::Included);
+        let end = max_key.map_or(Bound::Unbounded, Bound::Included);
 
-        index.range((start, end))
+        index.range_by::<[u8], _>((start, end))
     }
 
     /// Gets btree index length by field (legacy API for backward compatibility).
@@ -1166,10 +1213,7 @@ impl IndexEngine {
         collection_id: CollectionId,
         field: &str,
     ) -> CoreResult<usize> {
-        let field_path = vec![field.to_string()];
-        let key_lookup = (collection_id, field_path);
-
-        let index_id = self.field_index_map.read().get(&key_lookup).copied();
+        let index_id = self.index_for_field_name(collection_id, field);
         let index_id = match index_id {
             Some(id) => id,
             None => {
@@ -1196,8 +1240,7 @@ impl IndexEngine {
         collection_id: CollectionId,
         field: &str,
     ) -> CoreResult<bool> {
-        let field_path = vec![field.to_string()];
-        self.drop_index(collection_id, &field_path)
+        self.drop_index(collection_id, &[field.to_string()])
     }
 }
 
@@ -1289,6 +1332,106 @@ mod tests {
         assert_eq!(engine.hash_index_len_legacy(coll, "email").unwrap(), 0);
     }
 
+    #[test]
+    fn test_legacy_hash_index_insert_many() {
+        let engine = IndexEngine::new(IndexEngineConfig::default());
+        let coll = CollectionId::new(1);
+
+        engine
+            .create_hash_index_legacy(coll, "status", false)
+            .unwrap();
+
+        let e1 = EntityId::new();
+        let e2 = EntityId::new();
+        let e3 = EntityId::new();
+        let (inserted, result) = engine.hash_index_insert_many_legacy(
+            coll,
+            "status",
+            &[
+                (b"active".to_vec(), e1),
+                (b"active".to_vec(), e2),
+                (b"inactive".to_vec(), e3),
+            ],
+        );
+        result.unwrap();
+        assert_eq!(inserted, 3);
+
+        let active = engine
+            .hash_index_lookup_legacy(coll, "status", b"active")
+            .unwrap();
+        assert_eq!(active.len(), 2);
+        assert!(active.contains(&e1) && active.contains(&e2));
+        assert_eq!(
+            engine
+                .hash_index_lookup_legacy(coll, "status", b"inactive")
+                .unwrap(),
+            vec![e3]
+        );
+
+        let (inserted, result) =
+            engine.hash_index_insert_many_legacy(coll, "missing", &[(vec![1], e1)]);
+        assert!(result.is_err());
+        assert_eq!(inserted, 0);
+    }
+
+    #[test]
+    fn test_legacy_hash_index_insert_many_reports_applied_prefix() {
+        let engine = IndexEngine::new(IndexEngineConfig::default());
+        let coll = CollectionId::new(1);
+
+        engine
+            .create_hash_index_legacy(coll, "email", true)
+            .unwrap();
+
+        let e1 = EntityId::new();
+        let e2 = EntityId::new();
+        let (inserted, result) = engine.hash_index_insert_many_legacy(
+            coll,
+            "email",
+            &[(b"a@x".to_vec(), e1), (b"a@x".to_vec(), e2)],
+        );
+        assert!(result.is_err());
+        assert_eq!(inserted, 1);
+        assert_eq!(
+            engine
+                .hash_index_lookup_legacy(coll, "email", b"a@x")
+                .unwrap(),
+            vec![e1]
+        );
+    }
+
+    #[test]
+    fn test_legacy_field_names_track_definitions() {
+        let engine = IndexEngine::new(IndexEngineConfig::default());
+        let coll = CollectionId::new(1);
+
+        engine
+            .create_btree_index_legacy(coll, "age", false)
+            .unwrap();
+        assert!(engine.drop_btree_index_legacy(coll, "age").unwrap());
+        assert!(engine.btree_index_len_legacy(coll, "age").is_err());
+
+        // Multi-field paths are not reachable through the by-name API.
+        engine
+            .create_index(
+                coll,
+                vec!["address".to_string(), "city".to_string()],
+                IndexKind::Hash,
+                false,
+                SequenceNumber::new(0),
+            )
+            .unwrap();
+        assert!(engine.hash_index_len_legacy(coll, "address").is_err());
+
+        engine
+            .create_hash_index_legacy(coll, "email", false)
+            .unwrap();
+        let restored =
+            IndexEngine::from_definitions(IndexEngineConfig::default(), engine.definitions());
+        assert_eq!(restored.hash_index_len_legacy(coll, "email").unwrap(), 0);
+        assert!(restored.hash_index_len_legacy(coll, "address").is_err());
+    }
+
     #[test]
     fn test_legacy_btree_index() {
         let engine = IndexEngine::new(IndexEngineConfig::default());
@@ -12,9 +12,11 @@
 //! token-based exact match; no ranking or fuzzy matching in this phase.
 
 use crate::entity::EntityId;
-use crate::error::CoreResult;
+use crate::error::{CoreError, CoreResult};
 use crate::types::CollectionId;
-use std::collections::{HashMap, HashSet};
+use roaring::RoaringBitmap;
+use std::collections::{BTreeMap, HashMap, HashSet};
+use std::ops::Bound;
 
 /// Configuration for the FTS tokenizer.
 #[derive(Debug, Clone)]
@@ -77,6 +79,19 @@ impl TokenizerConfig {
     }
 }
 
+/// ASCII bytes the tokenizer always splits on. Matches
+/// `char::is_whitespace` and `char::is_ascii_punctuation` on ASCII input.
+const ASCII_SEPARATORS: [bool; 256] = {
+    let mut table = [false; 256];
+    let mut b = 0;
+    while b < 128 {
+        let byte = b as u8;
+        table[b] = matches!(byte, b'\t'..=b'\r' | b' ') || byte.is_ascii_punctuation();
+        b += 1;
+    }
+    table
+};
+
 /// Specification for a full-text index.
 #[derive(Debug, Clone)]
 pub struct FtsIndexSpec {
@@ -109,8 +124,8 @@ impl FtsIndexSpec {
 /// Full-text index for token-based text search.
 ///
 /// `FtsIndex` provides:
-/// - Inverted index: token → set of entity IDs
-/// - Forward index: entity ID → set of tokens (for updates)
+/// - Inverted index: token → bitmap of document numbers
+/// - Forward index: entity ID → document number and tokens (for updates)
 /// - Case-insensitive matching (configurable)
 /// - Prefix search
 /// - Multi-token AND queries
@@ -130,22 +145,42 @@ impl FtsIndexSpec {
 pub struct FtsIndex {
     /// Index specification.
     spec: FtsIndexSpec,
-    /// Inverted index: normalized token → set of entity IDs.
-    inverted: HashMap<String, HashSet<EntityId>>,
-    /// Forward index: entity ID → set of indexed tokens.
-    forward: HashMap<EntityId, HashSet<String>>,
+    /// Inverted index: normalized token → document numbers.
+    ///
+    /// Postings are roaring bitmaps over dense `u32` document numbers, so
+    /// multi-token queries intersect or union bitmaps instead of hash sets.
+    /// Tokens are kept sorted so a prefix search only visits the tokens
+    /// that share the prefix.
+    inverted: BTreeMap<String, RoaringBitmap>,
+    /// Forward index: entity ID → its document number and indexed tokens.
+    forward: HashMap<EntityId, ForwardEntry>,
+    /// Document number → entity ID. Slots of removed entities are listed
+    /// in `free_docs` and reused.
+    docs: Vec<EntityId>,
+    /// Document numbers not currently assigned to an entity.
+    free_docs: Vec<u32>,
     /// Total token count.
     token_count: usize,
 }
 
+/// Forward index entry for one entity.
+struct ForwardEntry {
+    /// Document number used in the postings bitmaps.
+    doc: u32,
+    /// Indexed tokens.
+    tokens: HashSet<String>,
+}
+
 #[allow(dead_code)] // Many methods are public API for bindings
 impl FtsIndex {
     /// Creates a new full-text index.
     pub fn new(spec: FtsIndexSpec) -> Self {
         Self {
             spec,
-            inverted: HashMap::new(),
+            inverted: BTreeMap::new(),
             forward: HashMap::new(),
+            docs: Vec::new(),
+            free_docs: Vec::new(),
             token_count: 0,
         }
     }
@@ -179,55 +214,97 @@ impl FtsIndex {
     pub fn clear(&mut self) {
         self.inverted.clear();
         self.forward.clear();
+        self.docs.clear();
+        self.free_docs.clear();
         self.token_count = 0;
     }
 
     /// Tokenizes text according to the configuration.
     fn tokenize(&self, text: &str) -> Vec<String> {
+        if text.is_ascii() {
+            self.tokenize_ascii(text)
+        } else {
+            self.tokenize_unicode(text)
+        }
+    }
+
+    /// Tokenizer fast path for ASCII text: separators are looked up per
+    /// byte in a table instead of classifying each decoded `char`.
+    fn tokenize_ascii(&self, text: &str) -> Vec<String> {
+        let mut separators = ASCII_SEPARATORS;
+        for &c in &self.spec.tokenizer.extra_separators {
+            if c.is_ascii() {
+                separators[c as usize] = true;
+            }
+        }
+
+        let mut tokens = Vec::new();
+        let mut token_start = None;
+
+        for (i, &b) in text.as_bytes().iter().enumerate() {
+            if separators[usize::from(b)] {
+                if let Some(start) = token_start.take() {
+                    self.push_token(&mut tokens, &text[start..i]);
+                }
+            } else if token_start.is_none() {
+                token_start = Some(i);
+            }
+        }
+
+        if let Some(start) = token_start {
+            self.push_token(&mut tokens, &text[start..]);
+        }
+
+        tokens
+    }
+
+    /// General tokenizer for text containing non-ASCII characters.
+    fn tokenize_unicode(&self, text: &str) -> Vec<String> {
         let config = &self.spec.tokenizer;
         let mut tokens = Vec::new();
-        let mut current_token = String::new();
+        let mut token_start = None;
 
-        for c in text.chars() {
+        for (i, c) in text.char_indices() {
             let is_separator = c.is_whitespace()
                 || c.is_ascii_punctuation()
                 || config.extra_separators.contains(&c);
 
             if is_separator {
-                if !current_token.is_empty() {
-                    if current_token.len() >= config.min_token_length
-                        && current_token.len() <= config.max_token_length
-                    {
-                        let normalized = if config.case_insensitive {
-                            current_token.to_lowercase()
-                        } else {
-                            current_token.clone()
-                        };
-                        tokens.push(normalized);
-                    }
-                    current_token.clear();
+                if let Some(start) = token_start.take() {
+                    self.push_token(&mut tokens, &text[start..i]);
                 }
-            } else {
-                current_token.push(c);
+            } else if token_start.is_none() {
+                token_start = Some(i);
             }
         }
 
         // Don't forget the last token
-        if !current_token.is_empty()
-            && current_token.len() >= config.min_token_length
-            && current_token.len() <= config.max_token_length
-        {
-            let normalized = if config.case_insensitive {
-                current_token.to_lowercase()
-            } else {
-                current_token
-            };
-            tokens.push(normalized);
+        if let Some(start) = token_start {
+            self.push_token(&mut tokens, &text[start..]);
         }
 
         tokens
     }
 
+    /// Normalizes a token borrowed from the input and appends it if its
+    /// length is within bounds.
+    fn push_token(&self, tokens: &mut Vec<String>, token: &str) {
+        let config = &self.spec.tokenizer;
+        if token.len() < config.min_token_length || token.len() > config.max_token_length {
+            return;
+        }
+
+        let normalized = if !config.case_insensitive {
+            token.to_string()
+        } else if token.is_ascii() {
+            // Byte-wise lowering; same result as `to_lowercase` for ASCII
+            token.to_ascii_lowercase()
+        } else {
+            token.to_lowercase()
+        };
+        tokens.push(normalized);
+    }
+
     /// Indexes text for an entity.
     ///
     /// This replaces any previously indexed text for the entity.
@@ -239,38 +316,96 @@ impl FtsIndex {
         let tokens = self.tokenize(text);
         let token_set: HashSet<String> = tokens.into_iter().collect();
 
-        // Add to inverted index
+        self.insert_tokens(entity_id, token_set)
+    }
+
+    /// Indexes text for several entities in one pass.
+    ///
+    /// Equivalent to calling `index_text` for each item in order, so a
+    /// later item for the same entity replaces an earlier one.
+    pub fn index_many(&mut self, items: &[(EntityId, &str)]) -> CoreResult<()> {
+        self.forward.reserve(items.len());
+        for &(entity_id, text) in items {
+            self.remove_entity(entity_id)?;
+            let token_set: HashSet<String> = self.tokenize(text).into_iter().collect();
+            self.insert_tokens(entity_id, token_set)?;
+        }
+        Ok(())
+    }
+
+    /// Adds an entity's tokens to the inverted and forward indexes.
+    ///
+    /// The entity must not currently be indexed.
+    fn insert_tokens(&mut self, entity_id: EntityId, token_set: HashSet<String>) -> CoreResult<()> {
+        let doc = self.allocate_doc(entity_id)?;
+
         for token in &token_set {
-            let entry = self.inverted.entry(token.clone()).or_default();
-            entry.insert(entity_id);
+            // Only allocate a key for tokens not seen before
+            match self.inverted.get_mut(token.as_str()) {
+                Some(docs) => {
+                    docs.insert(doc);
+                }
+                None => {
+                    let mut docs = RoaringBitmap::new();
+                    docs.insert(doc);
+                    self.inverted.insert(token.clone(), docs);
+                }
+            }
             self.token_count += 1;
         }
 
-        // Add to forward index
-        self.forward.insert(entity_id, token_set);
-
+        self.forward.insert(
+            entity_id,
+            ForwardEntry {
+                doc,
+                tokens: token_set,
+            },
+        );
         Ok(())
     }
 
+    /// Assigns a document number to an entity, reusing freed ones first.
+    fn allocate_doc(&mut self, entity_id: EntityId) -> CoreResult<u32> {
+        if let Some(doc) = self.free_docs.pop() {
+            self.docs[doc as usize] = entity_id;
+            return Ok(doc);
+        }
+        let doc = u32::try_from(self.docs.len()).map_err(|_| {
+            CoreError::invalid_operation(format!(
+                "FTS index '{}' cannot hold more than {} entities",
+                self.spec.name,
+                u32::MAX
+            ))
+        })?;
+        self.docs.push(entity_id);
+        Ok(doc)
+    }
+
+    /// Maps a postings bitmap back to entity IDs.
+    fn entities(&self, docs: &RoaringBitmap) -> Vec<EntityId> {
+        docs.iter().map(|doc| self.docs[doc as usize]).collect()
+    }
+
     /// Removes an entity from the index.
     pub fn remove_entity(&mut self, entity_id: EntityId) -> CoreResult<bool> {
-        let Some(tokens) = self.forward.remove(&entity_id) else {
+        let Some(entry) = self.forward.remove(&entity_id) else {
             return Ok(false);
         };
 
         // Remove from inverted index
-        for token in &tokens {
-            if let Some(entities) = self.inverted.get_mut(token) {
-                entities.remove(&entity_id);
+        for token in &entry.tokens {
+            if let Some(docs) = self.inverted.get_mut(token) {
+                docs.remove(entry.doc);
                 self.token_count = self.token_count.saturating_sub(1);
 
                 // Clean up empty entries
-                if entities.is_empty() {
+                if docs.is_empty() {
                     self.inverted.remove(token);
                 }
             }
         }
 
+        self.free_docs.push(entry.doc);
         Ok(true)
     }
 
@@ -283,7 +418,7 @@ impl FtsIndex {
         };
 
         match self.inverted.get(&normalized) {
-            Some(entities) => Ok(entities.iter().copied().collect()),
+            Some(docs) => Ok(self.entities(docs)),
             None => Ok(Vec::new()),
         }
     }
@@ -298,15 +433,16 @@ impl FtsIndex {
             prefix.to_string()
         };
 
-        let mut results = HashSet::new();
+        let mut results = RoaringBitmap::new();
 
-        for (token, entities) in &self.inverted {
-            if token.starts_with(&normalized) {
-                results.extend(entities.iter().copied());
-            }
+        let candidates = self
+            .inverted
+            .range::<str, _>((Bound::Included(normalized.as_str()), Bound::Unbounded));
+        for (_, docs) in candidates.take_while(|(token, _)| token.starts_with(&normalized)) {
+            results |= docs;
         }
 
-        Ok(results.into_iter().collect())
+        Ok(self.entities(&results))
     }
 
     /// Searches for entities matching all tokens in the query (AND semantics).
@@ -319,26 +455,26 @@ impl FtsIndex {
             return Ok(Vec::new());
         }
 
-        // Get entities for first token
-        let mut results: HashSet<EntityId> = match self.inverted.get(&query_tokens[0]) {
-            Some(entities) => entities.clone(),
-            None => return Ok(Vec::new()),
-        };
-
-        // Intersect with entities for remaining tokens
-        for token in query_tokens.iter().skip(1) {
+        // Every token must be indexed for anything to match
+        let mut postings = Vec::with_capacity(query_tokens.len());
+        for token in &query_tokens {
             match self.inverted.get(token) {
-                Some(entities) => {
-                    results.retain(|id| entities.contains(id));
-                    if results.is_empty() {
-                        return Ok(Vec::new());
-                    }
-                }
+                Some(docs) => postings.push(docs),
                 None => return Ok(Vec::new()),
             }
         }
 
-        Ok(results.into_iter().collect())
+        // Intersect starting from the rarest token
+        postings.sort_by_key(|docs| docs.len());
+        let mut results = postings[0].clone();
+        for docs in &postings[1..] {
+            results &= *docs;
+            if results.is_empty() {
+                return Ok(Vec::new());
+            }
+        }
+
+        Ok(self.entities(&results))
     }
 
     /// Searches with OR semantics (returns entities matching any token).
@@ -349,20 +485,20 @@ impl FtsIndex {
             return Ok(Vec::new());
         }
 
-        let mut results = HashSet::new();
+        let mut results = RoaringBitmap::new();
 
         for token in &query_tokens {
-            if let Some(entities) = self.inverted.get(token) {
-                results.extend(entities.iter().copied());
+            if let Some(docs) = self.inverted.get(token) {
+                results |= docs;
             }
         }
 
-        Ok(results.into_iter().collect())
+        Ok(self.entities(&results))
     }
 
     /// Returns all tokens indexed for an entity.
     pub fn tokens_for_entity(&self, entity_id: EntityId) -> Option<&HashSet<String>> {
-        self.forward.get(&entity_id)
+        self.forward.get(&entity_id).map(|entry| &entry.tokens)
     }
 
     /// Checks if a token exists in the index.
@@ -382,7 +518,9 @@ impl FtsIndex {
         } else {
             token.to_string()
         };
-        self.inverted.get(&normalized).map_or(0, |e| e.len())
+        self.inverted
+            .get(&normalized)
+            .map_or(0, |docs| docs.len() as usize)
     }
 
     /// Rebuilds the index from an iterator of (entity_id, text) pairs.
@@ -442,6 +580,30 @@ mod tests {
         assert_eq!(tokens, vec!["hello", "world", "hello"]);
     }
 
+    #[test]
+    fn tokenize_ascii_matches_unicode_path() {
+        let spec = FtsIndexSpec::new(CollectionId::new(1), "test")
+            .with_tokenizer(TokenizerConfig::new().with_separators(&['x', 'é']));
+        let index = FtsIndex::new(spec);
+
+        for text in [
+            "Hello, World! How are you?",
+            "  leading\tand\x0btrailing\r\n ",
+            "a-b_c.d/e\\f[g]h{i}j~k`l|m",
+            "boxxed UPPER lower",
+            "",
+        ] {
+            assert_eq!(index.tokenize_ascii(text), index.tokenize_unicode(text));
+        }
+    }
+
+    #[test]
+    fn tokenize_case_insensitive_non_ascii() {
+        let index = create_index();
+        let tokens = index.tokenize("ÄRGER über Straße, CAFÉ");
+        assert_eq!(tokens, vec!["ärger", "über", "straße", "café"]);
+    }
+
     #[test]
     fn tokenize_case_sensitive() {
         let spec = FtsIndexSpec::new(CollectionId::new(1), "test")
@@ -520,6 +682,26 @@ mod tests {
         assert!(results.contains(&entity(2)));
     }
 
+    #[test]
+    fn search_prefix_stops_at_range_end() {
+        let mut index = create_index();
+
+        index.index_text(entity(1), "ab").unwrap();
+        index.index_text(entity(2), "abc abd").unwrap();
+        index.index_text(entity(3), "abe").unwrap();
+        index.index_text(entity(4), "aa ac").unwrap();
+
+        let mut results = index.search_prefix("abc").unwrap();
+        assert_eq!(results, vec![entity(2)]);
+
+        results = index.search_prefix("ab").unwrap();
+        results.sort();
+        assert_eq!(results, vec![entity(1), entity(2), entity(3)]);
+
+        assert!(index.search_prefix("abz").unwrap().is_empty());
+        assert_eq!(index.search_prefix("").unwrap().len(), 4);
+    }
+
     #[test]
     fn remove_entity() {
         let mut index = create_index();
@@ -540,6 +722,49 @@ mod tests {
         assert!(results.contains(&entity(2)));
     }
 
+    #[test]
+    fn index_many_matches_index_text() {
+        let mut batched = create_index();
+        let mut single = create_index();
+        let items = [
+            (entity(1), "Hello world"),
+            (entity(2), "World of rust"),
+            (entity(1), "Goodbye world"),
+        ];
+
+        batched.index_many(&items).unwrap();
+        for &(entity_id, text) in &items {
+            single.index_text(entity_id, text).unwrap();
+        }
+
+        assert_eq!(batched.entity_count(), single.entity_count());
+        assert_eq!(batched.token_count(), single.token_count());
+        for query in ["hello", "goodbye", "world", "rust"] {
+            let mut expected = single.search(query).unwrap();
+            let mut actual = batched.search(query).unwrap();
+            expected.sort();
+            actual.sort();
+            assert_eq!(actual, expected, "query {query:?}");
+        }
+    }
+
+    #[test]
+    fn removed_document_slots_are_reused() {
+        let mut index = create_index();
+
+        index.index_text(entity(1), "shared alpha").unwrap();
+        index.index_text(entity(2), "shared beta").unwrap();
+        index.remove_entity(entity(1)).unwrap();
+        index.index_text(entity(3), "shared gamma").unwrap();
+
+        let mut results = index.search("shared").unwrap();
+        results.sort();
+        assert_eq!(results, vec![entity(2), entity(3)]);
+        assert!(index.search("alpha").unwrap().is_empty());
+        assert_eq!(index.search("gamma").unwrap(), vec![entity(3)]);
+        assert_eq!(index.token_frequency("shared"), 2);
+    }
+
     #[test]
     fn update_entity() {
         let mut index = create_index();
@@ -3,7 +3,9 @@
 use crate::entity::EntityId;
 use crate::error::CoreResult;
 use crate::index::traits::{Index, IndexKey, IndexSpec};
+use std::borrow::Borrow;
 use std::collections::{HashMap, HashSet};
+use std::hash::Hash;
 
 /// Hash-based index for O(1) equality lookups.
 ///
@@ -57,6 +59,21 @@ impl<K: IndexKey> HashIndex<K> {
         }
     }
 
+    /// Looks up entities by a borrowed form of the key.
+    ///
+    /// Same result as [`Index::lookup`], but callers holding e.g. a `&[u8]`
+    /// for a `Vec<u8>` keyed index don't need to allocate an owned key.
+    pub fn lookup_by<Q>(&self, key: &Q) -> Vec<EntityId>
+    where
+        K: Borrow<Q>,
+        Q: Hash + Eq + ?Sized,
+    {
+        self.entries
+            .get(key)
+            .map(|set| set.iter().copied().collect())
+            .unwrap_or_default()
+    }
+
     /// Returns a reference to all entries for iteration.
     ///
     /// Used by persistence layer to serialize index state.
@@ -114,10 +131,7 @@ impl<K: IndexKey> Index<K> for HashIndex<K> {
     }
 
     fn lookup(&self, key: &K) -> CoreResult<Vec<EntityId>> {
-        match self.entries.get(key) {
-            Some(set) => Ok(set.iter().copied().collect()),
-            None => Ok(Vec::new()),
-        }
+        Ok(self.lookup_by(key))
     }
 
     fn contains(&self, key: &K) -> bool {
@@ -167,6 +181,17 @@ mod tests {
         assert!(found.is_empty());
     }
 
+    #[test]
+    fn lookup_by_borrowed_key() {
+        let mut index = HashIndex::new(test_spec());
+        let entity_id = EntityId::new();
+
+        index.insert("key1".to_string(), entity_id).unwrap();
+
+        assert_eq!(index.lookup_by("key1"), vec![entity_id]);
+        assert!(index.lookup_by("missing").is_empty());
+    }
+
     #[test]
     fn multiple_entities_same_key() {
         let mut index = HashIndex::new(test_spec());
@@ -43,6 +43,8 @@ struct IndexEntry {
     offset: u64,
     /// Sequence number of this version.
     sequence: SequenceNumber,
+    /// Whether this version is a tombstone (deletion marker).
+    tombstone: bool,
 }
 
 /// Version chain for MVCC - stores multiple versions of an entity.
@@ -496,6 +498,7 @@ impl SegmentManager {
             segment_id,
             offset,
             sequence: record.sequence,
+            tombstone: record.is_tombstone(),
         };
         self.index
             .write()
@@ -890,6 +893,7 @@ impl SegmentManager {
                     segment_id: seg_id,
                     offset,
                     sequence: record.sequence,
+                    tombstone: record.is_tombstone(),
                 };
                 new_index
                     .entry(key)
@@ -993,6 +997,9 @@ impl SegmentManager {
             let Some(entry) = entry else {
                 continue;
             };
+            if entry.tombstone {
+                continue;
+            }
 
             let record = self.read_at(entry.segment_id, entry.offset)?;
             if !record.is_tombstone() {
@@ -1003,6 +1010,27 @@ impl SegmentManager {
         Ok(results)
     }
 
+    /// Counts live entities in a collection at a specific snapshot.
+    ///
+    /// Same visibility rules as [`Self::iter_collection_at_snapshot`], but
+    /// answered from the in-memory index without reading any records.
+    pub fn count_collection_at_snapshot(
+        &self,
+        collection_id: CollectionId,
+        max_sequence: Option<SequenceNumber>,
+    ) -> usize {
+        let index = self.index.read();
+        index
+            .iter()
+            .filter(|(&(col_id, _), _)| col_id == collection_id.as_u32())
+            .filter_map(|(_, chain)| match max_sequence {
+                Some(seq) => chain.get_at(seq),
+                None => chain.latest(),
+            })
+            .filter(|entry| !entry.tombstone)
+            .count()
+    }
+
     /// Gets the number of sealed segments.
     pub fn sealed_segment_count(&self) -> usize {
         self.segment_info
@@ -1317,6 +1345,36 @@ mod tests {
         assert!(result.is_none());
     }
 
+    #[test]
+    fn count_collection_respects_snapshot_and_tombstones() {
+        let manager = create_manager();
+        let collection = CollectionId::new(1);
+        let other = CollectionId::new(2);
+
+        for (i, seq) in [(1u8, 1), (2, 2), (3, 3)] {
+            let put = SegmentRecord::put(collection, [i; 16], vec![i], SequenceNumber::new(seq));
+            manager.append(&put).unwrap();
+        }
+        let put = SegmentRecord::put(other, [9; 16], vec![9], SequenceNumber::new(4));
+        manager.append(&put).unwrap();
+        let tombstone = SegmentRecord::tombstone(collection, [2; 16], SequenceNumber::new(5));
+        manager.append(&tombstone).unwrap();
+
+        assert_eq!(manager.count_collection_at_snapshot(collection, None), 2);
+        assert_eq!(
+            manager.count_collection_at_snapshot(collection, Some(SequenceNumber::new(4))),
+            3
+        );
+        assert_eq!(
+            manager.count_collection_at_snapshot(collection, Some(SequenceNumber::new(1))),
+            1
+        );
+        assert_eq!(
+            manager.count_collection_at_snapshot(collection, None),
+            manager.iter_collection(collection).unwrap().len()
+        );
+    }
+
     #[test]
     fn latest_version_wins() {
         let manager = create_manager();
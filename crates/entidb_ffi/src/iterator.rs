@@ -255,10 +255,9 @@ pub unsafe extern "C" fn entidb_count(
     let db = &*(handle as *mut Database);
     let coll_id = CollectionId::new(collection_id.id);
 
-    // Use list to count entities in the collection
-    match db.list(coll_id) {
-        Ok(entities) => {
-            *out_count = entities.len();
+    match db.count(coll_id) {
+        Ok(count) => {
+            *out_count = count;
             EntiDbResult::Ok
         }
         Err(e) => {
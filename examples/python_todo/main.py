@@ -4,29 +4,37 @@ EntiDB Python Example - Todo Application
 This example demonstrates:
 - Opening a database
 - Basic CRUD operations
-- Filtering with Python comprehensions (no SQL!)
+- Filtering in plain Python (no SQL!)
 - Transaction usage with context managers
 - Iterator usage for memory efficiency
 
 Run with: python main.py
+Set ENTIDB_VERBOSE=0 to skip the per-todo listings, e.g. when timing it.
 """
 
-import json
+import os
+import struct
 import sys
-import io
-from dataclasses import dataclass
-from typing import Optional
 import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 
-# Ensure stdout can handle UTF-8 on Windows
-if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# Ensure stdout can handle UTF-8 on Windows; reconfigure the existing stream
+# rather than stacking a second wrapper on top of it
+if sys.platform == "win32" and sys.stdout.encoding.lower() not in ("utf-8", "utf8"):
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 # Note: entidb must be built first with `maturin develop`
 import entidb
 
+# completed, priority, created_at and the title length, followed by the
+# UTF-8 title itself
+_HDR = struct.Struct("<?iQH")
+
+VERBOSE = os.environ.get("ENTIDB_VERBOSE", "1") != "0"
+
 
-@dataclass
+@dataclass(slots=True)
 class Todo:
     """A simple todo item."""
     id: entidb.EntityId
@@ -46,25 +54,26 @@ class Todo:
         )
 
     def to_bytes(self) -> bytes:
-        """Convert to JSON bytes for storage."""
-        data = {
-            "title": self.title,
-            "completed": self.completed,
-            "priority": self.priority,
-            "created_at": self.created_at,
-        }
-        return json.dumps(data).encode("utf-8")
+        """Convert to a fixed-layout binary record for storage."""
+        title = self.title.encode("utf-8")
+        header = _HDR.pack(self.completed, self.priority, self.created_at, len(title))
+        return header + title
 
     @classmethod
     def from_bytes(cls, entity_id: entidb.EntityId, data: bytes) -> "Todo":
-        """Create from JSON bytes."""
-        obj = json.loads(data.decode("utf-8"))
+        """Create from a record written by `to_bytes`.
+
+        The title is decoded straight from a memoryview window, so the
+        payload is never copied into an intermediate slice.
+        """
+        completed, priority, created_at, title_len = _HDR.unpack_from(data, 0)
+        title = str(memoryview(data)[_HDR.size:_HDR.size + title_len], "utf-8")
         return cls(
             id=entity_id,
-            title=obj.get("title", ""),
-            completed=obj.get("completed", False),
-            priority=obj.get("priority", 0),
-            created_at=obj.get("created_at", 0),
+            title=title,
+            completed=completed,
+            priority=priority,
+            created_at=created_at,
         )
 
     def complete(self) -> "Todo":
@@ -82,6 +91,19 @@ class Todo:
         return f"{status} [P{self.priority}] {self.title}"
 
 
+def decode_todos(rows, cache: dict) -> Iterator[Todo]:
+    """Decode (entity_id, data) rows, reusing todos whose bytes are unchanged.
+
+    `cache` maps each entity ID to its last (data, Todo) pair, so scanning
+    the same collection again only decodes rows that were rewritten.
+    """
+    for entity_id, data in rows:
+        hit = cache.get(entity_id)
+        if hit is None or hit[0] != data:
+            hit = cache[entity_id] = (data, Todo.from_bytes(entity_id, data))
+        yield hit[1]
+
+
 def main():
     print("📁 Creating in-memory database")
 
@@ -109,58 +131,70 @@ def main():
         ]
 
         # Insert todos using transaction context manager (auto-commits!)
+        # Encode the payloads before opening the transaction, so it only
+        # hands finished bytes to the database
         print(f"\n📝 Inserting {len(todos)} todos...")
+        payloads = [(todo.id, todo.to_bytes()) for todo in todos]
+        id_by_title = {todo.title: todo.id for todo in todos}
         with db.transaction() as txn:
-            for todo in todos:
-                txn.put(todos_collection, todo.id, todo.to_bytes())
+            for todo_id, payload in payloads:
+                txn.put(todos_collection, todo_id, payload)
         print("✅ Todos inserted (auto-committed)")
 
-        # Read all todos using list()
+        # Read all todos using list(), remembering each decoded row. The same
+        # pass filters incomplete high-priority todos in plain Python (NO SQL!)
+        # Each listing is written to stdout in one call rather than per line.
         print("\n📋 All todos:")
-        all_todos = [
-            Todo.from_bytes(entity_id, data)
-            for entity_id, data in db.list(todos_collection)
-        ]
+        decoded = {}
+        lines = []
+        urgent = []
+        for todo in decode_todos(db.list(todos_collection), decoded):
+            if VERBOSE:
+                lines.append(f"  {todo}\n")
+            if not todo.completed and todo.priority == 1:
+                urgent.append(todo)
+        sys.stdout.write("".join(lines))
 
-        for todo in all_todos:
-            print(f"  {todo}")
-
-        # Filter incomplete high-priority todos using Python comprehensions (NO SQL!)
         print("\n⚡ High-priority incomplete todos:")
-        urgent = [t for t in all_todos if not t.completed and t.priority == 1]
-
-        for todo in urgent:
-            print(f"  ○ {todo.title}")
+        if VERBOSE:
+            sys.stdout.write("".join(f"  ○ {todo.title}\n" for todo in urgent))
 
         # Demonstrate iterator usage
         print("\n🔄 Using iterator:")
         iterator = db.iter(todos_collection)
         print(f"  Total items: {iterator.count()}")
 
-        for entity_id, data in iterator:
-            todo = Todo.from_bytes(entity_id, data)
-            hex_id = entity_id.to_hex()[:8]
-            print(f"  {todo.title} (id: {hex_id}...)")
+        # EntityId supports the buffer protocol, so the short ID hexlifies
+        # only its first 4 bytes instead of slicing the full hex string
+        if VERBOSE:
+            sys.stdout.write("".join(
+                f"  {todo.title} (id: {memoryview(todo.id)[:4].hex()}...)\n"
+                for todo in decode_todos(iterator, decoded)
+            ))
 
         # Update a todo using context manager
         print("\n✏️  Completing 'Learn EntiDB'...")
+        # Look the todo up by the ID recorded at insert time instead of
+        # scanning for its title
         with db.transaction() as txn:
-            for todo in all_todos:
-                if todo.title == "Learn EntiDB":
-                    txn.put(todos_collection, todo.id, todo.complete().to_bytes())
-                    break
-
-        # Count completed vs incomplete
-        updated_todos = [
-            Todo.from_bytes(entity_id, data)
-            for entity_id, data in db.list(todos_collection)
-        ]
-        completed = [t for t in updated_todos if t.completed]
-        incomplete = [t for t in updated_todos if not t.completed]
+            todo_id = id_by_title["Learn EntiDB"]
+            todo = Todo.from_bytes(todo_id, txn.get(todos_collection, todo_id))
+            txn.put(todos_collection, todo_id, todo.complete().to_bytes())
+
+        # Count completed vs incomplete; only the updated row is decoded again
+        # The completed IDs are kept for the delete at the end. A single
+        # pass only needs iter(), which creates each payload as it is reached.
+        completed_ids = []
+        incomplete = 0
+        for todo in decode_todos(db.iter(todos_collection), decoded):
+            if todo.completed:
+                completed_ids.append(todo.id)
+            else:
+                incomplete += 1
 
         print("\n📊 Summary:")
-        print(f"  Completed: {len(completed)}")
-        print(f"  Incomplete: {len(incomplete)}")
+        print(f"  Completed: {len(completed_ids)}")
+        print(f"  Incomplete: {incomplete}")
         print(f"  Total count: {db.count(todos_collection)}")
 
         # Demonstrate abort on exception
@@ -175,11 +209,11 @@ def main():
         # Verify count unchanged
         print(f"  Count still: {db.count(todos_collection)}")
 
-        # Delete completed todos
+        # Delete the completed todos collected by the summary pass
         print("\n🗑️  Deleting completed todos...")
         with db.transaction() as txn:
-            for todo in completed:
-                txn.delete(todos_collection, todo.id)
+            for todo_id in completed_ids:
+                txn.delete(todos_collection, todo_id)
 
         remaining = db.count(todos_collection)
         print(f"✅ Remaining todos: {remaining}")